@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Linear-time splitting on adversarial and very long input.
+
+Feeds every case class pathological inputs (long uppercase, digit and
+separator runs, alternating humps, non-ASCII and combining marks, acronym
+near-misses) of SIZE characters (1 MB by default) and of SIZE / 8, through
+both the class (``SnakeCase(cls(text))``) and ``convert_many``. The time
+ratio between the two sizes must stay near 8: the script fails if any
+exceeds 8 * TOLERANCE, which quadratic behaviour (a ratio of 64) would. It
+also times the rejection of a SIZE input by ``set_max_length``.
+
+Usage: python benchmarks/bench_adversarial.py [SIZE]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import (  # noqa: E402
+    SnakeCase,
+    add_acronyms,
+    convert_many,
+    remove_acronyms,
+    set_max_length,
+)
+from magic_case.cli import CASES  # noqa: E402
+
+# allowed slack over a linear 8x, for timer noise and cache effects
+TOLERANCE = 2.5
+ACRONYMS = ["HTTPS", "OAuth2", "IPv6", "ABCDEFGHIJKLMNOPQRSTUVWXYZ"]
+
+INPUTS = {
+    "upper run": lambda n: "A" * n,
+    "upper run + a": lambda n: "A" * (n - 1) + "a",
+    "digit run": lambda n: "1" * n,
+    "humps aA": lambda n: "aA" * (n // 2),
+    "humps AAa": lambda n: "AAa" * (n // 3),
+    "A1A1": lambda n: "A1" * (n // 2),
+    "separators": lambda n: "_-. " * (n // 4) + "a",
+    "words a_": lambda n: "a_" * (n // 2) + "a",
+    "slashes": lambda n: "a/" * (n // 2) + "a",
+    "acronym near-miss": lambda n: "HTTP" * (n // 4),
+    "non-ASCII ÉÉé": lambda n: "ÉÉé" * (n // 3),
+    "combining marks": lambda n: "e" + "́" * (n - 1),
+    "hungarian str+A": lambda n: "str" + "A" * (n - 3),
+}
+
+
+def best(func, text: str) -> float:
+    def run() -> None:
+        try:
+            func(text)
+        except ValueError:
+            pass
+
+    return min(timeit.repeat(run, number=1, repeat=3))
+
+
+def main(argv: list[str]) -> int:
+    size = int(argv[0]) if argv else 1_000_000
+    small = size // 8
+    add_acronyms(ACRONYMS)
+    failures = []
+    print(f"{'class':<14} {'worst input':<30} {'ratio':>6} {'ms at full size':>16}")
+    for name, cls in CASES.items():
+        ways = {
+            "class": lambda text, cls=cls: SnakeCase(cls(text)).get(),
+            "convert_many": lambda text, cls=cls: convert_many([text], cls, SnakeCase),
+        }
+        worst = (0.0, "", 0.0)
+        for label, make in INPUTS.items():
+            short, long = make(small), make(size)
+            for way, func in ways.items():
+                elapsed = best(func, long)
+                ratio = elapsed / max(best(func, short), 1e-7)
+                if ratio > 8 * TOLERANCE:
+                    failures.append(f"{name} {way} {label}: {ratio:.1f}x")
+                worst = max(worst, (ratio, f"{label} ({way})", elapsed))
+        ratio, label, elapsed = worst
+        print(f"{name:<14} {label:<30} {ratio:>6.1f} {elapsed * 1e3:>16.1f}")
+    remove_acronyms(ACRONYMS)
+
+    set_max_length(256)
+    text = "A" * size
+    reject = best(SnakeCase, text)
+    set_max_length(None)
+    print(f"\nset_max_length(256) rejects {size} characters in {reject * 1e6:.1f} us")
+
+    if failures:
+        print(f"\nsuperlinear scaling (> {8 * TOLERANCE:.0f}x for 8x input):")
+        print("\n".join(failures))
+        return 1
+    print(f"\nall ratios within {8 * TOLERANCE:.0f}x for 8x input")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Event-loop latency while converting payload keys for concurrent requests.
+
+A heartbeat task sleeps 1 ms at a time and records how late it wakes up,
+while REQUESTS concurrent handlers convert the keys of large payloads (a few
+distinct payload objects shared between requests, like a hot cached
+response). Handlers either call ``convert_keys`` directly, blocking the loop,
+or ``aconvert_keys`` with and without coalescing and executor offload.
+
+Usage: python benchmarks/bench_aio.py [REQUESTS] [RECORDS]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import CamelCase, SnakeCase, aconvert_keys, convert_keys  # noqa: E402
+
+HEARTBEAT_S = 0.001
+PAYLOADS = 4
+
+
+def payload(records: int, seed: int) -> dict:
+    # distinct key names per record so the per-shape key cache cannot hide
+    # the conversion work
+    return {
+        "request_id": seed,
+        "records": [
+            {f"field_{seed}_{i}_{j}_value": j for j in range(8)} for i in range(records)
+        ],
+    }
+
+
+async def blocking(obj: dict) -> dict:
+    return convert_keys(obj, SnakeCase, CamelCase)
+
+
+MODES = {
+    "blocking convert_keys": blocking,
+    "aconvert_keys": lambda obj: aconvert_keys(
+        obj, SnakeCase, CamelCase, coalesce=False
+    ),
+    "aconvert_keys+coalesce": lambda obj: aconvert_keys(obj, SnakeCase, CamelCase),
+    "offload (threads)": lambda obj: aconvert_keys(
+        obj, SnakeCase, CamelCase, offload_threshold=1, coalesce=False
+    ),
+    "offload+coalesce": lambda obj: aconvert_keys(
+        obj, SnakeCase, CamelCase, offload_threshold=1
+    ),
+}
+
+
+async def run(handler, requests: int, records: int) -> tuple[list[float], float]:
+    objs = [payload(records, seed) for seed in range(PAYLOADS)]
+    lateness: list[float] = []
+    done = asyncio.Event()
+
+    async def heartbeat() -> None:
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(HEARTBEAT_S)
+            lateness.append(time.perf_counter() - start - HEARTBEAT_S)
+
+    async def request(i: int) -> None:
+        # requests arrive staggered, a few per millisecond
+        await asyncio.sleep(i * 0.0003)
+        await handler(objs[i % PAYLOADS])
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(*(request(i) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await beat
+    return lateness, elapsed
+
+
+def main(argv: list[str]) -> int:
+    requests = int(argv[0]) if argv else 32
+    records = int(argv[1]) if len(argv) > 1 else 2_000
+    print(f"{requests} requests, {PAYLOADS} distinct payloads of {records:,} records")
+    print(f"{'mode':<24} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'total s':>8}")
+    for name, handler in MODES.items():
+        lateness, elapsed = asyncio.run(run(handler, requests, records))
+        cuts = (
+            statistics.quantiles(lateness, n=100, method="inclusive")
+            if len(lateness) > 1
+            else [0] * 99
+        )
+        print(
+            f"{name:<24} {cuts[49] * 1e3:>8.2f} {cuts[98] * 1e3:>8.2f} "
+            f"{max(lateness, default=0) * 1e3:>8.2f} {elapsed:>8.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
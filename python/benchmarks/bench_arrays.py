@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Throughput of ``convert_array`` against a per-element loop on 1M-row columns.
+
+Needs numpy and/or pyarrow; a library that is not installed is skipped.
+
+Usage: python benchmarks/bench_arrays.py [SIZE]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import (  # noqa: E402
+    CamelCase,
+    KebabCase,
+    MacroCase,
+    SnakeCase,
+    convert_array,
+)
+
+PAIRS = [(SnakeCase, KebabCase), (SnakeCase, MacroCase), (SnakeCase, CamelCase)]
+
+
+def per_element(items: list[str], source: type, target: type) -> list[str]:
+    return [target(source(item)).get() for item in items]
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main(argv: list[str]) -> int:
+    size = int(argv[0]) if argv else 1_000_000
+    items = [f"warehouse_column_{i}_name_value" for i in range(size)]
+
+    arrays = {}
+    try:
+        import numpy as np
+        from numpy.dtypes import StringDType
+
+        arrays["numpy[T]"] = np.array(items, dtype=StringDType())
+        arrays["numpy[U]"] = np.array(items)
+    except ImportError:
+        print("numpy not installed, skipping")
+    try:
+        import pyarrow as pa
+
+        arrays["pyarrow"] = pa.array(items)
+    except ImportError:
+        print("pyarrow not installed, skipping")
+
+    for source, target in PAIRS:
+        pair = f"{source.__name__}->{target.__name__}"
+        loop = timed(per_element, items, source, target)
+        print(f"{pair:<24} {'loop':<10} {size / loop:>14,.0f} rows/s")
+        for name, values in arrays.items():
+            elapsed = timed(convert_array, values, source, target)
+            print(
+                f"{pair:<24} {name:<10} {size / elapsed:>14,.0f} rows/s  "
+                f"({loop / elapsed:.1f}x loop)"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Measure the latency win of the opt-in split/render cache on repeated keys."""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import (  # noqa: E402
+    CamelCase,
+    SnakeCase,
+    cache_info,
+    disable_cache,
+    enable_cache,
+)
+
+DISTINCT_KEYS = 2_000
+CALLS = 500_000
+
+
+def workload() -> list[str]:
+    keys = [f"field_name_{i}_value" for i in range(DISTINCT_KEYS)]
+    rng = random.Random(0)
+    return [rng.choice(keys) for _ in range(CALLS)]
+
+
+def run(items: list[str]) -> float:
+    start = time.perf_counter()
+    for item in items:
+        CamelCase(SnakeCase(item)).get()
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    items = workload()
+    disable_cache()
+    uncached = run(items)
+    enable_cache(maxsize=4096)
+    cached = run(items)
+    info = cache_info()
+    disable_cache()
+
+    print(f"uncached {uncached / CALLS * 1e9:8.1f} ns/call")
+    print(f"cached   {cached / CALLS * 1e9:8.1f} ns/call  ({uncached / cached:.2f}x)")
+    print(
+        f"hits={info.hits} misses={info.misses} evictions={info.evictions} "
+        f"size={info.currsize}/{info.maxsize}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Per-call cost of ``compile(source, target)`` vs. ``Target(Source(s)).get()``.
+
+Usage: python benchmarks/bench_compile.py [NUMBER]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import (  # noqa: E402
+    CamelCase,
+    HttpHeaderCase,
+    KebabCase,
+    PascalCase,
+    SnakeCase,
+    compile,
+)
+
+CASES = [
+    (SnakeCase, HttpHeaderCase, "content_type_value"),
+    (SnakeCase, KebabCase, "customer_billing_address"),
+    (CamelCase, SnakeCase, "parseHTTPResponseBody"),
+    (PascalCase, CamelCase, "CustomerBillingAddress"),
+]
+
+
+def main(argv: list[str]) -> int:
+    number = int(argv[0]) if argv else 200_000
+    print(f"{'pair':<28} {'objects ns':>11} {'compiled ns':>12} {'speedup':>8}")
+    for source, target, text in CASES:
+        convert = compile(source, target, use_cache=False)
+        objects = min(
+            timeit.repeat(
+                lambda source=source, target=target, text=text: target(
+                    source(text)
+                ).get(),
+                number=number,
+                repeat=3,
+            )
+        )
+        compiled = min(
+            timeit.repeat(
+                lambda convert=convert, text=text: convert(text),
+                number=number,
+                repeat=3,
+            )
+        )
+        pair = f"{source.__name__}->{target.__name__}"
+        print(
+            f"{pair:<28} {objects / number * 1e9:>11.0f} "
+            f"{compiled / number * 1e9:>12.0f} {objects / compiled:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
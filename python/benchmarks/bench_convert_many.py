@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Compare ``convert_many`` against building one case object per string.
+
+Usage: python benchmarks/bench_convert_many.py [SIZE ...]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import CamelCase, SnakeCase, convert_many  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 100_000, 10_000_000]
+
+
+def make_items(size: int) -> list[str]:
+    return [f"column_name_{i}_value" for i in range(size)]
+
+
+def per_object(items: list[str]) -> list[str]:
+    return [CamelCase(SnakeCase(item)).get() for item in items]
+
+
+def bulk(items: list[str]) -> list[str]:
+    return convert_many(items, SnakeCase, CamelCase)
+
+
+def timed(func, items: list[str]) -> float:
+    start = time.perf_counter()
+    func(items)
+    return time.perf_counter() - start
+
+
+def main(argv: list[str]) -> int:
+    sizes = [int(arg) for arg in argv] or DEFAULT_SIZES
+    print(f"{'size':>12} {'per-object s':>14} {'convert_many s':>16} {'speedup':>8}")
+    for size in sizes:
+        items = make_items(size)
+        assert per_object(items[:100]) == bulk(items[:100])
+        slow = timed(per_object, items)
+        fast = timed(bulk, items)
+        print(f"{size:>12,} {slow:>14.3f} {fast:>16.3f} {slow / fast:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
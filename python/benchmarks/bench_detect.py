@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Compare ``detect_case`` against trying each case class until one accepts."""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import (  # noqa: E402
+    AnyCase,
+    CamelCase,
+    DotCase,
+    HttpHeaderCase,
+    KebabCase,
+    MacroCase,
+    PascalCase,
+    PathCase,
+    SnakeCase,
+    detect_case,
+)
+
+SAMPLES = [
+    "user_id",
+    "userId",
+    "UserId",
+    "Content-Type",
+    "max-retries",
+    "MAX_RETRIES",
+    "app.config.value",
+    "api/v1/users",
+]
+ROUNDS = 20_000
+
+# Strict classes first, permissive fallbacks last: the usual hand-rolled order
+TRY_ORDER = [
+    HttpHeaderCase,
+    PathCase,
+    CamelCase,
+    PascalCase,
+]
+
+
+def try_each(text: str):
+    for cls in TRY_ORDER:
+        try:
+            return cls(text)
+        except ValueError:
+            continue
+    if "-" in text:
+        return KebabCase(text)
+    if "." in text:
+        return DotCase(text)
+    if text.isupper():
+        return MacroCase(text)
+    return SnakeCase(text)
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for text in SAMPLES:
+            func(text)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    calls = ROUNDS * len(SAMPLES)
+    for name, func in [
+        ("try each class", try_each),
+        ("detect_case", detect_case),
+        ("AnyCase", AnyCase),
+    ]:
+        elapsed = timed(func)
+        print(f"{name:<16} {elapsed / calls * 1e9:8.1f} ns/identifier")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Reverse lookups through ``CaseIndex`` vs. re-parsing the rendered form.
+
+Indexes NAMES generated snake_case names (plus some colliding ones) into camel, flat and title case,
+then times ``lookup`` against ``SnakeCase(CamelCase(text)).get()`` (which
+only works for camelCase: flat and title renderings cannot be parsed back)
+and reports build time, memory and FlatCase collisions.
+
+Usage: python benchmarks/bench_index.py [NAMES]
+"""
+
+import sys
+import time
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import CamelCase, CaseIndex, FlatCase, SnakeCase, TitleCase  # noqa: E402
+
+WORDS = ["user", "id", "account", "name", "created", "at", "billing", "address"]
+
+
+def main(argv: list[str]) -> int:
+    count = int(argv[0]) if argv else 100_000
+    names = [f"{WORDS[i % 8]}_{WORDS[i // 8 % 8]}{i // 64}" for i in range(count)]
+    # every 10th name also exists without its underscore, colliding in FlatCase
+    names += [name.replace("_", "") for name in names[::10]]
+
+    targets = [CamelCase, FlatCase, TitleCase]
+    start = time.perf_counter()
+    index = CaseIndex(targets, names)
+    build = time.perf_counter() - start
+    tracemalloc.start()
+    CaseIndex(targets, names)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    collisions = index.collisions(FlatCase)
+    print(
+        f"{len(index)} names: built in {build * 1e3:.0f} ms, "
+        f"{peak / 1e6:.1f} MB, {len(collisions)} FlatCase collisions"
+    )
+
+    camel = [index.render(name, CamelCase) for name in names[1::10][:10_000]]
+    title = [index.render(name, TitleCase) for name in names[1::10][:10_000]]
+    timings = {
+        "index camel": lambda: [index.lookup(text, CamelCase) for text in camel],
+        "index title": lambda: [index.lookup(text, TitleCase) for text in title],
+        "re-parse camel": lambda: [SnakeCase(CamelCase(text)).get() for text in camel],
+    }
+    for label, run in timings.items():
+        elapsed = min(timeit.repeat(run, number=1, repeat=5))
+        print(f"{label:<16} {elapsed / len(camel) * 1e9:>8.0f} ns/lookup")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
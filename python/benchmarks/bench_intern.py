@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Memory of record-heavy conversion with and without the interning pool.
+
+Builds RECORDS dicts (5 million by default) whose five keys, drawn from 300
+snake_case names, are converted to camelCase with ``convert_many`` one record
+at a time, as a loader reading rows would. Each mode runs in a fresh process
+and reports build time, how many distinct key objects the records hold,
+their size, the growth of the resident set size and the time of looking
+every key up again with a separately converted (equal) key.
+
+Usage: python benchmarks/bench_intern.py [RECORDS]
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import (  # noqa: E402
+    CamelCase,
+    SnakeCase,
+    convert_many,
+    enable_interning,
+    intern_info,
+)
+
+WORDS = ["user", "account", "billing", "created", "updated", "order", "item"]
+NAMES = [f"{a}_{b}_{i}" for i in range(7) for a in WORDS for b in WORDS][:300]
+
+
+def rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+    except OSError:
+        return float("nan")
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1e6
+
+
+def run(count: int, interning: bool) -> str:
+    if interning:
+        enable_interning()
+    before = rss_mb()
+    start = time.perf_counter()
+    rows = [
+        [NAMES[(i * 7 + j * 61) % len(NAMES)] for j in range(5)] for i in range(3000)
+    ]
+    records = []
+    for i in range(count):
+        keys = convert_many(rows[i % len(rows)], SnakeCase, CamelCase)
+        records.append(dict(zip(keys, range(5))))
+    build = time.perf_counter() - start
+    grown = rss_mb() - before
+
+    distinct = {id(key): sys.getsizeof(key) for record in records for key in record}
+    lookups = [
+        (record, convert_many(rows[i % len(rows)], SnakeCase, CamelCase))
+        for i, record in enumerate(records[:200_000])
+    ]
+    start = time.perf_counter()
+    for record, keys in lookups:
+        for key in keys:
+            record[key]
+    lookup = (time.perf_counter() - start) / (len(lookups) * 5) * 1e9
+
+    label = f"interned {intern_info().currsize}" if interning else "plain"
+    return (
+        f"{label:<13} {build:7.1f} s  {len(distinct):>9} key objects  "
+        f"{sum(distinct.values()) / 1e6:8.1f} MB keys  RSS +{grown:7.0f} MB  "
+        f"lookup {lookup:4.0f} ns"
+    )
+
+
+def main(argv: list[str]) -> int:
+    count = int(argv[0]) if argv else 5_000_000
+    print(f"{count} records, {len(NAMES)} distinct keys")
+    context = multiprocessing.get_context("spawn")
+    for interning in (False, True):
+        # a fresh process per mode, so the RSS of one does not hide the other
+        with ProcessPoolExecutor(1, mp_context=context) as pool:
+            print(pool.submit(run, count, interning).result())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
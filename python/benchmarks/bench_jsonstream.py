@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Throughput and memory of streaming JSON key conversion.
+
+Generates a JSON Lines file and a single JSON document of SIZE megabytes
+each (1024 by default) in a temporary directory, renames their keys from
+snake_case to camelCase with ``convert_json_stream`` and reports MB/s and
+the peak resident set size of the process, which must stay flat as SIZE
+grows. For comparison, ``json.loads`` + ``convert_keys`` + ``json.dumps``
+per line is timed on the first 10 MB of the JSON Lines file.
+
+Usage: python benchmarks/bench_jsonstream.py [SIZE_MB]
+"""
+
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from itertools import islice
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import CamelCase, SnakeCase, convert_keys  # noqa: E402
+from magic_case.jsonstream import convert_json_stream  # noqa: E402
+
+
+def event(i: int) -> dict:
+    return {
+        "event_id": f"e-{i:08d}",
+        "user_id": i % 9973,
+        "created_at": "2024-05-01T12:00:00.000Z",
+        "event_type": ["page_view", "click", "purchase"][i % 3],
+        "payload": {
+            "page_url": f"https://example.com/products/{i % 500}?ref=home",
+            "referrer_url": None,
+            "screen_size": [1920, 1080],
+            "is_mobile": i % 2 == 0,
+            "note_text": 'quoted "value": {not_a_key: 1}',
+        },
+        "tag_list": ["alpha", "beta"],
+    }
+
+
+def generate(path: Path, size: int, document: bool) -> None:
+    with open(path, "wb") as out:
+        written = 0
+        i = 0
+        if document:
+            out.write(b'{"export_name": "events", "event_list": [\n')
+        while written < size:
+            line = json.dumps(event(i)).encode()
+            if document and i:
+                out.write(b",\n")
+            out.write(line)
+            if not document:
+                out.write(b"\n")
+            written += len(line) + 1
+            i += 1
+        if document:
+            out.write(b"\n]}\n")
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+def main(argv: list[str]) -> int:
+    size = int(argv[0]) if argv else 1024
+    with tempfile.TemporaryDirectory() as tmp:
+        # the json module comparison loads lines into memory, so it runs last
+        for name, document in [("export.json", True), ("events.jsonl", False)]:
+            src = Path(tmp) / name
+            generate(src, size << 20, document)
+            megabytes = os.path.getsize(src) / 1e6
+            start = time.perf_counter()
+            with open(src, "rb") as fin, open(os.devnull, "wb") as fout:
+                keys = convert_json_stream(fin, fout, SnakeCase, CamelCase)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{name:<13} {megabytes:8.0f} MB  {megabytes / elapsed:6.1f} MB/s  "
+                f"{keys} keys  peak RSS {peak_rss_mb():.0f} MB"
+            )
+            if not document:
+                with open(src, "rb") as fin:
+                    lines = list(islice(fin, 10_000_000 // len(fin.readline())))
+                sample = sum(map(len, lines)) / 1e6
+                start = time.perf_counter()
+                for line in lines:
+                    json.dumps(convert_keys(json.loads(line), SnakeCase, CamelCase))
+                elapsed = time.perf_counter() - start
+                print(
+                    f"{'  json module':<13} {sample:8.0f} MB  {sample / elapsed:6.1f} MB/s"
+                )
+            src.unlink()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
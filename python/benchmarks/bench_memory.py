@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Bytes per case instance: slotted classes vs. the previous ``__dict__`` layout."""
+
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import CamelCase, HungarianCase, SnakeCase  # noqa: E402
+
+COUNT = 200_000
+
+
+class DictLayout:
+    """Stand-in for the old layout: a per-instance ``__dict__`` and a word list."""
+
+    def __init__(self, words: list[str]):
+        self.words = words
+
+
+class DictLayoutHungarian(DictLayout):
+    def __init__(self, words: list[str], prefix: str):
+        super().__init__(words)
+        self.prefix = prefix
+
+
+def measure(factory) -> float:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objs = [factory(i) for i in range(COUNT)]
+    for obj in objs:
+        str(obj)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return (size - sys.getsizeof(objs)) / COUNT
+
+
+def main() -> int:
+    texts = [f"field_name_{i}" for i in range(COUNT)]
+    hungarian = [f"strFieldName{i}" for i in range(COUNT)]
+    snakes = [SnakeCase(text) for text in texts]
+    # the old layout shared the source's word list when built from another case
+    word_lists = [text.split("_") for text in texts]
+
+    rows = [
+        ("SnakeCase(str)", lambda i: DictLayout(texts[i].split("_")), None),
+        ("SnakeCase(str)", None, lambda i: SnakeCase(texts[i])),
+        ("CamelCase(obj)", lambda i: DictLayout(word_lists[i]), None),
+        ("CamelCase(obj)", None, lambda i: CamelCase(snakes[i])),
+        (
+            "HungarianCase(str)",
+            lambda i: DictLayoutHungarian(hungarian[i][3:].split("N"), "str"),
+            None,
+        ),
+        ("HungarianCase(str)", None, lambda i: HungarianCase(hungarian[i])),
+    ]
+    print(f"{'case':<20} {'layout':<8} {'bytes/instance':>15}")
+    for name, old, new in rows:
+        layout, factory = ("dict", old) if old else ("slots", new)
+        print(f"{name:<20} {layout:<8} {measure(factory):>15.1f}")
+    print(
+        "\nslots rows include the cached rendered string; "
+        "dict rows hold no rendered output"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
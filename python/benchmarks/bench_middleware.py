@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Latency added per request by ``WSGIMiddleware`` and ``ASGIMiddleware``.
+
+Drives a local stand-in application (it echoes the request body back as its
+response) in process, REQUESTS times per scenario, bare and wrapped, and
+reports p50/p99 latency and the p50 added by the middleware. Scenarios cover
+small and large JSON bodies, a non-JSON body (skipped from its content type)
+and a JSON body over ``max_body_size`` (passed through). ASGI requests run
+CONCURRENCY at a time on one event loop, so their latency includes waiting
+for the other requests in flight.
+
+Usage: python benchmarks/bench_middleware.py [REQUESTS] [CONCURRENCY]
+"""
+
+import asyncio
+import io
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import ASGIMiddleware, WSGIMiddleware  # noqa: E402
+
+
+def payload(records: int) -> bytes:
+    return json.dumps(
+        {
+            "pageInfo": {"nextCursor": "abc", "totalCount": records},
+            "userRecords": [
+                {"userId": i, "displayName": f"user {i}", "isActive": True}
+                for i in range(records)
+            ],
+        }
+    ).encode()
+
+
+SCENARIOS = {
+    "json 1 KB": ("application/json", payload(12)),
+    "json 56 KB": ("application/json", payload(900)),
+    "text 56 KB": ("text/plain", payload(900)),
+    "json over max": ("application/json", payload(3000)),
+}
+MAX_BODY_SIZE = 128 << 10
+
+
+def wsgi_app(environ, start_response):
+    body = environ["wsgi.input"].read(int(environ["CONTENT_LENGTH"]))
+    start_response(
+        "200 OK",
+        [("Content-Type", environ["CONTENT_TYPE"]), ("Content-Length", str(len(body)))],
+    )
+    return [body]
+
+
+async def asgi_app(scope, receive, send):
+    body = b""
+    more = True
+    while more:
+        message = await receive()
+        body += message.get("body", b"")
+        more = message.get("more_body", False)
+    headers = [
+        (b"content-type", dict(scope["headers"])[b"content-type"]),
+        (b"content-length", str(len(body)).encode()),
+    ]
+    await send({"type": "http.response.start", "status": 200, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+def wsgi_latencies(app, content_type: str, body: bytes, requests: int) -> list[float]:
+    latencies = []
+    for _ in range(requests):
+        environ = {
+            "REQUEST_METHOD": "POST",
+            "CONTENT_TYPE": content_type,
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.input": io.BytesIO(body),
+        }
+        start = time.perf_counter()
+        b"".join(app(environ, lambda status, headers, exc_info=None: None))
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def asgi_latencies(
+    app, content_type: str, body: bytes, requests: int, concurrency: int
+) -> list[float]:
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "headers": [
+            (b"content-type", content_type.encode()),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    }
+    latencies = []
+
+    async def one() -> None:
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+
+        async def receive():
+            return messages.pop() if messages else {"type": "http.disconnect"}
+
+        async def send(message):
+            await asyncio.sleep(0)  # a server would yield while writing
+
+        start = time.perf_counter()
+        await app(scope, receive, send)
+        latencies.append(time.perf_counter() - start)
+
+    for _ in range(0, requests, concurrency):
+        await asyncio.gather(*(one() for _ in range(concurrency)))
+    return latencies
+
+
+def percentiles(latencies: list[float]) -> tuple[float, float]:
+    ordered = sorted(latencies)
+    return ordered[len(ordered) // 2] * 1e6, ordered[len(ordered) * 99 // 100] * 1e6
+
+
+def report(label: str, bare: list[float], wrapped: list[float]) -> None:
+    bare_p50, bare_p99 = percentiles(bare)
+    p50, p99 = percentiles(wrapped)
+    print(
+        f"{label:<20} {bare_p50:>9.0f} {bare_p99:>9.0f} {p50:>9.0f} {p99:>9.0f} "
+        f"{p50 - bare_p50:>+9.0f}"
+    )
+
+
+def main(argv: list[str]) -> int:
+    requests = int(argv[0]) if len(argv) > 0 else 2_000
+    concurrency = int(argv[1]) if len(argv) > 1 else 50
+    wsgi = WSGIMiddleware(wsgi_app, max_body_size=MAX_BODY_SIZE)
+    asgi = ASGIMiddleware(asgi_app, max_body_size=MAX_BODY_SIZE)
+
+    print(f"{requests} requests per row; latencies in microseconds")
+    print(
+        f"{'':<20} {'bare p50':>9} {'bare p99':>9} {'p50':>9} {'p99':>9} {'added':>9}"
+    )
+    for name, (content_type, body) in SCENARIOS.items():
+        label = f"WSGI {name}"
+        wsgi_latencies(wsgi, content_type, body, 50)  # warm the key cache
+        report(
+            label,
+            wsgi_latencies(wsgi_app, content_type, body, requests),
+            wsgi_latencies(wsgi, content_type, body, requests),
+        )
+    for name, (content_type, body) in SCENARIOS.items():
+        label = f"ASGI {name}"
+
+        def run(app, content_type=content_type, body=body):
+            return asyncio.run(
+                asgi_latencies(app, content_type, body, requests, concurrency)
+            )
+
+        run(asgi)
+        report(label, run(asgi_app), run(asgi))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
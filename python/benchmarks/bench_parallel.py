@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Throughput of ``convert_parallel`` at 1, 2, 4 and 8 worker processes.
+
+Usage: python benchmarks/bench_parallel.py [SIZE]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import (  # noqa: E402
+    CamelCase,
+    HttpHeaderCase,
+    convert_many,
+    convert_parallel,
+)
+
+WORKERS = [1, 2, 4, 8]
+
+
+def main(argv: list[str]) -> int:
+    size = int(argv[0]) if argv else 2_000_000
+    items = [f"warehouseColumn{i}NameValue" for i in range(size)]
+
+    start = time.perf_counter()
+    convert_many(items, CamelCase, HttpHeaderCase)
+    serial = time.perf_counter() - start
+    print(f"{'serial':>8} {size / serial:>14,.0f} ids/s")
+
+    for workers in WORKERS:
+        start = time.perf_counter()
+        convert_parallel(
+            items, CamelCase, HttpHeaderCase, workers=workers, chunksize=50_000
+        )
+        elapsed = time.perf_counter() - start
+        print(
+            f"{workers:>8} {size / elapsed:>14,.0f} ids/s  "
+            f"({serial / elapsed:.2f}x serial)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
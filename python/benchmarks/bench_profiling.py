@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Overhead of the profiling hooks.
+
+Times ``convert_many`` and class-based conversion before profiling was ever
+enabled, while it is enabled and after it was disabled again (which must
+match the first column), then prints the recorded snapshot.
+
+Usage: python benchmarks/bench_profiling.py [NAMES]
+"""
+
+import logging
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import (  # noqa: E402
+    CamelCase,
+    SnakeCase,
+    convert_many,
+    disable_profiling,
+    enable_profiling,
+)
+from magic_case.profiling import LoggingSink  # noqa: E402
+
+
+def run(names: list[str]) -> dict[str, float]:
+    jobs = {
+        "convert_many": lambda: convert_many(names, CamelCase, SnakeCase),
+        "classes": lambda: [SnakeCase(CamelCase(name)).get() for name in names],
+    }
+    return {
+        label: min(timeit.repeat(job, number=1, repeat=5)) / len(names) * 1e9
+        for label, job in jobs.items()
+    }
+
+
+def main(argv: list[str]) -> int:
+    count = int(argv[0]) if argv else 20_000
+    names = [f"userAccount{i}NameValue" for i in range(count)]
+
+    before = run(names)
+    enable_profiling()
+    enabled = run(names)
+    snapshot = disable_profiling()
+    after = run(names)
+
+    print(f"{'ns/name':<14} {'before':>8} {'enabled':>8} {'disabled':>9}")
+    for label in before:
+        print(
+            f"{label:<14} {before[label]:>8.0f} {enabled[label]:>8.0f} "
+            f"{after[label]:>9.0f}"
+        )
+    print()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    LoggingSink()(snapshot)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
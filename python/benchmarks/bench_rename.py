@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Throughput of ``rename_tree`` on a generated source tree.
+
+Writes FILES generated Python and TypeScript modules (snake_case fields, a
+fifth of them with nothing to rename) to a temporary directory, then renames
+them to camelCase with one worker and with a process pool, restoring the
+tree between runs. Prints the run report of each.
+
+Usage: python benchmarks/bench_rename.py [FILES]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import CamelCase, SnakeCase, rename_tree  # noqa: E402
+
+FIELDS = [f"field_{i}_value" for i in range(200)]
+
+
+def python_module(n: int) -> str:
+    fields = FIELDS[n % 50 : n % 50 + 40]
+    lines = [f"class Model{n}:", '    """Generated model: user_name stays."""']
+    lines += [f"    {name}: int = 0  # {name}" for name in fields]
+    lines += ["", "    def to_dict(self):", "        return {"]
+    lines += [f'            "{name}": self.{name},' for name in fields]
+    lines += ["        }", ""]
+    return "\n".join(lines)
+
+
+def typescript_module(n: int) -> str:
+    fields = FIELDS[n % 50 : n % 50 + 40]
+    lines = [f"export interface Model{n} {{"]
+    lines += [f"  {name}: number; // {name}" for name in fields]
+    lines += ["}", ""]
+    return "\n".join(lines)
+
+
+def build(root: Path, files: int) -> None:
+    for n in range(files):
+        directory = root / f"pkg{n // 100}"
+        directory.mkdir(exist_ok=True)
+        if n % 5 == 4:
+            (directory / f"plain{n}.ts").write_text("export const total = 1;\n" * 40)
+        elif n % 2:
+            (directory / f"model{n}.ts").write_text(typescript_module(n))
+        else:
+            (directory / f"model{n}.py").write_text(python_module(n))
+
+
+def main(argv: list[str]) -> int:
+    files = int(argv[0]) if argv else 2_000
+    with tempfile.TemporaryDirectory() as tmp:
+        pristine = Path(tmp) / "pristine"
+        pristine.mkdir()
+        build(pristine, files)
+        for workers in sorted({1, os.cpu_count() or 1, 4}):
+            tree = Path(tmp) / f"tree{workers}"
+            shutil.copytree(pristine, tree)
+            report = rename_tree(str(tree), SnakeCase, CamelCase, workers=workers)
+            print(f"--- workers={workers}")
+            print(report.format(slowest=3))
+            shutil.rmtree(tree)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
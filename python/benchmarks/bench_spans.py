@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Allocations of span-based conversion vs. word lists, measured with tracemalloc.
+
+Two measurements per pair, converting three ways: building case objects
+(``target(source(text)).get()``), the split/join pipeline (``convert_many``)
+and the span tokenizer (``convert_spans``):
+
+* peak memory while converting one very long identifier, where word lists
+  hold every word at once and spans hold one offset array;
+* a batch of ~80 character identifiers: bytes kept per item (the outputs),
+  peak transient memory above that, and wall time without tracing.
+
+Usage: python benchmarks/bench_spans.py [SIZE] [LONG_WORDS]
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import (  # noqa: E402
+    CamelCase,
+    HttpHeaderCase,
+    KebabCase,
+    SnakeCase,
+    TitleCase,
+    convert_many,
+    convert_spans,
+)
+
+PAIRS = [(SnakeCase, CamelCase), (CamelCase, HttpHeaderCase), (KebabCase, TitleCase)]
+WORDS = "customer billing address postal code verification status last updated"
+
+
+def per_object(items: list[str], source: type, target: type) -> list[str]:
+    return [target(source(item)).get() for item in items]
+
+
+METHODS = [
+    ("case objects", per_object),
+    ("convert_many", convert_many),
+    ("convert_spans", convert_spans),
+]
+
+
+def traced(func, items: list[str], source: type, target: type) -> tuple[int, int]:
+    """(bytes still allocated, peak bytes above that) for one call."""
+    tracemalloc.start()
+    result = func(items, source, target)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current, peak - current
+
+
+def main(argv: list[str]) -> int:
+    size = int(argv[0]) if argv else 100_000
+    long_words = int(argv[1]) if len(argv) > 1 else 100_000
+    words = WORDS.split()
+
+    print(f"one identifier of {long_words:,} words")
+    print(f"{'pair':<28} {'method':<13} {'peak extra KiB':>15}")
+    for source, target in PAIRS:
+        pair = f"{source.__name__}->{target.__name__}"
+        text = source._joiner()([words[i % len(words)] for i in range(long_words)])
+        for name, func in METHODS:
+            _, peak = traced(func, [text], source, target)
+            print(f"{pair:<28} {name:<13} {peak / 1024:>15.1f}")
+
+    print(f"\nbatch of {size:,} identifiers")
+    print(
+        f"{'pair':<28} {'method':<13} {'kept B/item':>12} "
+        f"{'peak extra KiB':>15} {'seconds':>8}"
+    )
+    for source, target in PAIRS:
+        # ~80 characters, 10 words each
+        items = [source._joiner()([*words, f"n{i}"]) for i in range(size)]
+        pair = f"{source.__name__}->{target.__name__}"
+        for name, func in METHODS:
+            kept, peak = traced(func, items, source, target)
+            start = time.perf_counter()
+            func(items, source, target)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{pair:<28} {name:<13} {kept / size:>12.1f} "
+                f"{peak / 1024:>15.1f} {elapsed:>8.3f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
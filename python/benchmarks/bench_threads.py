@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Scaling of ``convert_threaded`` with and without the GIL.
+
+Runs the same measurement (``convert_threaded`` at 1, 2, 4 and 8 threads
+against serial ``convert_many``) under every interpreter it finds: the one
+running this script and any free-threaded ``python3.13t``/``python3.14t`` on
+PATH, the latter both as is and with ``PYTHON_GIL=1``. With the GIL, extra
+threads only add overhead; free-threaded builds should scale with cores.
+
+Usage: python benchmarks/bench_threads.py [SIZE]
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import sysconfig
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import (  # noqa: E402
+    CamelCase,
+    HttpHeaderCase,
+    convert_many,
+    convert_threaded,
+)
+from magic_case.parallel import _gil_enabled  # noqa: E402
+
+WORKERS = [1, 2, 4, 8]
+FREE_THREADED = ["python3.13t", "python3.14t"]
+
+
+def measure(size: int) -> None:
+    items = [f"warehouseColumn{i}NameValue" for i in range(size)]
+    gil = "on" if _gil_enabled() else "off"
+    print(f"Python {sys.version.split()[0]}, GIL {gil}, {os.cpu_count()} CPUs")
+
+    start = time.perf_counter()
+    convert_many(items, CamelCase, HttpHeaderCase)
+    serial = time.perf_counter() - start
+    print(f"{'serial':>8} {size / serial:>14,.0f} ids/s")
+
+    for workers in WORKERS:
+        start = time.perf_counter()
+        convert_threaded(
+            items, CamelCase, HttpHeaderCase, workers=workers, chunksize=10_000
+        )
+        elapsed = time.perf_counter() - start
+        print(
+            f"{workers:>8} {size / elapsed:>14,.0f} ids/s  "
+            f"({serial / elapsed:.2f}x serial)"
+        )
+
+
+def free_threaded(executable: str) -> bool:
+    check = "import sysconfig; print(sysconfig.get_config_var('Py_GIL_DISABLED') or 0)"
+    result = subprocess.run(
+        [executable, "-c", check], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip() == "1"
+
+
+def main(argv: list[str]) -> int:
+    if argv[:1] == ["--child"]:
+        measure(int(argv[1]))
+        return 0
+    size = argv[0] if argv else "1000000"
+
+    runs: list[tuple[str, dict[str, str]]] = []
+    executables = [sys.executable]
+    executables += filter(None, map(shutil.which, FREE_THREADED))
+    for executable in dict.fromkeys(executables):
+        if executable == sys.executable:
+            ft = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+        else:
+            ft = free_threaded(executable)
+        runs.append((executable, {}))
+        if ft:
+            runs.append((executable, {"PYTHON_GIL": "1"}))
+    if len(runs) == 1:
+        print("(no free-threaded interpreter found; GIL build only)\n")
+
+    for executable, env in runs:
+        print(f"# {executable}" + (" (PYTHON_GIL=1)" if env else ""))
+        subprocess.run(
+            [executable, __file__, "--child", size],
+            env={**os.environ, **env},
+            check=True,
+        )
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Compare precompiled tokenizer patterns against raw-pattern ``re`` calls."""
+
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import tokenizer  # noqa: E402
+
+HUMP_PATTERN = r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])"
+SEPARATOR_PATTERN = r"[_\-\.,\/\\\s]+"
+CAMEL_SNAKE_PATTERN = r"[A-Z]?[a-z0-9]+|[A-Z]+(?![a-z])"
+
+CASES = [
+    (
+        "humps",
+        "myHTTPServerRequestHandler",
+        lambda s: re.split(HUMP_PATTERN, s),
+        tokenizer.split_humps,
+    ),
+    (
+        "separators",
+        "hello_world-again.and/again",
+        lambda s: [w.lower() for w in re.split(SEPARATOR_PATTERN, s) if w.strip()],
+        tokenizer.split_separators,
+    ),
+    (
+        "camel_snake",
+        "hello_World_Again_HTTP",
+        lambda s: [
+            w.lower() for w in re.findall(CAMEL_SNAKE_PATTERN, s.replace("_", " ")) if w
+        ],
+        tokenizer.split_camel_snake,
+    ),
+]
+
+
+def main(number: int = 200_000) -> int:
+    """Time each splitter and print the per-call savings."""
+    for name, text, raw, compiled in CASES:
+        assert raw(text) == compiled(text)
+        raw_s = timeit.timeit(lambda: raw(text), number=number)  # noqa: B023
+        compiled_s = timeit.timeit(lambda: compiled(text), number=number)  # noqa: B023
+        saved_ns = (raw_s - compiled_s) / number * 1e9
+        print(
+            f"{name:<12} raw {raw_s / number * 1e9:8.1f} ns  "
+            f"compiled {compiled_s / number * 1e9:8.1f} ns  "
+            f"saved {saved_ns:6.1f} ns/call"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
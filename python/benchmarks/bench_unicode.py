@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Cost of the ASCII fast path vs. the Unicode (shape) path of the tokenizer.
+
+For each splitter, times ASCII input on the fast path, the same input forced
+through the shape path, and a non-ASCII identifier of the same length. Then
+shows what the pre-Unicode patterns made of a few non-ASCII identifiers.
+
+Usage: python benchmarks/bench_unicode.py [NUMBER]
+"""
+
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import tokenizer  # noqa: E402
+
+# forces the shape path on ASCII text; shapes of ASCII text are the text itself
+FORCE = "é"
+
+CASES = [
+    ("humps", tokenizer.split_humps, "parseHTTPResponseBody", "parseHTTPAntwortGröße"),
+    (
+        "camel_snake",
+        tokenizer.split_camel_snake,
+        "parse_HTTP_ResponseBody",
+        "parse_HTTP_AntwortGröße",
+    ),
+    (
+        "lower_upper",
+        tokenizer.split_lower_upper,
+        "userAccountNameValue",
+        "nutzerKontoNameGröße",
+    ),
+]
+
+# before this change, every non-ASCII letter counted as a separator or was lost
+OLD_HUMPS = re.compile(r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+OLD_LOWER_UPPER = re.compile(r"([a-z0-9])([A-Z])")
+SAMPLES = ["straßeÄnderung", "привітСвіт", "ΑΒΓΔέλτα"]
+
+
+def main(argv: list[str]) -> int:
+    number = int(argv[0]) if argv else 200_000
+    print(f"{'splitter':<12} {'ascii ns':>9} {'forced ns':>10} {'unicode ns':>11}")
+    for name, split, ascii_text, unicode_text in CASES:
+        timings = [
+            min(
+                timeit.repeat(
+                    lambda split=split, text=text: split(text), number=number, repeat=3
+                )
+            )
+            / number
+            * 1e9
+            for text in (ascii_text, ascii_text + FORCE, unicode_text)
+        ]
+        print(f"{name:<12} {timings[0]:>9.0f} {timings[1]:>10.0f} {timings[2]:>11.0f}")
+
+    print(f"\n{'input':<16} {'old humps':<28} {'new humps':<28}")
+    for text in SAMPLES:
+        old = OLD_HUMPS.split(text)
+        print(f"{text:<16} {old!s:<28} {tokenizer.split_humps(text)!s:<28}")
+    text = "strGrößeÄnderung"
+    old = OLD_LOWER_UPPER.sub(r"\1 \2", text[3:]).lower().split()
+    print(f"{text:<16} {old!s:<28} {tokenizer.split_lower_upper(text[3:])!s:<28}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
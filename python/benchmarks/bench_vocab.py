@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Cost of acronym and prefix vocabularies with 10k+ entries.
+
+Reports, per vocabulary size: the time to build it, CamelCase → SnakeCase
+conversion time for generated API names (some containing acronyms), and
+Hungarian prefix detection through the trie vs. the previous approach of
+sorting the prefix list by length on every lookup.
+
+Usage: python benchmarks/bench_vocab.py [NAMES]
+"""
+
+import sys
+import time
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from magic_case import (  # noqa: E402
+    CamelCase,
+    SnakeCase,
+    add_acronyms,
+    add_prefixes,
+    compile,
+    remove_acronyms,
+    remove_prefixes,
+)
+from magic_case.hungarian import _detect_prefix  # noqa: E402
+from magic_case.vocab import DEFAULT_PREFIXES  # noqa: E402
+
+SIZES = [0, 100, 10_000, 100_000]
+DOMAIN = ["OAuth", "IPv6", "gRPC", "iOS"]
+
+
+def sorted_prefix(prefixes: list[str], text: str) -> str | None:
+    """The pre-trie lookup: sort by length on every call."""
+    for prefix in sorted(prefixes, key=len, reverse=True):
+        if text.startswith(prefix):
+            return prefix
+    return None
+
+
+def main(argv: list[str]) -> int:
+    count = int(argv[0]) if argv else 20_000
+    names = [
+        f"get{DOMAIN[i % 4]}Token{i}ForUserAccount"
+        if i % 3 == 0
+        else f"listUser{i}Items"
+        for i in range(count)
+    ]
+    convert = compile(CamelCase, SnakeCase, use_cache=False)
+
+    print(f"{'entries':>8} {'build ms':>9} {'convert ns/name':>16}")
+    for size in SIZES:
+        generated = [f"Qz{i}X" for i in range(size - len(DOMAIN))] if size else []
+        words = [*DOMAIN, *generated] if size else []
+        start = time.perf_counter()
+        add_acronyms(words)
+        build = time.perf_counter() - start
+        elapsed = min(timeit.repeat(lambda: convert.many(names), number=1, repeat=3))
+        remove_acronyms(words)
+        print(f"{size:>8} {build * 1e3:>9.1f} {elapsed / count * 1e9:>16.0f}")
+
+    print(f"\n{'prefixes':>8} {'sorted list ns':>15} {'trie ns':>9}")
+    text = "strUserName"
+    for size in [len(DEFAULT_PREFIXES), 10_000]:
+        extra = [f"pfx{i}" for i in range(size - len(DEFAULT_PREFIXES))]
+        add_prefixes(extra)
+        prefixes = [*DEFAULT_PREFIXES, *extra]
+        number = 200 if extra else 100_000
+        naive = timeit.timeit(
+            lambda prefixes=prefixes: sorted_prefix(prefixes, text), number=number
+        )
+        trie = timeit.timeit(lambda: _detect_prefix(text), number=100_000)
+        remove_prefixes(extra)
+        print(f"{size:>8} {naive / number * 1e9:>15.0f} {trie / 100_000 * 1e9:>9.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""Benchmark parsing, rendering and every conversion pair of every case class.
+
+Results are written as JSON (nanoseconds per operation, keyed by benchmark
+name) so runs from different versions can be compared:
+
+    python benchmarks/suite.py --output new.json
+    python benchmarks/suite.py --output new.json --compare old.json --threshold 0.2
+
+A comparison fails on groups of benchmarks (one operation over one input
+kind, e.g. ``convert/short``), not single ones: with over a thousand
+timings, some are always off by more than the threshold through noise alone.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import timeit
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import magic_case  # noqa: E402
+from magic_case import add_acronyms, convert_many, remove_acronyms  # noqa: E402
+
+CASES = [
+    getattr(magic_case, name) for name in magic_case.__all__ if name.endswith("Case")
+]
+CASES = [cls for cls in CASES if cls not in (magic_case.BaseCase, magic_case.AnyCase)]
+
+# Word lists each input kind is rendered from, in every source case
+INPUTS = {
+    "short": ["user", "id"],
+    "long": [
+        "customer",
+        "billing",
+        "address",
+        "postal",
+        "code",
+        "verification",
+        "status",
+        "last",
+        "updated",
+        "timestamp",
+        "utc",
+        "value",
+    ],
+    "acronym": ["parse", "http", "url", "to", "json", "api", "v2"],
+    "unicode": ["café", "naïve", "straße", "größe"],
+}
+
+# Hump-case spellings used as is: rendering lowercase words never produces the
+# uppercase runs (HTTPServer) that the acronym lookahead has to split
+RAW_INPUTS = {
+    "acronym": {
+        "CamelCase": "parseHTTPServerURLToJSONApiV2",
+        "PascalCase": "ParseHTTPServerURLToJSONApiV2",
+        "CamelSnakeCase": "parse_HTTPServer_URLToJSON_api_v2",
+    },
+}
+# The "vocab" kind times the acronym inputs again with these registered
+VOCAB = ["HTTP", "URL", "JSON", "API"]
+
+
+def source_text(cls: type, kind: str, words: list[str]) -> str | None:
+    """The ``kind`` input in ``cls``, or ``None`` if ``cls`` cannot parse it."""
+    text = RAW_INPUTS.get(kind, {}).get(cls.__name__) or cls._joiner()(words)
+    try:
+        cls(text)
+    except ValueError:
+        return None
+    return text
+
+
+def measure(func, number: int, repeat: int) -> float:
+    """Best-of-``repeat`` nanoseconds per call."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e9
+
+
+def run(number: int, repeat: int, classes: list[type]) -> dict[str, float]:
+    results: dict[str, float] = {}
+    for kind, words in INPUTS.items():
+        run_kind(results, kind, words, number, repeat, classes)
+    add_acronyms(VOCAB)
+    try:
+        run_kind(results, "vocab", INPUTS["acronym"], number, repeat, classes)
+    finally:
+        remove_acronyms(VOCAB)
+    return results
+
+
+def run_kind(
+    results: dict[str, float],
+    kind: str,
+    words: list[str],
+    number: int,
+    repeat: int,
+    classes: list[type],
+) -> None:
+    """Time parsing, rendering and conversion of one input kind into ``results``."""
+    source_kind = "acronym" if kind == "vocab" else kind
+    texts = {cls: source_text(cls, source_kind, words) for cls in classes}
+    for cls, text in texts.items():
+        if text is None:
+            continue
+        name = cls.__name__
+        results[f"parse/{name}/{kind}"] = measure(
+            lambda cls=cls, text=text: cls(text), number, repeat
+        )
+        # a fresh instance each call: rendering is cached per instance
+        parsed = cls(text)
+        results[f"render/{name}/{kind}"] = measure(
+            lambda cls=cls, parsed=parsed: cls(parsed).get(), number, repeat
+        )
+        for target in classes:
+            batch = [text] * 100
+            results[f"convert/{name}->{target.__name__}/{kind}"] = (
+                measure(
+                    lambda target=target, batch=batch, cls=cls: convert_many(
+                        batch, cls, target
+                    ),
+                    max(1, number // 100),
+                    repeat,
+                )
+                / 100
+            )
+
+
+def group_of(name: str) -> str:
+    """The group a benchmark is judged in: its operation and input kind."""
+    operation, _, rest = name.partition("/")
+    return f"{operation}/{rest.rpartition('/')[2]}"
+
+
+def compare(
+    current: dict[str, float],
+    baseline: dict[str, float],
+    threshold: float,
+    noise_ns: float = 0.0,
+) -> list[str]:
+    """Return a line per group slower than ``baseline`` by more than ``threshold``.
+
+    A group's slowdown is the geometric mean of its benchmarks' time ratios.
+    A benchmark whose time moved by less than ``noise_ns`` counts as unchanged.
+    """
+    ratios: dict[str, list[tuple[float, str]]] = defaultdict(list)
+    for name, value in current.items():
+        before = baseline.get(name)
+        if before:
+            ratio = 1.0 if abs(value - before) < noise_ns else value / before
+            ratios[group_of(name)].append((ratio, name))
+    regressions = []
+    for group, entries in sorted(ratios.items()):
+        mean = math.exp(math.fsum(math.log(r) for r, _ in entries) / len(entries))
+        if mean > 1 + threshold:
+            worst, name = max(entries)
+            regressions.append(
+                f"{group}: +{mean - 1:.0%} over {len(entries)} benchmarks "
+                f"(worst {name} +{worst - 1:.0%})"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument("--compare", type=Path, help="baseline results JSON")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="allowed slowdown of a group vs. baseline as a fraction (default: 0.2)",
+    )
+    parser.add_argument(
+        "--noise-ns",
+        type=float,
+        default=10.0,
+        help="ignore per-benchmark changes smaller than this (default: 10)",
+    )
+    parser.add_argument("--number", type=int, default=2_000, help="calls per timing")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="timings per benchmark; the best counts"
+    )
+    parser.add_argument(
+        "--case", action="append", help="only benchmark these classes (repeatable)"
+    )
+    args = parser.parse_args(argv)
+
+    classes = [cls for cls in CASES if not args.case or cls.__name__ in args.case]
+    started = time.time()
+    results = run(args.number, args.repeat, classes)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": started,
+            "duration_s": time.time() - started,
+            "number": args.number,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    print(f"{len(results)} benchmarks in {report['meta']['duration_s']:.1f}s")
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        regressions = compare(results, baseline, args.threshold, args.noise_ns)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} vs {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
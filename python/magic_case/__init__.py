@@ -1,21 +1,116 @@
-from .base import BaseCase
-from .camel import CamelCase
-from .camel_snake import CamelSnakeCase
-from .dot import DotCase
-from .flat import FlatCase
-from .http_header import HttpHeaderCase
-from .hungarian import HungarianCase
-from .kebab import KebabCase
-from .macro import MacroCase
-from .pascal import PascalCase
-from .pascal_snake import PascalSnakeCase
-from .path import PathCase
-from .sentence import SentenceCase
-from .slash_title import SlashTitleCase
-from .snake import SnakeCase
-from .space import SpaceCase
-from .title import TitleCase
-from .upper import UpperCase
+"""Convert strings between common cases.
+
+Every public name is imported lazily on first access (PEP 562), so
+``import magic_case`` stays cheap and ``from magic_case import SnakeCase``
+only loads the modules ``SnakeCase`` needs.
+"""
+
+# typing is not imported at runtime to keep cold start cheap
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .aio import aconvert_keys, aconvert_many
+    from .arrays import convert_array
+    from .base import BaseCase, set_max_length
+    from .cache import (
+        CacheInfo,
+        cache_clear,
+        cache_info,
+        disable_cache,
+        disable_interning,
+        enable_cache,
+        enable_interning,
+        intern_clear,
+        intern_info,
+    )
+    from .camel import CamelCase
+    from .camel_snake import CamelSnakeCase
+    from .convert import Converter, convert_keys, convert_many
+    from .convert import compile as compile
+    from .detect import AnyCase, detect_case
+    from .dot import DotCase
+    from .flat import FlatCase
+    from .http_header import HttpHeaderCase
+    from .hungarian import HungarianCase
+    from .index import CaseIndex
+    from .jsonstream import convert_json_stream, iter_convert_json
+    from .kebab import KebabCase
+    from .macro import MacroCase
+    from .middleware import ASGIMiddleware, WSGIMiddleware
+    from .parallel import convert_parallel, convert_threaded
+    from .pascal import PascalCase
+    from .pascal_snake import PascalSnakeCase
+    from .path import PathCase
+    from .profiling import disable_profiling, enable_profiling, profile
+    from .rename import rename_tree
+    from .sentence import SentenceCase
+    from .slash_title import SlashTitleCase
+    from .snake import SnakeCase
+    from .space import SpaceCase
+    from .spans import convert_spans, render_spans, word_spans
+    from .title import TitleCase
+    from .upper import UpperCase
+    from .vocab import add_acronyms, add_prefixes, remove_acronyms, remove_prefixes
+
+# public name -> submodule defining it
+_LAZY = {
+    "BaseCase": "base",
+    "SnakeCase": "snake",
+    "CamelCase": "camel",
+    "PascalCase": "pascal",
+    "KebabCase": "kebab",
+    "UpperCase": "upper",
+    "SentenceCase": "sentence",
+    "TitleCase": "title",
+    "DotCase": "dot",
+    "SpaceCase": "space",
+    "FlatCase": "flat",
+    "HttpHeaderCase": "http_header",
+    "CamelSnakeCase": "camel_snake",
+    "HungarianCase": "hungarian",
+    "MacroCase": "macro",
+    "PascalSnakeCase": "pascal_snake",
+    "PathCase": "path",
+    "SlashTitleCase": "slash_title",
+    "AnyCase": "detect",
+    "detect_case": "detect",
+    "convert_many": "convert",
+    "convert_keys": "convert",
+    # importable by name but left out of __all__: a star import would
+    # shadow the builtin compile()
+    "compile": "convert",
+    "Converter": "convert",
+    "convert_parallel": "parallel",
+    "convert_threaded": "parallel",
+    "aconvert_many": "aio",
+    "aconvert_keys": "aio",
+    "convert_array": "arrays",
+    "word_spans": "spans",
+    "render_spans": "spans",
+    "convert_spans": "spans",
+    "CaseIndex": "index",
+    "convert_json_stream": "jsonstream",
+    "iter_convert_json": "jsonstream",
+    "rename_tree": "rename",
+    "WSGIMiddleware": "middleware",
+    "ASGIMiddleware": "middleware",
+    "enable_profiling": "profiling",
+    "disable_profiling": "profiling",
+    "profile": "profiling",
+    "CacheInfo": "cache",
+    "enable_cache": "cache",
+    "disable_cache": "cache",
+    "cache_info": "cache",
+    "cache_clear": "cache",
+    "enable_interning": "cache",
+    "disable_interning": "cache",
+    "intern_info": "cache",
+    "intern_clear": "cache",
+    "add_acronyms": "vocab",
+    "remove_acronyms": "vocab",
+    "add_prefixes": "vocab",
+    "remove_prefixes": "vocab",
+    "set_max_length": "base",
+}
 
 __all__ = [
     "BaseCase",
@@ -36,4 +131,53 @@ __all__ = [
     "PascalSnakeCase",
     "PathCase",
     "SlashTitleCase",
+    "AnyCase",
+    "detect_case",
+    "convert_many",
+    "convert_keys",
+    "Converter",
+    "convert_parallel",
+    "convert_threaded",
+    "aconvert_many",
+    "aconvert_keys",
+    "convert_array",
+    "word_spans",
+    "render_spans",
+    "convert_spans",
+    "CaseIndex",
+    "convert_json_stream",
+    "iter_convert_json",
+    "rename_tree",
+    "WSGIMiddleware",
+    "ASGIMiddleware",
+    "enable_profiling",
+    "disable_profiling",
+    "profile",
+    "CacheInfo",
+    "enable_cache",
+    "disable_cache",
+    "cache_info",
+    "cache_clear",
+    "enable_interning",
+    "disable_interning",
+    "intern_info",
+    "intern_clear",
+    "add_acronyms",
+    "remove_acronyms",
+    "add_prefixes",
+    "remove_prefixes",
+    "set_max_length",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(__import__(f"{__name__}.{module}", fromlist=[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
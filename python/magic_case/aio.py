@@ -0,0 +1,131 @@
+"""Asyncio-friendly conversion that keeps the event loop responsive.
+
+Small jobs are converted in chunks on the loop, yielding between chunks;
+jobs at or above ``offload_threshold`` run in an executor (the loop's default
+thread pool unless one is given). Identical conversions that are already in
+flight on the same loop are coalesced: later callers await the first one's
+result instead of converting again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any
+
+from .base import BaseCase
+from .convert import _convert_keys_steps, _converter, convert_keys, convert_many
+
+# (loop, *job key) -> task doing the conversion
+_inflight: dict[tuple[Hashable, ...], asyncio.Future[Any]] = {}
+
+
+async def _coalesced(
+    key: tuple[Hashable, ...], start: Callable[[], Awaitable[Any]]
+) -> tuple[Any, bool]:
+    """Run ``start()`` unless the same ``key`` is in flight; return (result, shared).
+
+    The work runs as its own task and callers await it through
+    ``asyncio.shield``, so cancelling one caller does not cancel the
+    conversion for the others.
+    """
+    key = (asyncio.get_running_loop(), *key)
+    task = _inflight.get(key)
+    shared = task is not None
+    if task is None:
+        task = asyncio.ensure_future(start())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await asyncio.shield(task), shared
+
+
+def _check_chunksize(chunksize: int) -> None:
+    if chunksize <= 0:
+        raise ValueError("chunksize must be a positive integer")
+
+
+async def aconvert_many(
+    items: Iterable[str],
+    source: type[BaseCase],
+    target: type[BaseCase],
+    *,
+    chunksize: int = 256,
+    offload_threshold: int = 100_000,
+    executor: Executor | None = None,
+    coalesce: bool = True,
+) -> list[str]:
+    """Async :func:`~magic_case.convert.convert_many`.
+
+    Below ``offload_threshold`` items, ``chunksize`` items are converted at a
+    time with a yield to the event loop in between. Larger jobs run in
+    ``executor`` (the loop's default thread pool when ``None``; pass a
+    process pool to keep the GIL free for the loop). With ``coalesce``,
+    concurrent calls for the same items and case pair share one conversion;
+    every caller still gets its own list.
+    """
+    _check_chunksize(chunksize)
+    items = list(items)
+
+    async def run() -> list[str]:
+        loop = asyncio.get_running_loop()
+        if len(items) >= offload_threshold:
+            return await loop.run_in_executor(
+                executor, convert_many, items, source, target
+            )
+        convert = _converter(source, target)
+        result: list[str] = []
+        for start in range(0, len(items), chunksize):
+            if start:
+                await asyncio.sleep(0)
+            result.extend(map(convert, items[start : start + chunksize]))
+        return result
+
+    if not coalesce:
+        return await run()
+    result, shared = await _coalesced(("many", source, target, tuple(items)), run)
+    return list(result) if shared else result
+
+
+async def aconvert_keys(
+    obj: Any,
+    source: type[BaseCase],
+    target: type[BaseCase],
+    *,
+    inplace: bool = False,
+    chunksize: int = 256,
+    offload_threshold: int = 100_000,
+    executor: Executor | None = None,
+    coalesce: bool = True,
+) -> Any:
+    """Async :func:`~magic_case.convert.convert_keys`.
+
+    The payload is walked ``chunksize`` keys and list items at a time with a
+    yield to the event loop in between, so it must not be mutated by other
+    tasks until the call returns. A top-level dict or list with at least
+    ``offload_threshold`` entries is converted in ``executor`` instead (the
+    loop's default thread pool when ``None``). With ``coalesce``, concurrent
+    calls for the very same object (by identity) and case pair share one
+    conversion and receive the same result object.
+    """
+    _check_chunksize(chunksize)
+
+    async def run() -> Any:
+        loop = asyncio.get_running_loop()
+        if isinstance(obj, (dict, list)) and len(obj) >= offload_threshold:
+            return await loop.run_in_executor(
+                executor, partial(convert_keys, obj, source, target, inplace=inplace)
+            )
+        steps = _convert_keys_steps(obj, _converter(source, target), inplace, chunksize)
+        try:
+            while True:
+                next(steps)
+                await asyncio.sleep(0)
+        except StopIteration as done:
+            return done.value
+
+    if not coalesce:
+        return await run()
+    result, _ = await _coalesced(("keys", source, target, id(obj), inplace), run)
+    return result
@@ -0,0 +1,121 @@
+"""Whole-array conversion of NumPy and pyarrow string arrays.
+
+Optional extra: NumPy (2.0+) and pyarrow are imported lazily, only when an
+array of that library is passed in, so the core package stays
+dependency-free. Install with ``pip install "magic-case[numpy]"`` or
+``"magic-case[arrow]"``.
+
+Separator-only pairs (see ``convert._SEPARATOR_SOURCES`` and
+``convert._SEPARATOR_TARGETS``) run as whole-array lower/replace/upper
+kernels; every other pair, and for pyarrow any non-ASCII row, falls back to
+the per-string :func:`~magic_case.convert.convert_many` logic so the output
+always matches the case classes exactly.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .base import BaseCase
+from .convert import _SEPARATOR_SOURCES, _SEPARATOR_TARGETS, convert_many
+
+_FINISHERS = {None: None, str.upper: "upper", str.capitalize: "capitalize"}
+
+
+def _plan(
+    source: type[BaseCase], target: type[BaseCase]
+) -> tuple[str, str, str | None] | None:
+    """Return (source_sep, target_sep, finish) when the pair is vectorizable."""
+    if source not in _SEPARATOR_SOURCES or target not in _SEPARATOR_TARGETS:
+        return None
+    target_sep, finish = _SEPARATOR_TARGETS[target]
+    return _SEPARATOR_SOURCES[source], target_sep, _FINISHERS[finish]
+
+
+def _convert_numpy(values: Any, source: type[BaseCase], target: type[BaseCase]) -> Any:
+    import numpy as np
+    from numpy.dtypes import StringDType
+
+    kind = values.dtype.kind
+    plan = _plan(source, target)
+    if plan is None or kind not in "UT":
+        converted = convert_many(values.ravel().tolist(), source, target)
+        # "U" results are sized to fit, but an empty list would infer float64
+        dtype = values.dtype if kind in "OT" or not converted else None
+        return np.array(converted, dtype=dtype).reshape(values.shape)
+
+    # StringDType kernels follow Python's full Unicode case mappings, and
+    # unlike fixed-width "U" arrays they can grow (e.g. "ß".upper() == "SS")
+    out = values.astype(StringDType()) if kind == "U" else values
+    source_sep, target_sep, finish = plan
+    out = np.strings.lower(out)
+    if source_sep != target_sep:
+        out = np.strings.replace(out, source_sep, target_sep)
+    if finish is not None:
+        out = getattr(np.strings, finish)(out)
+
+    if kind == "U":
+        width = max(int(np.strings.str_len(out).max(initial=0)), 1)
+        out = out.astype(f"U{width}")
+    return out
+
+
+def _convert_arrow(values: Any, source: type[BaseCase], target: type[BaseCase]) -> Any:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if isinstance(values, pa.ChunkedArray):
+        return pa.chunked_array(
+            [_convert_arrow(chunk, source, target) for chunk in values.chunks],
+            type=values.type,
+        )
+
+    def per_string(array: Any) -> Any:
+        converted = _convert_optional(array.to_pylist(), source, target)
+        return pa.array(converted, type=array.type)
+
+    plan = _plan(source, target)
+    if plan is None:
+        return per_string(values)
+
+    # Arrow uses simple (1:1) Unicode case mappings, which differ from
+    # Python's for some non-ASCII characters, so only ASCII rows go through
+    # the vectorized kernels
+    source_sep, target_sep, finish = plan
+    out = pc.utf8_lower(values)
+    if source_sep != target_sep:
+        out = pc.replace_substring(out, source_sep, target_sep)
+    if finish is not None:
+        out = getattr(pc, f"utf8_{finish}")(out)
+
+    non_ascii = pc.invert(pc.fill_null(pc.string_is_ascii(values), True))
+    if not pc.any(non_ascii).as_py():
+        return out
+    return pc.replace_with_mask(out, non_ascii, per_string(values.filter(non_ascii)))
+
+
+def _convert_optional(
+    items: list[str | None], source: type[BaseCase], target: type[BaseCase]
+) -> list[str | None]:
+    """convert_many that passes ``None`` (null) entries through."""
+    present = [item for item in items if item is not None]
+    converted = iter(convert_many(present, source, target))
+    return [None if item is None else next(converted) for item in items]
+
+
+def convert_array(values: Any, source: type[BaseCase], target: type[BaseCase]) -> Any:
+    """Convert a NumPy or pyarrow array of strings from ``source`` to ``target``.
+
+    Returns an array of the same kind: NumPy ``StringDType``, ``str_`` ("U")
+    and object arrays keep their dtype family and shape; pyarrow ``Array`` and
+    ``ChunkedArray`` keep their type and nulls. The output is identical to
+    converting each element with ``target(source(element)).get()``.
+    """
+    module = type(values).__module__.split(".", 1)[0]
+    if module == "numpy":
+        return _convert_numpy(values, source, target)
+    if module == "pyarrow":
+        return _convert_arrow(values, source, target)
+    raise TypeError(
+        f"convert_array expects a NumPy or pyarrow array, got {type(values).__name__}"
+    )
@@ -1,6 +1,31 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from types import MethodType
+
+from . import cache as _cache
+
+# longest input accepted, in characters; see set_max_length()
+_max_length: int | None = None
+
+
+def set_max_length(limit: int | None) -> None:
+    """Reject input longer than ``limit`` characters; ``None`` lifts the cap.
+
+    Oversized input raises ``ValueError`` after a single length comparison,
+    before any scanning. The cap applies to the case classes, to
+    ``convert_many``/``convert_keys`` (keys only) and their async and
+    threaded variants, and to converters compiled while it is set.
+    """
+    global _max_length
+    if limit is not None and limit < 0:
+        raise ValueError("limit must be a non-negative integer or None")
+    _max_length = limit
+
+
+def _too_long(text: str, limit: int) -> ValueError:
+    return ValueError(f"input of {len(text)} characters exceeds the limit of {limit}")
 
 
 class BaseCase(ABC):
@@ -8,30 +33,139 @@ class BaseCase(ABC):
 
     Holds a normalized list of lowercase words and renders them according to
     the specific case in subclasses.
+
+    Instances use ``__slots__``: words are stored as a tuple (shared, not
+    copied, when one case is built from another) and the rendered string is
+    computed on first use and kept on the instance.
+
+    Construction and rendering only read shared configuration, so any number
+    of threads may convert at once. An instance may be shared between
+    threads as long as none of them assigns ``words``: threads racing on the
+    first render compute the same string.
     """
 
-    words: list[str]
+    __slots__ = ("_words", "_rendered")
+
+    _words: tuple[str, ...]
+    _rendered: str | None
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Require concrete subclasses to say how they render.
+
+        A subclass provides either ``_join_words`` or its own ``__str__``;
+        leaving out both fails here, when the class is defined, rather than
+        on the first render.
+        """
+        super().__init_subclass__(**kwargs)
+        if getattr(cls._split_into_words, "__isabstractmethod__", False):
+            return
+        for klass in cls.__mro__:
+            if klass is BaseCase:
+                raise TypeError(f"{cls.__name__} must define _join_words or __str__")
+            names = vars(klass)
+            if "_join_words" in names or "__str__" in names or "_render" in names:
+                return
 
     def __init__(self, text_or_obj: str | BaseCase):
         if isinstance(text_or_obj, BaseCase):
-            self.words = text_or_obj.words
+            self._words = text_or_obj._words
         elif isinstance(text_or_obj, str):
-            self.words = self._split_into_words(text_or_obj)
+            limit = _max_length
+            if limit is not None and len(text_or_obj) > limit:
+                raise _too_long(text_or_obj, limit)
+            cache = _cache._active
+            split = self._split_into_words
+            if cache is None or type(split) is MethodType:
+                self._words = tuple(split(text_or_obj))
+            else:
+                self._words = tuple(cache.split(split, text_or_obj))
         else:
             raise TypeError("BaseCase expects a string or another BaseCase instance")
+        self._rendered = None
 
-        if not all(isinstance(word, str) for word in self.words):
+        if not all(isinstance(word, str) for word in self._words):
             raise ValueError("All words must be strings")
 
+    @property
+    def words(self) -> list[str]:
+        """The normalized words, as a new list.
+
+        The list is a copy: editing it leaves the instance unchanged. Assign
+        to ``words`` to replace them.
+        """
+        return list(self._words)
+
+    @words.setter
+    def words(self, words: list[str]) -> None:
+        self._words = tuple(words)
+        self._rendered = None
+
     @abstractmethod
     def _split_into_words(self, text: str) -> list[str]:
         """Split the input text into lowercase words."""
         raise NotImplementedError
 
-    @abstractmethod
+    @staticmethod
+    def _join_words(words: Sequence[str]) -> str:
+        """Render a list of words in the case style."""
+        raise NotImplementedError
+
     def __str__(self) -> str:
         """Return the text formatted in the case style."""
-        raise NotImplementedError
+        rendered = self._rendered
+        if rendered is None:
+            rendered = self._render()
+            pool = _cache._pool
+            if pool is not None:
+                rendered = pool.intern(rendered)
+            self._rendered = rendered
+        return rendered
+
+    def _render(self) -> str:
+        cache = _cache._active
+        join = self._join_words
+        if cache is None or type(join) is MethodType:
+            return join(self._words)
+        return cache.join(join, self._words)
 
     def get(self) -> str:
         return str(self)
+
+    @classmethod
+    def _splitter(cls) -> Callable[[str], list[str]]:
+        """Return a function splitting text into words without an instance.
+
+        Built-in cases declare ``_split_into_words`` as a ``staticmethod`` and
+        hand it out directly; other subclasses fall back to building an
+        instance per call.
+        """
+        for klass in cls.__mro__:
+            if "_split_into_words" in vars(klass):
+                if isinstance(vars(klass)["_split_into_words"], staticmethod):
+                    return cls._split_into_words
+                break
+
+        def split(text: str) -> list[str]:
+            return list(cls(text)._words)
+
+        return split
+
+    @classmethod
+    def _joiner(cls) -> Callable[[Sequence[str]], str]:
+        """Return a function rendering a list of words without an instance.
+
+        Subclasses that override ``__str__`` or ``_render`` are rendered
+        through a bare instance carrying the words.
+        """
+        for klass in cls.__mro__:
+            if "_join_words" in vars(klass) and klass is not BaseCase:
+                return cls._join_words
+            if "__str__" in vars(klass) or "_render" in vars(klass):
+                break
+
+        def join(words: Sequence[str]) -> str:
+            obj = cls.__new__(cls)
+            obj.words = words
+            return str(obj)
+
+        return join
@@ -0,0 +1,181 @@
+"""Opt-in, size-bounded memoization of split and render results.
+
+Also home to the opt-in interning pool, which hands back one shared object
+per distinct converted string.
+"""
+
+from __future__ import annotations
+
+from collections import namedtuple
+from collections.abc import Callable, Hashable, Sequence
+from functools import lru_cache
+from threading import Lock
+
+from .vocab import ACRONYMS, PREFIXES
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+
+class LRUCache:
+    """Bounded least-recently-used cache of split and render results.
+
+    Entries are keyed by the split/render function (one per case class) and
+    its input, and splits also by the vocabulary version, so that changing
+    acronyms or prefixes never returns an old split. Lookups go through
+    :func:`functools.lru_cache`, which is implemented in C and thread-safe.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        # entries added by misses that returned; a miss that raised adds none
+        self._inserted = 0
+        self._call = lru_cache(maxsize=maxsize)(self._apply)
+
+    def __len__(self) -> int:
+        return self._call.cache_info().currsize
+
+    def _apply(
+        self, func: Callable[[Hashable], object], arg: Hashable, version: int = 0
+    ) -> object:
+        result = func(arg)
+        self._inserted += 1
+        return result
+
+    def split(self, split: Callable[[str], list[str]], text: str) -> list[str]:
+        """Return the cached words of ``text``, splitting on a miss.
+
+        The returned list is shared with the cache and must not be mutated.
+        """
+        # the version (vocab._version(), inlined) is read before splitting
+        return self._call(split, text, ACRONYMS.version + PREFIXES.version)
+
+    def join(self, join: Callable[[Sequence[str]], str], words: Sequence[str]) -> str:
+        """Return the cached rendering of ``words``, joining on a miss."""
+        return self._call(join, tuple(words))
+
+    def clear(self) -> None:
+        self._call.cache_clear()
+        self._inserted = 0
+
+    def info(self) -> CacheInfo:
+        hits, misses, maxsize, currsize = self._call.cache_info()
+        # whatever was inserted and is no longer there was evicted
+        evictions = max(0, self._inserted - currsize)
+        return CacheInfo(hits, misses, evictions, maxsize, currsize)
+
+
+_active: LRUCache | None = None
+
+
+def enable_cache(maxsize: int = 4096) -> None:
+    """Turn on memoization of split/render results, bounded to ``maxsize``.
+
+    Calling it again replaces the cache (and its counters) with a fresh one.
+    """
+    global _active
+    _active = LRUCache(maxsize)
+
+
+def disable_cache() -> None:
+    """Turn memoization off and drop every cached entry."""
+    global _active
+    _active = None
+
+
+def cache_info() -> CacheInfo | None:
+    """Return hit/miss/eviction counters, or ``None`` when caching is off."""
+    cache = _active
+    return cache.info() if cache is not None else None
+
+
+def cache_clear() -> None:
+    """Drop every cached entry and reset the counters."""
+    cache = _active
+    if cache is not None:
+        cache.clear()
+
+
+class InternPool:
+    """Bounded pool handing back one shared object per distinct string.
+
+    When the pool is full, the entry added first is evicted. Hits are a
+    single dict lookup; misses take a lock so concurrent evictions stay
+    consistent. Counters are approximate under concurrent use.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self._pool: dict[str, str] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def intern(self, text: str) -> str:
+        """Return the pooled string equal to ``text``, adding ``text`` if new."""
+        pooled = self._pool.get(text)
+        if pooled is not None:
+            self.hits += 1
+            return pooled
+        with self._lock:
+            pooled = self._pool.setdefault(text, text)
+            if pooled is text:
+                self.misses += 1
+                if len(self._pool) > self.maxsize:
+                    del self._pool[next(iter(self._pool))]
+                    self.evictions += 1
+            return pooled
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pool.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self._pool)
+        )
+
+
+_pool: InternPool | None = None
+
+
+def enable_interning(maxsize: int = 4096) -> None:
+    """Return one shared object per distinct converted string, up to ``maxsize``.
+
+    Applies to ``BaseCase.get()``/``str()``, ``convert_many``,
+    ``convert_keys`` and their async variants; converters from
+    :func:`~magic_case.compile` are left as they are. Strings evicted from a
+    full pool stay valid, later equal results are just new objects again.
+    Calling it again replaces the pool (and its counters) with a fresh one.
+    """
+    global _pool
+    _pool = InternPool(maxsize)
+
+
+def disable_interning() -> None:
+    """Stop interning and drop the pool."""
+    global _pool
+    _pool = None
+
+
+def intern_info() -> CacheInfo | None:
+    """Return the pool's hit/miss/eviction counters, or ``None`` when off."""
+    pool = _pool
+    return pool.info() if pool is not None else None
+
+
+def intern_clear() -> None:
+    """Empty the pool and reset its counters."""
+    pool = _pool
+    if pool is not None:
+        pool.clear()
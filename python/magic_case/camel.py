@@ -1,10 +1,14 @@
-import re
+from collections.abc import Sequence
 
 from .base import BaseCase
+from .tokenizer import split_humps
 
 
 class CamelCase(BaseCase):
-    def _split_into_words(self, text: str) -> list[str]:
+    __slots__ = ()
+
+    @staticmethod
+    def _split_into_words(text: str) -> list[str]:
         """
         Splits a CamelCase string into its component words.
 
@@ -23,9 +27,9 @@ class CamelCase(BaseCase):
         # Split rules:
         # - lowercase → uppercase boundary: testCase → test Case
         # - acronym before normal word: HTTPServer → HTTP Server
-        pattern = r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])"
-        return re.split(pattern, text)
+        return split_humps(text)
 
-    def __str__(self) -> str:
-        first, *rest = self.words
+    @staticmethod
+    def _join_words(words: Sequence[str]) -> str:
+        first, *rest = words
         return first.lower() + "".join(w.capitalize() for w in rest)
@@ -1,17 +1,21 @@
-import re
+from collections.abc import Sequence
 
 from .base import BaseCase
+from .tokenizer import split_camel_snake
 
 
 class CamelSnakeCase(BaseCase):
-    def _split_into_words(self, text: str) -> list[str]:
+    __slots__ = ()
+
+    @staticmethod
+    def _split_into_words(text: str) -> list[str]:
         # Split on underscores or camel humps
-        words = re.findall(r"[A-Z]?[a-z0-9]+|[A-Z]+(?![a-z])", text.replace("_", " "))
-        return [word.lower() for word in words if word]
+        return split_camel_snake(text)
 
-    def __str__(self) -> str:
-        if not self.words:
+    @staticmethod
+    def _join_words(words: Sequence[str]) -> str:
+        if not words:
             return ""
-        first = self.words[0].lower()
-        rest = [w.capitalize() for w in self.words[1:]]
+        first = words[0].lower()
+        rest = [w.capitalize() for w in words[1:]]
         return "_".join([first] + rest)
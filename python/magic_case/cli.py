@@ -0,0 +1,293 @@
+"""Command line interface: stream case conversions from stdin or a file.
+
+``magic-case rename`` rewrites identifiers across a source tree instead; see
+:mod:`magic_case.rename`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import sys
+from collections.abc import Iterable
+from itertools import islice
+from typing import Callable, TextIO
+
+from .base import BaseCase
+from .camel import CamelCase
+from .camel_snake import CamelSnakeCase
+from .convert import Converter
+from .dot import DotCase
+from .flat import FlatCase
+from .http_header import HttpHeaderCase
+from .hungarian import HungarianCase
+from .kebab import KebabCase
+from .macro import MacroCase
+from .pascal import PascalCase
+from .pascal_snake import PascalSnakeCase
+from .path import PathCase
+from .sentence import SentenceCase
+from .slash_title import SlashTitleCase
+from .snake import SnakeCase
+from .space import SpaceCase
+from .title import TitleCase
+from .upper import UpperCase
+
+CASES: dict[str, type[BaseCase]] = {
+    "snake": SnakeCase,
+    "camel": CamelCase,
+    "pascal": PascalCase,
+    "kebab": KebabCase,
+    "upper": UpperCase,
+    "sentence": SentenceCase,
+    "title": TitleCase,
+    "dot": DotCase,
+    "space": SpaceCase,
+    "flat": FlatCase,
+    "http-header": HttpHeaderCase,
+    "camel-snake": CamelSnakeCase,
+    "hungarian": HungarianCase,
+    "macro": MacroCase,
+    "pascal-snake": PascalSnakeCase,
+    "path": PathCase,
+    "slash-title": SlashTitleCase,
+}
+
+# Roughly how many bytes of input are read, converted and written per batch
+CHUNK_SIZE = 1 << 20
+# Rows per batch in --column mode
+ROW_BATCH = 10_000
+
+
+def convert_lines(stream: TextIO, out: TextIO, convert: Callable[[str], str]) -> None:
+    """Convert every line of ``stream``, reading and writing in large batches.
+
+    Empty lines are passed through unchanged.
+    """
+    while True:
+        batch = stream.readlines(CHUNK_SIZE)
+        if not batch:
+            break
+        out.write(
+            "".join(
+                line
+                if line == "\n"
+                else convert(line[:-1]) + "\n"
+                if line.endswith("\n")
+                else convert(line)
+                for line in batch
+            )
+        )
+
+
+def convert_column(
+    stream: TextIO,
+    out: TextIO,
+    convert: Callable[[str], str],
+    column: int,
+    delimiter: str,
+    skip_header: bool,
+) -> None:
+    """Convert one column of a CSV/TSV stream, keeping every other field as is.
+
+    Rows without that column and empty fields are passed through unchanged.
+    """
+    reader: Iterable[list[str]] = csv.reader(stream, delimiter=delimiter)
+    writer = csv.writer(out, delimiter=delimiter, lineterminator="\n")
+    if skip_header:
+        header = next(iter(reader), None)
+        if header is not None:
+            writer.writerow(header)
+
+    while True:
+        rows = list(islice(reader, ROW_BATCH))
+        if not rows:
+            break
+        for row in rows:
+            if len(row) > column and row[column]:
+                row[column] = convert(row[column])
+        writer.writerows(rows)
+
+
+def _delimiter(value: str) -> str:
+    if len(value) != 1:
+        raise argparse.ArgumentTypeError(f"must be a single character, got {value!r}")
+    return value
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="magic-case",
+        description="Convert identifiers between cases, one per line.",
+        epilog="Run 'magic-case rename --help' to rename identifiers in source files.",
+    )
+    choices = sorted(CASES)
+    parser.add_argument("input", nargs="?", help="input file (default: stdin)")
+    parser.add_argument(
+        "--from", dest="source", required=True, choices=choices, help="source case"
+    )
+    parser.add_argument(
+        "--to", dest="target", required=True, choices=choices, help="target case"
+    )
+    parser.add_argument(
+        "--column",
+        type=int,
+        metavar="N",
+        help="convert only column N (1-based) of CSV/TSV input",
+    )
+    parser.add_argument(
+        "--delimiter",
+        type=_delimiter,
+        default=",",
+        help="field delimiter for --column (default: ,)",
+    )
+    parser.add_argument(
+        "--tsv", action="store_true", help="shorthand for --delimiter '\\t'"
+    )
+    parser.add_argument(
+        "--skip-header",
+        action="store_true",
+        help="leave the first row untouched in --column mode",
+    )
+    parser.add_argument(
+        "--keep-invalid",
+        action="store_true",
+        help="pass through values the source case rejects instead of failing",
+    )
+    parser.add_argument("--encoding", default="utf-8", help="input file encoding")
+    return parser
+
+
+def build_rename_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="magic-case rename",
+        description="Rename identifiers in Python/JavaScript/TypeScript files "
+        "from one case to another, in place.",
+    )
+    choices = sorted(CASES)
+    parser.add_argument("root", help="directory or file to rewrite")
+    parser.add_argument(
+        "--from", dest="source", required=True, choices=choices, help="source case"
+    )
+    parser.add_argument(
+        "--to", dest="target", required=True, choices=choices, help="target case"
+    )
+    parser.add_argument(
+        "--ext",
+        action="append",
+        metavar="SUFFIX",
+        help="only files with this suffix, e.g. .ts (repeatable; default: all "
+        "supported)",
+    )
+    parser.add_argument(
+        "--strings",
+        action="store_true",
+        help="also rename identifiers inside string literals",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        metavar="NAME",
+        help="never rename NAME, e.g. a name also used by code outside the tree "
+        "(repeatable)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="list the files that would change without writing them",
+    )
+    parser.add_argument(
+        "--workers", type=int, metavar="N", help="worker processes (default: CPUs)"
+    )
+    return parser
+
+
+def rename_main(argv: list[str]) -> int:
+    from .rename import LEXERS, rename_tree
+
+    args = build_rename_parser().parse_args(argv)
+    try:
+        report = rename_tree(
+            args.root,
+            CASES[args.source],
+            CASES[args.target],
+            suffixes=args.ext or LEXERS,
+            strings=args.strings,
+            write=not args.dry_run,
+            workers=args.workers,
+            exclude=args.exclude or (),
+        )
+    except (OSError, ValueError) as exc:
+        print(f"magic-case: {exc}", file=sys.stderr)
+        return 1
+    for path in report.changed:
+        print(path)
+    print(report.format(), file=sys.stderr)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ["rename"]:
+        return rename_main(argv[1:])
+    args = build_parser().parse_args(argv)
+    if args.column is not None and args.column < 1:
+        print("magic-case: --column must be 1 or greater", file=sys.stderr)
+        return 2
+
+    convert = Converter(
+        CASES[args.source],
+        CASES[args.target],
+        errors="keep" if args.keep_invalid else "raise",
+    )
+
+    try:
+        if args.input:
+            # csv needs the raw line endings; plain lines use universal newlines
+            stream = open(
+                args.input,
+                encoding=args.encoding,
+                newline="" if args.column is not None else None,
+                buffering=CHUNK_SIZE,
+            )
+        elif args.column is not None:
+            # sys.stdin translates newlines, which would alter quoted CRLF fields
+            stream = io.TextIOWrapper(
+                sys.stdin.buffer,
+                encoding=sys.stdin.encoding,
+                errors=sys.stdin.errors,
+                newline="",
+            )
+        else:
+            stream = sys.stdin
+    except OSError as exc:
+        print(f"magic-case: {exc}", file=sys.stderr)
+        return 1
+
+    try:
+        if args.column is not None:
+            convert_column(
+                stream,
+                sys.stdout,
+                convert,
+                args.column - 1,
+                "\t" if args.tsv else args.delimiter,
+                args.skip_header,
+            )
+        else:
+            convert_lines(stream, sys.stdout, convert)
+    except csv.Error as exc:
+        print(f"magic-case: malformed CSV input: {exc}", file=sys.stderr)
+        return 2
+    except (OSError, ValueError) as exc:
+        print(f"magic-case: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        if args.input:
+            stream.close()
+        elif stream is not sys.stdin:
+            # leave the process's stdin open
+            stream.detach()
+    return 0
@@ -0,0 +1,457 @@
+"""Bulk conversion helpers working directly on strings."""
+
+from __future__ import annotations
+
+from collections.abc import Generator, Iterable, Iterator
+from functools import cache, lru_cache
+from typing import Any, Callable
+
+from . import base as _base
+from . import cache as _cache
+from . import vocab as _vocab
+from .base import BaseCase, _too_long
+from .dot import DotCase
+from .flat import FlatCase
+from .kebab import KebabCase
+from .macro import MacroCase
+from .path import PathCase
+from .sentence import SentenceCase
+from .snake import SnakeCase
+from .space import SpaceCase
+from .title import TitleCase
+from .upper import UpperCase
+
+_FAST_PATHS: dict[tuple[type[BaseCase], type[BaseCase]], Callable[[str], str]] = {}
+
+
+def register_conversion(
+    source: type[BaseCase], target: type[BaseCase]
+) -> Callable[[Callable[[str], str]], Callable[[str], str]]:
+    """Register a direct string → string fast path for an exact case pair.
+
+    The function must return exactly what ``target(source(text)).get()``
+    returns; it is picked over the generic split/join pipeline for that pair.
+    """
+
+    def decorator(func: Callable[[str], str]) -> Callable[[str], str]:
+        _FAST_PATHS[source, target] = func
+        _pipeline.cache_clear()
+        return func
+
+    return decorator
+
+
+def _separator_conversion(
+    source_sep: str, target_sep: str, finish: Callable[[str], str] | None
+) -> Callable[[str], str]:
+    """Fast path between cases that split with ``text.lower().split(sep)``."""
+    if source_sep == target_sep:
+        if finish is None:
+            return str.lower
+
+        def convert(text: str) -> str:
+            return finish(text.lower())
+
+    elif finish is None:
+
+        def convert(text: str) -> str:
+            return text.lower().replace(source_sep, target_sep)
+
+    else:
+
+        def convert(text: str) -> str:
+            return finish(text.lower().replace(source_sep, target_sep))
+
+    return convert
+
+
+# Sources whose words are ``text.lower().split(separator)``
+_SEPARATOR_SOURCES: dict[type[BaseCase], str] = {
+    SnakeCase: "_",
+    UpperCase: "_",
+    KebabCase: "-",
+    DotCase: ".",
+    SentenceCase: " ",
+    TitleCase: " ",
+}
+
+# Targets rendering as ``finish(separator.join(words))`` for lowercase words
+_SEPARATOR_TARGETS: dict[type[BaseCase], tuple[str, Callable[[str], str] | None]] = {
+    SnakeCase: ("_", None),
+    KebabCase: ("-", None),
+    DotCase: (".", None),
+    PathCase: ("/", None),
+    SpaceCase: (" ", None),
+    FlatCase: ("", None),
+    UpperCase: ("_", str.upper),
+    MacroCase: ("_", str.upper),
+    SentenceCase: (" ", str.capitalize),
+}
+
+for _source, _source_sep in _SEPARATOR_SOURCES.items():
+    for _target, (_target_sep, _finish) in _SEPARATOR_TARGETS.items():
+        _FAST_PATHS[_source, _target] = _separator_conversion(
+            _source_sep, _target_sep, _finish
+        )
+
+
+def _space_to_title(text: str) -> str:
+    return " ".join(w.lower().capitalize() for w in text.split(" ") if w.strip())
+
+
+_FAST_PATHS[SpaceCase, TitleCase] = _space_to_title
+
+
+def _build(
+    source: type[BaseCase], target: type[BaseCase], use_cache: bool
+) -> Callable[[str], str]:
+    fast = _FAST_PATHS.get((source, target))
+    if fast is not None:
+        return fast
+
+    split = source._splitter()
+    join = target._joiner()
+
+    if not use_cache:
+
+        def convert(text: str) -> str:
+            return join(split(text))
+
+        return convert
+
+    def convert(text: str) -> str:
+        cache = _cache._active
+        if cache is None:
+            return join(split(text))
+        return cache.join(join, cache.split(split, text))
+
+    return convert
+
+
+@cache
+def _pipeline(source: type[BaseCase], target: type[BaseCase]) -> Callable[[str], str]:
+    """Build (once per pair) a function rendering ``source`` text as ``target``.
+
+    Registered fast paths win; every other pair goes through the generic
+    split → words → join pipeline, using the LRU cache when it is enabled.
+    """
+    return _build(source, target, True)
+
+
+@lru_cache(maxsize=64)
+def _interning(
+    convert: Callable[[str], str], intern: Callable[[str], str]
+) -> Callable[[str], str]:
+    def interned(text: str) -> str:
+        return intern(convert(text))
+
+    return interned
+
+
+@lru_cache(maxsize=64)
+def _capped(convert: Callable[[str], str], limit: int) -> Callable[[str], str]:
+    def capped(text: str) -> str:
+        if len(text) > limit:
+            raise _too_long(text, limit)
+        return convert(text)
+
+    return capped
+
+
+def _converter(source: type[BaseCase], target: type[BaseCase]) -> Callable[[str], str]:
+    """:func:`_pipeline`, wrapped to apply the length cap and interning if on.
+
+    The wrappers are memoized so that :func:`_rename_keys` keeps hitting its
+    cache across calls.
+    """
+    convert = _pipeline(source, target)
+    limit = _base._max_length
+    if limit is not None:
+        convert = _capped(convert, limit)
+    pool = _cache._pool
+    if pool is None:
+        return convert
+    return _interning(convert, pool.intern)
+
+
+def _keep_invalid(convert: Callable[[str], str]) -> Callable[[str], str]:
+    def safe(text: str) -> str:
+        try:
+            return convert(text)
+        except ValueError:
+            return text
+
+    return safe
+
+
+class Converter:
+    """A compiled ``source`` → ``target`` conversion; see :func:`compile`.
+
+    Calling it runs the compiled function directly. Like a plain function
+    held in a class attribute it binds nothing, so ``self.convert(text)``
+    works on instances.
+    """
+
+    __slots__ = ("func", "source", "target", "use_cache", "errors", "max_length")
+
+    def __init__(
+        self,
+        source: type[BaseCase],
+        target: type[BaseCase],
+        use_cache: bool = True,
+        errors: str = "raise",
+        max_length: int | None = None,
+    ):
+        if errors not in ("raise", "keep"):
+            raise ValueError(f"errors must be 'raise' or 'keep', not {errors!r}")
+        if max_length is not None and max_length < 0:
+            raise ValueError("max_length must be a non-negative integer or None")
+        convert = (
+            _pipeline(source, target) if use_cache else _build(source, target, False)
+        )
+        if max_length is not None:
+            convert = _capped(convert, max_length)
+        if errors == "keep":
+            convert = _keep_invalid(convert)
+        self.func: Callable[[str], str] = convert
+        self.source = source
+        self.target = target
+        self.use_cache = use_cache
+        self.errors = errors
+        self.max_length = max_length
+
+    def __call__(self, text: str) -> str:
+        return self.func(text)
+
+    def many(
+        self, items: Iterable[str], *, lazy: bool = False
+    ) -> list[str] | Iterator[str]:
+        """Convert every string in ``items``, like :func:`convert_many`."""
+        if lazy:
+            return map(self.func, items)
+        return list(map(self.func, items))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # rebuilt from the case classes: the compiled closure is not picklable
+        return Converter, (
+            self.source,
+            self.target,
+            self.use_cache,
+            self.errors,
+            self.max_length,
+        )
+
+    def __repr__(self) -> str:
+        return f"<Converter {self.source.__name__} -> {self.target.__name__}>"
+
+
+def compile(
+    source: type[BaseCase],
+    target: type[BaseCase],
+    *,
+    use_cache: bool = True,
+    errors: str = "raise",
+    max_length: int | None = None,
+) -> Converter:
+    """Precompute the conversion from ``source`` to ``target`` into a callable.
+
+    Class dispatch, fast-path lookup and the split/join functions are
+    resolved once; each call then runs only the string work and returns what
+    ``target(source(text)).get()`` would. Options:
+
+    - ``use_cache``: consult the LRU cache from
+      :func:`~magic_case.cache.enable_cache` (default). ``False`` skips even
+      the check for it.
+    - ``errors``: ``"raise"`` (default) raises ``ValueError`` for input that is
+      invalid in ``source`` case; ``"keep"`` returns such input unchanged.
+    - ``max_length``: reject longer input, before any scanning, as invalid
+      (so ``errors="keep"`` passes it through untouched). Defaults to the
+      cap from :func:`~magic_case.base.set_max_length` at compile time.
+
+    Converters are picklable (they are rebuilt from the case classes, which
+    must be importable) and can be sent to worker processes. Conversions
+    registered with :func:`register_conversion` after compiling are not
+    picked up by existing converters.
+
+    Example:
+        >>> to_header = compile(SnakeCase, HttpHeaderCase)
+        >>> to_header("content_type")
+        'Content-Type'
+    """
+    if max_length is None:
+        max_length = _base._max_length
+    return Converter(source, target, use_cache, errors, max_length)
+
+
+def convert_many(
+    items: Iterable[str],
+    source: type[BaseCase],
+    target: type[BaseCase],
+    *,
+    lazy: bool = False,
+) -> list[str] | Iterator[str]:
+    """Convert every string in ``items`` from ``source`` case to ``target`` case.
+
+    Produces the same output as ``target(source(item)).get()`` for each item
+    without creating intermediate case instances. With ``lazy=True`` an
+    iterator is returned instead of a list.
+
+    Example:
+        >>> convert_many(["hello_world", "foo_bar"], SnakeCase, CamelCase)
+        ['helloWorld', 'fooBar']
+    """
+    convert = _converter(source, target)
+    if lazy:
+        return map(convert, items)
+    return [convert(item) for item in items]
+
+
+# Dicts with more keys than this are renamed without caching their shape
+_SHAPE_LIMIT = 64
+
+
+# stack entry marking the point where a container's copy is complete
+_LEAVE = object()
+
+
+class _Uncached(Exception):
+    """Raised by :func:`_rename_keys` for shapes that must not be cached."""
+
+
+@lru_cache(maxsize=1024)
+def _rename_keys(
+    convert: Callable[[str], str], keys: tuple[str, ...], version: int
+) -> tuple[str, ...]:
+    """Map one dict shape (its key tuple) to its renamed keys, cached per shape.
+
+    ``version`` is the vocabulary version (:func:`vocab._version`) read before
+    renaming, so shapes renamed with an older vocabulary are never reused.
+
+    Only all-string shapes are cached: ``(1,)`` and ``(True,)`` are equal
+    tuples, so a cached non-string shape could hand back keys of the wrong
+    type. Those raise :class:`_Uncached`, which keeps them out of the cache.
+    """
+    if not all(isinstance(key, str) for key in keys):
+        raise _Uncached
+    return tuple(map(convert, keys))
+
+
+def _rename_any_keys(
+    convert: Callable[[str], str], keys: tuple[Any, ...], version: int
+) -> tuple[Any, ...]:
+    """Rename ``keys`` through the shape cache where possible."""
+    if len(keys) <= _SHAPE_LIMIT:
+        try:
+            return _rename_keys(convert, keys, version)
+        except _Uncached:
+            pass
+    return tuple(convert(key) if isinstance(key, str) else key for key in keys)
+
+
+def convert_keys(
+    obj: Any,
+    source: type[BaseCase],
+    target: type[BaseCase],
+    *,
+    inplace: bool = False,
+) -> Any:
+    """Rename every dict key in a nested dict/list payload from ``source`` to ``target``.
+
+    Values are left untouched and non-string keys are kept as they are. The
+    walk is iterative, so deeply nested payloads do not hit the recursion
+    limit, and the renamed keys of each distinct key set are cached because
+    payloads tend to repeat the same shapes. With ``inplace=True`` the dicts
+    in ``obj`` are rewritten instead of copied and ``obj`` itself is returned;
+    a container reachable more than once is rewritten once. Copying a
+    payload that contains itself raises ``ValueError``.
+
+    Example:
+        >>> convert_keys({"user_id": 1, "tags": [{"tag_name": "x"}]}, SnakeCase, CamelCase)
+        {'userId': 1, 'tags': [{'tagName': 'x'}]}
+    """
+    steps = _convert_keys_steps(obj, _converter(source, target), inplace, 0)
+    try:
+        next(steps)
+    except StopIteration as done:
+        return done.value
+    raise AssertionError("unreachable: convert_keys steps never pause")
+
+
+def _convert_keys_steps(
+    obj: Any, convert: Callable[[str], str], inplace: bool, budget: int
+) -> Generator[None, None, Any]:
+    """Walk behind :func:`convert_keys`, returning the converted payload.
+
+    With a positive ``budget`` the generator pauses (yields) after roughly
+    that many keys and list items, so async callers can give the event loop
+    a turn between chunks; with ``0`` it runs to completion in one step.
+    """
+    stack: list[tuple[Any, Any]] = []
+    # copy mode: ids of the containers enclosing the one being copied. That
+    # one (``parent``) joins them once it turns out to hold a container, and
+    # leaves when its ``_LEAVE`` entry, queued below what it holds, pops.
+    path: set[int] = set()
+    parent: Any = None
+
+    if inplace:
+        # ids of the containers already queued, so that one reachable twice
+        # (or from itself) is rewritten once
+        seen: set[int] = set()
+
+        def visit(value: Any) -> Any:
+            if isinstance(value, (dict, list)) and id(value) not in seen:
+                seen.add(id(value))
+                stack.append((value, value))
+            return value
+
+    else:
+
+        def visit(value: Any) -> Any:
+            nonlocal parent
+            if isinstance(value, dict):
+                copied: Any = {}
+            elif isinstance(value, list):
+                copied = []
+            else:
+                return value
+            if parent is not None:
+                path.add(id(parent))
+                stack.append((parent, _LEAVE))
+                parent = None
+            if id(value) in path:
+                raise ValueError("Circular reference detected")
+            stack.append((value, copied))
+            return copied
+
+    result = visit(obj)
+    left = budget
+    # read again after each pause, as the vocabulary may change meanwhile
+    version = _vocab._version()
+    while stack:
+        src, dst = stack.pop()
+        if dst is _LEAVE:
+            path.discard(id(src))
+            continue
+        if budget:
+            left -= len(src)
+            if left <= 0:
+                yield
+                left = budget
+                version = _vocab._version()
+        if src is not dst:
+            parent = src
+        if isinstance(src, dict):
+            keys = tuple(src)
+            renamed = _rename_any_keys(convert, keys, version)
+            values = [visit(value) for value in src.values()]
+            if src is dst:
+                if renamed == keys:
+                    continue
+                src.clear()
+            dst.update(zip(renamed, values))
+        elif src is not dst:
+            dst.extend(visit(value) for value in src)
+        else:
+            for value in src:
+                visit(value)
+    return result
@@ -0,0 +1,151 @@
+"""Infer the case of an identifier and parse it with the matching class."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from functools import cache
+from typing import Callable
+
+from .base import BaseCase
+from .camel import CamelCase
+from .camel_snake import CamelSnakeCase
+from .dot import DotCase
+from .flat import FlatCase
+from .http_header import HttpHeaderCase
+from .kebab import KebabCase
+from .macro import MacroCase
+from .pascal import PascalCase
+from .pascal_snake import PascalSnakeCase
+from .path import PathCase
+from .sentence import SentenceCase
+from .slash_title import SlashTitleCase
+from .snake import SnakeCase
+from .space import SpaceCase
+from .title import TitleCase
+from .tokenizer import HTTP_HEADER, PATH, fullmatch
+
+_SEPARATORS = frozenset("_-./ ")
+
+
+def _capitalized(parts: list[str]) -> bool:
+    return all(part[:1].isupper() for part in parts)
+
+
+def detect_case(text: str) -> type[BaseCase] | None:
+    """Return the case class ``text`` is written in, or ``None`` if unclear.
+
+    The input is scanned once to collect its distinct characters; the verdict
+    comes from which separators and letter cases appear, checked against the
+    header and path patterns where those are strict, so no class is tried and
+    no exception is raised. A returned class always accepts ``text``. Hungarian notation is indistinguishable from
+    camelCase and is reported as :class:`CamelCase`.
+
+    Examples:
+        - "user_id" -> SnakeCase
+        - "userId" -> CamelCase
+        - "Content-Type" -> HttpHeaderCase
+    """
+    if not text:
+        return None
+
+    chars = set(text)
+    separators = chars & _SEPARATORS
+    has_upper = has_lower = False
+    for char in chars - separators:
+        if char.isupper():
+            has_upper = True
+        elif char.islower():
+            has_lower = True
+
+    if len(separators) > 1:
+        return None
+
+    if not separators:
+        if has_upper and not has_lower:
+            return MacroCase
+        if not has_upper:
+            return FlatCase
+        first = text[0]
+        if first.islower():
+            return CamelCase
+        # titlecase digraphs (ǅ, ǈ...) start a PascalCase word too
+        if first.isupper() or first.istitle():
+            return PascalCase
+        # a digit or other non-letter first: neither camel nor Pascal
+        return None
+
+    (sep,) = separators
+    if sep == "_":
+        if not has_upper:
+            return SnakeCase
+        if not has_lower:
+            return MacroCase
+        return PascalSnakeCase if text[0].isupper() else CamelSnakeCase
+    if sep == "-":
+        if has_upper and fullmatch(HTTP_HEADER, text):
+            return HttpHeaderCase
+        return KebabCase
+    if sep == ".":
+        return DotCase
+    if sep == "/":
+        segments = text.split("/")
+        # both cases reject empty or blank segments ("a/", "/a", "a//b")
+        if not all(segment.strip() for segment in segments):
+            return None
+        if has_upper:
+            return SlashTitleCase
+        return PathCase if fullmatch(PATH, text) else None
+
+    # space separated
+    if not has_upper:
+        return SpaceCase
+    words = text.split()
+    if _capitalized(words):
+        return TitleCase if len(words) > 1 else SentenceCase
+    if text.lstrip()[:1].isupper():
+        return SentenceCase
+    return SpaceCase
+
+
+@cache
+def _splitter(case: type[BaseCase]) -> Callable[[str], list[str]]:
+    return case._splitter()
+
+
+@cache
+def _joiner(case: type[BaseCase]) -> Callable[[Sequence[str]], str]:
+    return case._joiner()
+
+
+class AnyCase(BaseCase):
+    """Parse text in whatever case it is written in.
+
+    ``words`` are exactly what the detected class would produce, ``case`` is
+    that class, and rendering gives the text back in the detected case.
+    """
+
+    __slots__ = ("case",)
+
+    case: type[BaseCase]
+
+    def __init__(self, text_or_obj: str | BaseCase):
+        if isinstance(text_or_obj, AnyCase):
+            self.case = text_or_obj.case
+        elif isinstance(text_or_obj, BaseCase):
+            self.case = type(text_or_obj)
+        elif isinstance(text_or_obj, str):
+            case = detect_case(text_or_obj)
+            if case is None:
+                raise ValueError(f"Cannot detect the case of → {text_or_obj}")
+            self.case = case
+        super().__init__(text_or_obj)
+
+    def _split_into_words(self, text: str) -> list[str]:
+        return _splitter(self.case)(text)
+
+    def _render(self) -> str:
+        return _joiner(self.case)(self._words)
+
+    @staticmethod
+    def _join_words(words: Sequence[str]) -> str:
+        raise TypeError("AnyCase can only render words it parsed itself")
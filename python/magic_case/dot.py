@@ -1,8 +1,14 @@
+from collections.abc import Sequence
+
 from .base import BaseCase
+from .tokenizer import split_lower
 
 
 class DotCase(BaseCase):
-    def _split_into_words(self, text: str) -> list[str]:
+    __slots__ = ()
+
+    @staticmethod
+    def _split_into_words(text: str) -> list[str]:
         """
         Splits a dot-separated string into its component words.
 
@@ -13,7 +19,8 @@ class DotCase(BaseCase):
         # Split on dot
         # This handles cases like "dot.case" -> ["dot", "case"]
         # and "example.test" -> ["example", "test"]
-        return text.lower().split(".")
+        return split_lower(text, ".")
 
-    def __str__(self) -> str:
-        return ".".join(self.words).lower()
+    @staticmethod
+    def _join_words(words: Sequence[str]) -> str:
+        return ".".join(words).lower()
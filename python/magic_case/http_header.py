@@ -1,10 +1,14 @@
-import re
+from collections.abc import Sequence
 
 from .base import BaseCase
+from .tokenizer import HTTP_HEADER, fullmatch
 
 
 class HttpHeaderCase(BaseCase):
-    def _split_into_words(self, text: str) -> list[str]:
+    __slots__ = ()
+
+    @staticmethod
+    def _split_into_words(text: str) -> list[str]:
         """
         Splits a string into words suitable for HTTP header capitalization.
         Must strictly match Http-Header-Case format.
@@ -13,15 +17,16 @@ class HttpHeaderCase(BaseCase):
             raise ValueError("Input cannot be empty")
 
         # Must strictly match: Word-Word-Word (each Word starts uppercase, then lowercase/digits)
-        if not re.fullmatch(r"(?:[A-Z][a-z0-9]*)(?:-[A-Z][a-z0-9]*)*", text):
+        if not fullmatch(HTTP_HEADER, text):
             raise ValueError(f"Invalid HttpHeaderCase string: {text}")
 
         # Split by hyphen and normalize internally
         return text.split("-")
 
-    def __str__(self) -> str:
+    @staticmethod
+    def _join_words(words: Sequence[str]) -> str:
         """
         Converts words back to HTTP Header Case (Title-Cased).
         Example: content-type -> Content-Type
         """
-        return "-".join(w.capitalize() for w in self.words)
+        return "-".join(w.capitalize() for w in words)
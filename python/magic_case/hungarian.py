@@ -1,15 +1,35 @@
-import re
-from typing import Optional
+from __future__ import annotations
+
+from collections.abc import Sequence
 
 from .base import BaseCase
+from .tokenizer import split_lower_upper
+from .vocab import DEFAULT_PREFIXES, PREFIXES
+
+# the built-in prefixes; add more with magic_case.add_prefixes()
+HUNGARIAN_PREFIXES = DEFAULT_PREFIXES
+
 
-HUNGARIAN_PREFIXES = ["str", "lst", "arr", "psz", "i", "b", "d", "f", "ch", "n", "p"]
+def _detect_prefix(text: str) -> str | None:
+    """Return the longest Hungarian prefix ``text`` starts with, if any."""
+    length = PREFIXES.longest_match(text)
+    return text[:length] if length else None
 
 
 class HungarianCase(BaseCase):
-    prefix: Optional[str] = None
+    __slots__ = ("prefix",)
+
+    prefix: str | None
+
+    def __init__(self, text_or_obj: str | BaseCase):
+        super().__init__(text_or_obj)
+        if isinstance(text_or_obj, str):
+            self.prefix = _detect_prefix(text_or_obj)
+        else:
+            self.prefix = None
 
-    def _split_into_words(self, text: str) -> list[str]:
+    @staticmethod
+    def _split_into_words(text: str) -> list[str]:
         """
         Split a Hungarian Notation variable into words.
         Example: 'strUserName' -> ['user', 'name']
@@ -17,29 +37,30 @@ class HungarianCase(BaseCase):
                 'lstScores' -> ['scores']
                 'bIsAdmin' -> ['is', 'admin']
         """
-        # Detect Hungarian prefix
-        self.prefix = None
-        for p in sorted(HUNGARIAN_PREFIXES, key=len, reverse=True):
-            if text.startswith(p):
-                self.prefix = p
-                text = text[len(p) :]  # remove prefix
-                break
+        # Detect and remove Hungarian prefix
+        prefix = _detect_prefix(text)
+        if prefix:
+            text = text[len(prefix) :]
 
-        # Now split CamelCase / PascalCase
-        words = re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", text).split()
+        # Now split CamelCase / PascalCase and normalize to lowercase
+        return split_lower_upper(text)
 
-        # Normalize to lowercase
-        return [w.lower() for w in words]
+    @staticmethod
+    def _join_words(words: Sequence[str]) -> str:
+        # Without a prefix, dont capitalize the first word
+        if not words:
+            return ""
+
+        [first, *rest] = words
+        return first + "".join(word.capitalize() for word in rest)
 
-    def __str__(self) -> str:
+    def _render(self) -> str:
         # Hungarian notation: strName, intCount, boolFlag
-        if not self.words:
+        if not self._words:
             return ""
 
         # If we have a prefix, append it and capitalize it words
         if self.prefix:
-            return self.prefix + "".join(word.capitalize() for word in self.words)
+            return self.prefix + "".join(word.capitalize() for word in self._words)
 
-        # else dont capitalize the first word
-        [first, *rest] = self.words
-        return first + "".join(word.capitalize() for word in rest)
+        return super()._render()
@@ -0,0 +1,157 @@
+"""Bidirectional index between canonical names and their case renderings.
+
+Reverse lookups cannot rely on parsing the rendered form: ``FlatCase`` drops
+word boundaries and ``SentenceCase``/``TitleCase`` lose the original letter
+case. A :class:`CaseIndex` renders a known vocabulary into every target case
+once and keeps hash maps in both directions, so either lookup is a dict
+access.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+from .base import BaseCase
+from .snake import SnakeCase
+
+
+class CaseIndex:
+    """Forward and reverse lookups between canonical names and target renderings.
+
+    ``names`` are written in ``source`` case (snake_case by default, as for
+    Python attributes) and rendered into each of ``targets``. Different names
+    can render to the same text in a target (``user_id`` and ``userid`` in
+    :class:`~magic_case.FlatCase`); such collisions are kept and reported by
+    :meth:`collisions`, and :meth:`lookup` refuses to pick one of them.
+
+    Example:
+        >>> index = CaseIndex([CamelCase, FlatCase], ["user_id", "userid"])
+        >>> index.lookup("userId", CamelCase)
+        'user_id'
+        >>> index.collisions(FlatCase)
+        {'userid': ['user_id', 'userid']}
+    """
+
+    __slots__ = ("source", "targets", "_forward", "_reverse", "_collisions")
+
+    def __init__(
+        self,
+        targets: Iterable[type[BaseCase]],
+        names: Iterable[str] = (),
+        *,
+        source: type[BaseCase] = SnakeCase,
+    ):
+        self.source = source
+        self.targets = tuple(dict.fromkeys(targets))
+        if not self.targets:
+            raise ValueError("CaseIndex needs at least one target case")
+        # target -> name -> rendering
+        self._forward: dict[type[BaseCase], dict[str, str]] = {
+            target: {} for target in self.targets
+        }
+        # target -> rendering -> names rendering to it, in insertion order
+        self._reverse: dict[type[BaseCase], dict[str, list[str]]] = {
+            target: {} for target in self.targets
+        }
+        # (target, rendering) pairs shared by several names
+        self._collisions: set[tuple[type[BaseCase], str]] = set()
+        self.update(names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __repr__(self) -> str:
+        targets = ", ".join(target.__name__ for target in self.targets)
+        return f"<CaseIndex {len(self)} names -> {targets}>"
+
+    @property
+    def _names(self) -> dict[str, str]:
+        # every target has an entry per name; the first one stands for all
+        return self._forward[self.targets[0]]
+
+    def add(self, name: str) -> None:
+        """Index ``name``; adding a name twice is a no-op.
+
+        Raises ``ValueError`` if ``name`` is not valid in the source case or
+        cannot be rendered in a target; the index is then left unchanged.
+        """
+        if name in self._names:
+            return
+        words = self.source._splitter()(name)
+        # render for every target before storing anything
+        renderings = [target._joiner()(words) for target in self.targets]
+        for target, rendered in zip(self.targets, renderings):
+            self._forward[target][name] = rendered
+            names = self._reverse[target].setdefault(rendered, [])
+            names.append(name)
+            if len(names) > 1:
+                self._collisions.add((target, rendered))
+
+    def update(self, names: Iterable[str]) -> None:
+        """Index each of ``names``."""
+        for name in names:
+            self.add(name)
+
+    def discard(self, name: str) -> None:
+        """Remove ``name`` if it is indexed."""
+        if name not in self._names:
+            return
+        for target in self.targets:
+            rendered = self._forward[target].pop(name)
+            names = self._reverse[target][rendered]
+            names.remove(name)
+            if not names:
+                del self._reverse[target][rendered]
+            elif len(names) == 1:
+                self._collisions.discard((target, rendered))
+
+    def render(self, name: str, target: type[BaseCase]) -> str:
+        """The rendering of indexed ``name`` in ``target``; ``KeyError`` if unknown."""
+        return self._forward[target][name]
+
+    def lookup_all(self, text: str, target: type[BaseCase]) -> list[str]:
+        """Every indexed name rendering to ``text`` in ``target``, oldest first."""
+        return list(self._reverse[target].get(text, ()))
+
+    def lookup(self, text: str, target: type[BaseCase]) -> str:
+        """The indexed name rendering to ``text`` in ``target``.
+
+        Raises ``KeyError`` if no name renders to ``text`` (or ``target`` is not
+        indexed) and ``ValueError`` if several do.
+        """
+        names = self._reverse[target][text]
+        if len(names) > 1:
+            raise ValueError(
+                f"{text!r} is ambiguous in {target.__name__}: "
+                f"{', '.join(map(repr, names))}"
+            )
+        return names[0]
+
+    def collisions(
+        self, target: type[BaseCase] | None = None
+    ) -> dict[str, list[str]] | dict[type[BaseCase], dict[str, list[str]]]:
+        """Renderings shared by several names.
+
+        For one ``target``: ``{rendering: names}``. Without one, the same
+        mapping per target that has collisions.
+        """
+        if target is not None:
+            return {
+                rendered: list(self._reverse[target][rendered])
+                for key, rendered in sorted(self._collisions, key=_collision_order)
+                if key is target
+            }
+        found: dict[type[BaseCase], dict[str, list[str]]] = {}
+        for key, rendered in sorted(self._collisions, key=_collision_order):
+            found.setdefault(key, {})[rendered] = list(self._reverse[key][rendered])
+        return found
+
+
+def _collision_order(collision: tuple[type[BaseCase], str]) -> tuple[str, str]:
+    return collision[0].__name__, collision[1]
@@ -0,0 +1,226 @@
+"""Rename the keys of JSON and JSON Lines documents without loading them.
+
+Input is consumed in chunks of bytes and tokenized just enough to tell
+object keys from everything else: keys are rewritten, every other byte
+(values, whitespace, separators) is copied through unchanged. Memory use is
+bounded by the chunk size plus the longest key, whatever the size of the
+document; strings that are values are streamed through however long they
+are.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Callable, Iterable, Iterator
+from functools import lru_cache, partial
+from typing import BinaryIO
+
+from . import base as _base
+from .base import BaseCase
+from .convert import Converter
+
+# Bytes of input read per chunk by convert_json_stream
+CHUNK_SIZE = 1 << 20
+
+# Longest key (in bytes) that may be split across chunks
+MAX_KEY_SIZE = 1 << 20
+
+# A complete string, a structural character, or the opening quote of a string
+# that does not end in this buffer. Colons are left out: in valid JSON they
+# only follow keys, after which no key is expected anyway.
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\],]|"')
+# The rest of a string after a chunk boundary, closing quote included
+_STRING_REST = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"')
+# Characters that cannot appear unescaped in a JSON string
+_NEEDS_ESCAPE = re.compile(r'[\x00-\x1f"\\]')
+
+_QUOTE, _COMMA = ord('"'), ord(",")
+_OPEN_OBJECT, _OPEN_ARRAY = ord("{"), ord("[")
+
+
+def _trailing_escape(data: bytes) -> bool:
+    """Whether ``data`` ends with a backslash that escapes the next byte."""
+    run = len(data) - len(data.rstrip(b"\\"))
+    return run % 2 == 1
+
+
+class KeyRewriter:
+    """Incremental key renamer: :meth:`feed` bytes in, get converted bytes out.
+
+    One instance handles one stream, which may hold one JSON document or any
+    number of them (JSON Lines). Renamed keys are memoized per instance, up
+    to ``cache_size`` distinct ones. ``errors`` is passed on to
+    :class:`~magic_case.convert.Converter`: ``"raise"`` fails on keys that
+    are invalid in ``source`` case, ``"keep"`` leaves them as they are.
+    """
+
+    def __init__(
+        self,
+        source: type[BaseCase],
+        target: type[BaseCase],
+        *,
+        errors: str = "raise",
+        cache_size: int = 4096,
+    ):
+        convert = Converter(source, target, errors=errors, max_length=_base._max_length)
+        self._start(lru_cache(maxsize=cache_size)(partial(_rename_key, convert)))
+
+    @classmethod
+    def _sharing(cls, rename: Callable[[bytes], bytes]) -> KeyRewriter:
+        """A rewriter renaming keys with ``rename``, for many short streams.
+
+        ``rename`` maps a quoted key to its quoted replacement, normally a
+        memoized :func:`_rename_key`, so that the streams share one cache.
+        """
+        rewriter = cls.__new__(cls)
+        rewriter._start(rename)
+        return rewriter
+
+    def _start(self, rename: Callable[[bytes], bytes]) -> None:
+        self._rename = rename
+        # open containers, as their opening byte
+        self._stack = bytearray()
+        # whether the next string is an object key
+        self._expect_key = False
+        # inside a string value that continues in the next chunk
+        self._in_string = False
+        # start of a key (or of an escape) that continues in the next chunk
+        self._carry = b""
+        self.keys = 0
+
+    def feed(self, data: bytes) -> bytes:
+        """Consume the next chunk of input and return the output ready so far."""
+        buffer = self._carry + data if self._carry else data
+        self._carry = b""
+        start = 0
+        if self._in_string:
+            match = _STRING_REST.match(buffer)
+            if match is None:
+                return self._string_tail(buffer, 0)
+            start = match.end()
+            self._in_string = False
+
+        pieces = []
+        last = 0
+        stack = self._stack
+        expect_key = self._expect_key
+        rename = self._rename
+        for match in _TOKEN.finditer(buffer, start):
+            token = match[0]
+            first = token[0]
+            if first == _QUOTE:
+                if len(token) == 1:
+                    # a string running past the end of this chunk
+                    self._expect_key = expect_key
+                    if not expect_key:
+                        pieces.append(self._string_tail(buffer, last))
+                        return b"".join(pieces)
+                    if len(buffer) - match.start() > MAX_KEY_SIZE:
+                        raise ValueError(f"JSON key longer than {MAX_KEY_SIZE} bytes")
+                    self._carry = buffer[match.start() :]
+                    pieces.append(buffer[last : match.start()])
+                    return b"".join(pieces)
+                if expect_key:
+                    pieces.append(buffer[last : match.start()])
+                    pieces.append(rename(token))
+                    last = match.end()
+                    self.keys += 1
+                    expect_key = False
+            elif first == _COMMA:
+                expect_key = bool(stack) and stack[-1] == _OPEN_OBJECT
+            elif first == _OPEN_OBJECT:
+                stack.append(first)
+                expect_key = True
+            elif first == _OPEN_ARRAY:
+                stack.append(first)
+                expect_key = False
+            else:
+                if stack:
+                    stack.pop()
+                expect_key = False
+        self._expect_key = expect_key
+        if not pieces:
+            return buffer
+        pieces.append(buffer[last:])
+        return b"".join(pieces)
+
+    def _string_tail(self, buffer: bytes, start: int) -> bytes:
+        """Output ``buffer[start:]``, which ends inside a string value."""
+        self._in_string = True
+        if _trailing_escape(buffer):
+            # keep the backslash with the byte it escapes
+            self._carry = buffer[-1:]
+            return buffer[start:-1]
+        return buffer[start:] if start else buffer
+
+    def close(self) -> None:
+        """Check that the input ended outside any string, object or array."""
+        if self._in_string or self._carry:
+            raise ValueError("JSON input ends inside a string")
+        if self._stack:
+            raise ValueError(
+                f"JSON input ends inside {len(self._stack)} unclosed object(s)/array(s)"
+            )
+
+
+def _rename_key(convert: Converter, token: bytes) -> bytes:
+    """Convert a quoted JSON key, returning it quoted."""
+    inner = token[1:-1]
+    if b"\\" in inner:
+        key = json.loads(token)
+    else:
+        key = inner.decode("utf-8")
+    renamed = convert(key)
+    if _NEEDS_ESCAPE.search(renamed):
+        return json.dumps(renamed, ensure_ascii=False).encode("utf-8")
+    return b'"' + renamed.encode("utf-8") + b'"'
+
+
+def iter_convert_json(
+    chunks: Iterable[bytes],
+    source: type[BaseCase],
+    target: type[BaseCase],
+    *,
+    errors: str = "raise",
+) -> Iterator[bytes]:
+    """Rename the object keys of JSON/JSON Lines arriving as byte ``chunks``.
+
+    Yields output chunks as input is consumed; joined, they are the input
+    with each key converted from ``source`` to ``target`` case and every
+    other byte unchanged. Raises ``ValueError`` at the end if the input is
+    truncated.
+    """
+    rewriter = KeyRewriter(source, target, errors=errors)
+    for chunk in chunks:
+        output = rewriter.feed(chunk)
+        if output:
+            yield output
+    rewriter.close()
+
+
+def convert_json_stream(
+    src: BinaryIO,
+    dst: BinaryIO,
+    source: type[BaseCase],
+    target: type[BaseCase],
+    *,
+    chunk_size: int = CHUNK_SIZE,
+    errors: str = "raise",
+) -> int:
+    """Copy JSON/JSON Lines from ``src`` to ``dst`` renaming object keys.
+
+    Both are binary files; ``src`` is read ``chunk_size`` bytes at a time.
+    Returns the number of keys renamed.
+
+    Example:
+        >>> with open("events.jsonl", "rb") as src, open("out.jsonl", "wb") as dst:
+        ...     convert_json_stream(src, dst, SnakeCase, CamelCase)
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer")
+    rewriter = KeyRewriter(source, target, errors=errors)
+    for chunk in iter(partial(src.read, chunk_size), b""):
+        dst.write(rewriter.feed(chunk))
+    rewriter.close()
+    return rewriter.keys
@@ -1,8 +1,14 @@
+from collections.abc import Sequence
+
 from .base import BaseCase
+from .tokenizer import split_lower
 
 
 class KebabCase(BaseCase):
-    def _split_into_words(self, text: str) -> list[str]:
+    __slots__ = ()
+
+    @staticmethod
+    def _split_into_words(text: str) -> list[str]:
         """Splits a kebab-case string into its constituent words.
 
         Args:
@@ -15,7 +21,8 @@ class KebabCase(BaseCase):
             - "kebab-case" -> ["kebab", "case"]
             - "example-text" -> ["example", "text"]
         """
-        return text.lower().split("-")
+        return split_lower(text, "-")
 
-    def __str__(self) -> str:
-        return "-".join(self.words).lower()
+    @staticmethod
+    def _join_words(words: Sequence[str]) -> str:
+        return "-".join(words).lower()
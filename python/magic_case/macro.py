@@ -1,14 +1,18 @@
+from collections.abc import Sequence
+
 from .base import BaseCase
+from .tokenizer import split_separators
 
 
 class MacroCase(BaseCase):
-    def _split_into_words(self, text: str) -> list[str]:
-        import re
+    __slots__ = ()
 
+    @staticmethod
+    def _split_into_words(text: str) -> list[str]:
         # Split on common separators: underscore, hyphen, dot, slash, backslash, space
-        words = re.split(r"[_\-\.,\/\\\s]+", text)
-        return [word.lower() for word in words if word.strip()]
+        return split_separators(text)
 
-    def __str__(self) -> str:
+    @staticmethod
+    def _join_words(words: Sequence[str]) -> str:
         # Macro case: HELLO_WORLD (same as SCREAMING_SNAKE_CASE)
-        return "_".join(word.upper() for word in self.words)
+        return "_".join(word.upper() for word in words)
@@ -0,0 +1,447 @@
+"""WSGI and ASGI middleware converting the keys of JSON bodies.
+
+Request bodies have their object keys converted from the ``client`` case to
+the ``server`` case before the application sees them, and response bodies
+from ``server`` back to ``client``. Bodies are checked with :mod:`json`, then
+their keys are rewritten in place by :class:`~magic_case.jsonstream.KeyRewriter`
+through a bounded cache shared by every request: every other byte, values
+and formatting included, is kept as it was.
+
+A body passes through untouched when it is not JSON (judged from the
+``Content-Type`` header alone, before any body is read), when it is
+compressed (``Content-Encoding``), when it is larger than ``max_body_size``
+bytes, or when it is not a UTF-8 JSON object or array under the strict
+rules of RFC 8259 (``NaN`` and ``Infinity`` are not JSON). Converted bodies
+are buffered whole so that ``Content-Length`` can be corrected.
+
+Keys longer than the :func:`~magic_case.base.set_max_length` cap count as
+invalid. With ``errors="keep"`` (the default) invalid keys are left as they
+are; with ``errors="raise"`` their ``ValueError`` propagates to the server,
+which answers with an error.
+
+Only the WSGI (PEP 3333) and ASGI 3 protocols are used; no web framework is
+required.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from functools import lru_cache, partial
+from itertools import chain, islice
+from typing import Any
+
+from . import base as _base
+from . import vocab as _vocab
+from .base import BaseCase
+from .camel import CamelCase
+from .convert import compile
+from .jsonstream import KeyRewriter, _rename_key
+from .snake import SnakeCase
+
+# Largest body, in bytes, that is buffered and converted by default
+MAX_BODY_SIZE = 1 << 20
+
+Message = dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+# Maps a quoted JSON key to the quoted converted key
+Rename = Callable[[bytes], bytes]
+
+
+def _reject_constant(name: str) -> Any:
+    raise ValueError(f"{name} is not valid JSON")
+
+
+def _is_json(content_type: str) -> bool:
+    """Whether a ``Content-Type`` value names JSON (``*/json`` or ``*+json``)."""
+    media = content_type.partition(";")[0].strip().lower()
+    return media.endswith(("/json", "+json"))
+
+
+class _Rekeyer:
+    """Settings and body conversion shared by both middleware flavours."""
+
+    def __init__(
+        self,
+        client: type[BaseCase],
+        server: type[BaseCase],
+        max_body_size: int,
+        errors: str,
+        cache_size: int,
+    ):
+        if max_body_size < 0:
+            raise ValueError("max_body_size must be a non-negative integer")
+        if errors not in ("raise", "keep"):
+            raise ValueError(f"errors must be 'raise' or 'keep', not {errors!r}")
+        self.client = client
+        self.server = server
+        self.max_body_size = max_body_size
+        self.errors = errors
+        self.cache_size = cache_size
+        # (settings they were built for, request renamer, response renamer)
+        self._renames: tuple[tuple[int, int | None], Rename, Rename] | None = None
+
+    def _current_renames(self) -> tuple[Rename, Rename]:
+        """The key renamers per direction, for the current settings.
+
+        Each renames keys through one bounded cache shared by every request.
+        The renamers are rebuilt, with empty caches, when the vocabulary or
+        the :func:`~magic_case.base.set_max_length` cap has changed.
+        """
+        settings = (_vocab._version(), _base._max_length)
+        renames = self._renames
+        if renames is not None and renames[0] == settings:
+            return renames[1], renames[2]
+        to_server = compile(self.client, self.server, errors=self.errors)
+        to_client = compile(self.server, self.client, errors=self.errors)
+        request = lru_cache(maxsize=self.cache_size)(partial(_rename_key, to_server))
+        response = lru_cache(maxsize=self.cache_size)(partial(_rename_key, to_client))
+        # swapped as one tuple, so threads never mix renamers of two settings
+        self._renames = (settings, request, response)
+        return request, response
+
+    @staticmethod
+    def _convert(body: bytes, rename: Rename) -> bytes | None:
+        """``body`` with its keys converted, or ``None`` if it is not convertible.
+
+        Anything but a JSON object or array, such as the empty body of a
+        response to ``HEAD``, comes back as ``None`` so that it is left alone.
+        """
+        if not body or json.detect_encoding(body) not in ("utf-8", "utf-8-sig"):
+            return None
+        try:
+            # numbers stay text: they are only checked, never converted
+            data = json.loads(
+                body, parse_int=str, parse_float=str, parse_constant=_reject_constant
+            )
+        except ValueError:
+            return None
+        if not isinstance(data, (dict, list)):
+            return None
+        # the body is valid JSON, so a ValueError here is an invalid key's
+        # (errors="raise") and goes to the caller
+        return KeyRewriter._sharing(rename).feed(body)
+
+    def convert_request(self, body: bytes) -> bytes | None:
+        return self._convert(body, self._current_renames()[0])
+
+    def convert_response(self, body: bytes) -> bytes | None:
+        return self._convert(body, self._current_renames()[1])
+
+    def fits(self, length: str | None) -> bool:
+        """Whether a declared ``Content-Length`` is within the size threshold."""
+        if length is None:
+            return True
+        try:
+            return int(length) <= self.max_body_size
+        except ValueError:
+            return False
+
+
+class WSGIMiddleware(_Rekeyer):
+    """Wrap a WSGI application to convert JSON body keys in both directions.
+
+    Example:
+        >>> app = WSGIMiddleware(app, client=CamelCase, server=SnakeCase)
+
+    Requests are converted only when they declare a ``Content-Length``, as
+    PEP 3333 requires for reading the body.
+    """
+
+    def __init__(
+        self,
+        app: Callable[..., Iterable[bytes]],
+        *,
+        client: type[BaseCase] = CamelCase,
+        server: type[BaseCase] = SnakeCase,
+        max_body_size: int = MAX_BODY_SIZE,
+        errors: str = "keep",
+        cache_size: int = 4096,
+    ):
+        super().__init__(client, server, max_body_size, errors, cache_size)
+        self.app = app
+
+    def __call__(
+        self, environ: dict[str, Any], start_response: Callable[..., Any]
+    ) -> Iterable[bytes]:
+        if (
+            _is_json(environ.get("CONTENT_TYPE", ""))
+            and not environ.get("HTTP_CONTENT_ENCODING")
+            and environ.get("CONTENT_LENGTH")
+            and self.fits(environ["CONTENT_LENGTH"])
+        ):
+            self._rekey_request(environ)
+
+        response = _WSGIResponse(self, start_response)
+        result = self.app(environ, response.start_response)
+        return response.finish(result)
+
+    def _rekey_request(self, environ: dict[str, Any]) -> None:
+        length = int(environ["CONTENT_LENGTH"])
+        body = environ["wsgi.input"].read(length)
+        converted = self.convert_request(body)
+        if converted is None:
+            converted = body
+        environ["wsgi.input"] = io.BytesIO(converted)
+        environ["CONTENT_LENGTH"] = str(len(converted))
+
+
+class _WSGIResponse:
+    """Holds back a JSON response until its body is complete and converted."""
+
+    def __init__(self, middleware: WSGIMiddleware, start_response: Callable[..., Any]):
+        self.middleware = middleware
+        self._start_response = start_response
+        # status, headers and exc_info held back, or None if passed on
+        self.held: tuple[str, list[tuple[str, str]], Any] | None = None
+        self.started = False
+        self.written: list[bytes] = []
+
+    def start_response(
+        self, status: str, headers: list[tuple[str, str]], exc_info: Any = None
+    ) -> Callable[[bytes], Any]:
+        self.started = True
+        content_type = length = None
+        for name, value in headers:
+            lowered = name.lower()
+            if lowered == "content-type":
+                content_type = value
+            elif lowered == "content-length":
+                length = value
+            elif lowered == "content-encoding":
+                content_type = None
+                break
+        if (
+            exc_info is None
+            and content_type is not None
+            and _is_json(content_type)
+            and self.middleware.fits(length)
+        ):
+            self.held = (status, headers, exc_info)
+            # legacy write() calls are buffered with the rest of the body
+            return self.written.append
+        self.held = None
+        return self._start_response(status, headers, exc_info)
+
+    def finish(self, result: Iterable[bytes]) -> Iterable[bytes]:
+        if self.started and self.held is None:
+            return result
+        chunks = iter(result)
+        try:
+            # generator applications call start_response on first iteration
+            head = [] if self.started else list(islice(chunks, 1))
+            if self.held is None:
+                return _Closing(chain(head, chunks), result)
+            buffered = self.written + head
+            size = sum(map(len, buffered))
+            limit = self.middleware.max_body_size
+            for chunk in chunks:
+                buffered.append(chunk)
+                size += len(chunk)
+                if size > limit:
+                    return self._pass_through(buffered, chunks, result)
+        except BaseException:
+            _close(result)
+            raise
+        _close(result)
+
+        status, headers, exc_info = self.held
+        body = b"".join(buffered)
+        converted = self.middleware.convert_response(body)
+        if converted is not None:
+            body = converted
+            headers = [(k, v) for k, v in headers if k.lower() != "content-length"]
+            headers.append(("Content-Length", str(len(body))))
+        self._start_response(status, headers, exc_info)
+        return [body]
+
+    def _pass_through(
+        self, buffered: list[bytes], chunks: Iterator[bytes], result: Iterable[bytes]
+    ) -> Iterable[bytes]:
+        assert self.held is not None
+        self._start_response(*self.held)
+        return _Closing(chain(buffered, chunks), result)
+
+
+def _close(result: Iterable[bytes]) -> None:
+    close = getattr(result, "close", None)
+    if close is not None:
+        close()
+
+
+class _Closing:
+    """An iterable that closes the application's result when it is closed."""
+
+    def __init__(self, chunks: Iterator[bytes], result: Iterable[bytes]):
+        self.chunks = chunks
+        self.result = result
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self.chunks
+
+    def close(self) -> None:
+        _close(self.result)
+
+
+class ASGIMiddleware(_Rekeyer):
+    """Wrap an ASGI 3 application to convert JSON body keys in both directions.
+
+    Example:
+        >>> app = ASGIMiddleware(app, client=CamelCase, server=SnakeCase)
+
+    Only ``http`` connections are touched; other scopes go straight to the
+    application. A request body with no ``Content-Length`` is read up to
+    ``max_body_size`` bytes before giving up and replaying it untouched.
+    """
+
+    def __init__(
+        self,
+        app: Callable[[Message, Receive, Send], Awaitable[None]],
+        *,
+        client: type[BaseCase] = CamelCase,
+        server: type[BaseCase] = SnakeCase,
+        max_body_size: int = MAX_BODY_SIZE,
+        errors: str = "keep",
+        cache_size: int = 4096,
+    ):
+        super().__init__(client, server, max_body_size, errors, cache_size)
+        self.app = app
+
+    async def __call__(self, scope: Message, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        content_type, length, encoded = _asgi_headers(scope["headers"])
+        if (
+            content_type is not None
+            and _is_json(content_type)
+            and not encoded
+            and self.fits(length)
+        ):
+            scope, receive = await self._rekey_request(scope, receive)
+        await self.app(scope, receive, _ASGIResponse(self, send).send)
+
+    async def _rekey_request(
+        self, scope: Message, receive: Receive
+    ) -> tuple[Message, Receive]:
+        pending: list[Message] = []
+        chunks: list[bytes] = []
+        size = 0
+        while True:
+            message = await receive()
+            pending.append(message)
+            if message["type"] != "http.request":
+                return scope, _replay(pending, receive)
+            chunks.append(message.get("body", b""))
+            size += len(chunks[-1])
+            if size > self.max_body_size:
+                return scope, _replay(pending, receive)
+            if not message.get("more_body", False):
+                break
+
+        converted = self.convert_request(b"".join(chunks))
+        if converted is None:
+            return scope, _replay(pending, receive)
+        headers = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name != b"content-length"
+        ]
+        headers.append((b"content-length", str(len(converted)).encode("latin-1")))
+        message = {"type": "http.request", "body": converted, "more_body": False}
+        return {**scope, "headers": headers}, _replay([message], receive)
+
+
+def _asgi_headers(
+    headers: Iterable[tuple[bytes, bytes]],
+) -> tuple[str | None, str | None, bool]:
+    """``Content-Type``, ``Content-Length`` and whether a content encoding is set."""
+    content_type = length = None
+    encoded = False
+    for name, value in headers:
+        if name == b"content-type":
+            content_type = value.decode("latin-1")
+        elif name == b"content-length":
+            length = value.decode("latin-1")
+        elif name == b"content-encoding":
+            encoded = True
+    return content_type, length, encoded
+
+
+def _replay(messages: list[Message], receive: Receive) -> Receive:
+    """A ``receive`` returning ``messages`` first, then reading from ``receive``."""
+    queue = iter(messages)
+
+    async def replay() -> Message:
+        for message in queue:
+            return message
+        return await receive()
+
+    return replay
+
+
+class _ASGIResponse:
+    """Holds back a JSON response until its body is complete and converted."""
+
+    def __init__(self, middleware: ASGIMiddleware, send: Send):
+        self.middleware = middleware
+        self._send = send
+        self.start: Message | None = None
+        self.chunks: list[bytes] = []
+        self.size = 0
+        # whether messages are being held back for conversion
+        self.holding = False
+
+    async def send(self, message: Message) -> None:
+        kind = message["type"]
+        if kind == "http.response.start":
+            content_type, length, encoded = _asgi_headers(message.get("headers", ()))
+            self.holding = (
+                content_type is not None
+                and _is_json(content_type)
+                and not encoded
+                and self.middleware.fits(length)
+            )
+            if self.holding:
+                self.start = message
+                return
+        elif kind == "http.response.body" and self.holding:
+            self.chunks.append(message.get("body", b""))
+            self.size += len(self.chunks[-1])
+            if self.size > self.middleware.max_body_size:
+                await self._flush(message.get("more_body", False))
+            elif not message.get("more_body", False):
+                await self._finish()
+            return
+        await self._send(message)
+
+    async def _flush(self, more_body: bool) -> None:
+        """Send what was held back untouched and stop holding."""
+        assert self.start is not None
+        self.holding = False
+        await self._send(self.start)
+        body = b"".join(self.chunks)
+        self.chunks.clear()
+        await self._send(
+            {"type": "http.response.body", "body": body, "more_body": more_body}
+        )
+
+    async def _finish(self) -> None:
+        assert self.start is not None
+        converted = self.middleware.convert_response(b"".join(self.chunks))
+        if converted is None:
+            await self._flush(False)
+            return
+        self.holding = False
+        headers = [
+            (name, value)
+            for name, value in self.start.get("headers", ())
+            if name != b"content-length"
+        ]
+        headers.append((b"content-length", str(len(converted)).encode("latin-1")))
+        await self._send({**self.start, "headers": headers})
+        await self._send(
+            {"type": "http.response.body", "body": converted, "more_body": False}
+        )
@@ -0,0 +1,170 @@
+"""Parallel batch conversion across a process or thread pool.
+
+Conversion keeps no per-call state outside its arguments: case classes only
+read module-level configuration (the acronym/prefix vocabulary, registered
+fast paths), and the optional LRU cache and interning pool are safe to share
+between threads. Threads therefore need no locking of their own, and on
+free-threaded CPython builds they run conversions in parallel.
+
+Worker processes started with the "spawn" or "forkserver" method (the
+default outside Linux) begin from a fresh import and do not see
+configuration changed at runtime. Pools created here by
+:func:`convert_parallel` and :func:`~magic_case.rename.rename_tree` are
+therefore initialized with this process's acronyms, Hungarian prefixes and
+:func:`~magic_case.base.set_max_length` cap. A pool passed in as
+``executor`` is not; create it with ``initializer=_init_worker`` and
+``initargs=_worker_state()`` to get the same. Conversions registered with
+:func:`~magic_case.convert.register_conversion` are never passed on.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from itertools import islice
+
+from . import base as _base
+from . import vocab as _vocab
+from .base import BaseCase
+from .convert import convert_many
+
+
+def _worker_state() -> tuple[list[str], list[str], int | None]:
+    """Runtime configuration for :func:`_init_worker`, as picklable values."""
+    return list(_vocab.ACRONYMS), list(_vocab.PREFIXES), _base._max_length
+
+
+def _init_worker(
+    acronyms: list[str], prefixes: list[str], max_length: int | None
+) -> None:
+    """Process pool initializer adopting the parent's :func:`_worker_state`."""
+    for trie, words in ((_vocab.ACRONYMS, acronyms), (_vocab.PREFIXES, prefixes)):
+        for word in set(trie).difference(words):
+            trie.discard(word)
+        for word in words:
+            trie.add(word)
+    _base.set_max_length(max_length)
+
+
+def _convert_chunk(
+    chunk: list[str], source: type[BaseCase], target: type[BaseCase]
+) -> list[str]:
+    return convert_many(chunk, source, target)
+
+
+def _chunks(items: Iterable[str], chunksize: int) -> Iterator[list[str]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _iter_parallel(
+    items: Iterable[str],
+    source: type[BaseCase],
+    target: type[BaseCase],
+    executor: Executor,
+    chunksize: int,
+    window: int,
+) -> Iterator[str]:
+    pending: deque[Future[list[str]]] = deque()
+    for chunk in _chunks(items, chunksize):
+        pending.append(executor.submit(_convert_chunk, chunk, source, target))
+        if len(pending) >= window:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+def convert_parallel(
+    items: Iterable[str],
+    source: type[BaseCase],
+    target: type[BaseCase],
+    *,
+    workers: int | None = None,
+    chunksize: int = 10_000,
+    executor: Executor | None = None,
+    lazy: bool = False,
+) -> list[str] | Iterator[str]:
+    """Convert ``items`` like :func:`convert_many`, spread over worker processes.
+
+    Items are sent in chunks of ``chunksize`` so pickling cost is paid per
+    chunk rather than per string, and results come back in input order. At
+    most ``2 * workers`` chunks are in flight, so huge iterables are consumed
+    incrementally. Pass ``executor`` to reuse an existing pool; otherwise one
+    with ``workers`` processes (default: CPU count) is created for the call,
+    initialized with the current vocabulary and length cap. Case classes
+    must be importable by the workers (no locally defined subclasses).
+    """
+    if chunksize <= 0:
+        raise ValueError("chunksize must be a positive integer")
+
+    window = 2 * (workers or os.cpu_count() or 1)
+    if executor is not None:
+        results = _iter_parallel(items, source, target, executor, chunksize, window)
+        return results if lazy else list(results)
+
+    def run() -> Iterator[str]:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=_worker_state()
+        ) as pool:
+            yield from _iter_parallel(items, source, target, pool, chunksize, window)
+
+    return run() if lazy else list(run())
+
+
+def _gil_enabled() -> bool:
+    """Whether the running interpreter serializes threads with the GIL."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled() if is_gil_enabled is not None else True
+
+
+def convert_threaded(
+    items: Iterable[str],
+    source: type[BaseCase],
+    target: type[BaseCase],
+    *,
+    workers: int | None = None,
+    chunksize: int = 2_000,
+    executor: Executor | None = None,
+    lazy: bool = False,
+) -> list[str] | Iterator[str]:
+    """Convert ``items`` like :func:`convert_many`, spread over threads.
+
+    The thread-pool counterpart of :func:`convert_parallel`: nothing is
+    pickled, so chunks can be small and locally defined case classes work.
+    Only free-threaded CPython builds run the threads in parallel; with the
+    GIL, ``workers`` defaults to 1, which converts in the calling thread.
+    Otherwise it defaults to the CPU count. Pass ``executor`` to reuse an
+    existing pool. Results come back in input order, with at most
+    ``2 * workers`` chunks in flight.
+    """
+    if chunksize <= 0:
+        raise ValueError("chunksize must be a positive integer")
+    if workers is None:
+        workers = 1 if _gil_enabled() else os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError("workers must be a positive integer")
+
+    window = 2 * workers
+    if executor is not None:
+        results = _iter_parallel(items, source, target, executor, chunksize, window)
+        return results if lazy else list(results)
+    if workers == 1:
+        return convert_many(items, source, target, lazy=lazy)
+
+    def run() -> Iterator[str]:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield from _iter_parallel(items, source, target, pool, chunksize, window)
+
+    return run() if lazy else list(run())
@@ -1,14 +1,19 @@
-import re
+from collections.abc import Sequence
 
 from .base import BaseCase
+from .tokenizer import split_humps
 
 
 class PascalCase(BaseCase):
-    def _split_into_words(self, text: str) -> list[str]:
+    __slots__ = ()
+
+    @staticmethod
+    def _split_into_words(text: str) -> list[str]:
         if not text:
             raise ValueError("Input cannot be empty")
 
-        if not text[0].isupper():
+        # titlecase digraphs (ǅ, ǈ...) count as uppercase
+        if not (text[0].isupper() or text[0].istitle()):
             raise ValueError(
                 f"Invalid PascalCase: must start with an uppercase letter → {text}"
             )
@@ -16,8 +21,8 @@ class PascalCase(BaseCase):
         # Regex handles:
         # - lowercase→uppercase: MyClass → My Class
         # - acronym→word: HTTPServer → HTTP Server
-        pattern = r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])"
-        return re.split(pattern, text)
+        return split_humps(text)
 
-    def __str__(self) -> str:
-        return "".join(w.capitalize() for w in self.words)
+    @staticmethod
+    def _join_words(words: Sequence[str]) -> str:
+        return "".join(w.capitalize() for w in words)
@@ -1,16 +1,21 @@
-import re
+from collections.abc import Sequence
 
 from .base import BaseCase
+from .tokenizer import PATH, fullmatch
 
 
 class PathCase(BaseCase):
-    def _split_into_words(self, text: str) -> list[str]:
+    __slots__ = ()
+
+    @staticmethod
+    def _split_into_words(text: str) -> list[str]:
         # Must strictly match: lowercase words separated by `/`
-        if not re.fullmatch(r"(?:[a-z0-9]+)(?:/[a-z0-9]+)*", text):
+        if not fullmatch(PATH, text):
             raise ValueError(f"Invalid PathCase string: {text}")
 
         return text.split("/")
 
-    def __str__(self) -> str:
+    @staticmethod
+    def _join_words(words: Sequence[str]) -> str:
         # Join normalized words with slash
-        return "/".join(self.words)
+        return "/".join(words)
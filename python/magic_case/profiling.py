@@ -0,0 +1,382 @@
+"""Opt-in per-class, per-phase call counters and timers.
+
+While profiling is enabled, the hooks of every case class are replaced by
+timing wrappers that count calls, add up elapsed time and build a histogram
+of input lengths for each (class, phase):
+
+- ``init``: constructing an instance (validation and splitting included),
+- ``split``: ``_split_into_words``,
+- ``render``: rendering an instance with ``str()`` (joining included),
+- ``join``: ``_join_words``,
+- ``fast``: a registered fast path of ``convert_many``/``convert_keys``,
+  recorded as ``"Source->Target"``.
+
+Times are inclusive, so nested phases are counted in both. Disabling puts
+the original functions back, so profiling costs nothing when it is off.
+Converters made with :func:`~magic_case.compile` before profiling was
+enabled (or disabled) keep the functions they were compiled with.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+from collections import namedtuple
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import cache, wraps
+from time import perf_counter_ns
+from typing import Any
+
+from .base import BaseCase
+
+# Upper bounds of the input-length histogram buckets; longer inputs land in
+# one last overflow bucket
+LENGTH_BUCKETS = (0, 1, 3, 7, 15, 31, 63, 127, 255, 511, 1023)
+
+PhaseStats = namedtuple("PhaseStats", ["calls", "seconds", "length_sum", "lengths"])
+
+# (case name, phase) -> stats
+Snapshot = dict[tuple[str, str], PhaseStats]
+Sink = Callable[[Snapshot], None]
+
+
+class _Counter:
+    __slots__ = ("calls", "ns", "length_sum", "lengths")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.ns = 0
+        self.length_sum = 0
+        self.lengths = [0] * (len(LENGTH_BUCKETS) + 1)
+
+
+class _Session:
+    def __init__(self, sinks: list[Sink]):
+        self.sinks = sinks
+        self.counters: dict[tuple[str, str], _Counter] = {}
+        self.lock = threading.Lock()
+        # (owner, attribute, original value) to restore on disable
+        self.patched: list[tuple[Any, Any, Any]] = []
+
+    def counter(self, name: str, phase: str) -> _Counter:
+        return self.counters.setdefault((name, phase), _Counter())
+
+    def record(self, counter: _Counter, ns: int, length: int) -> None:
+        bucket = min(length.bit_length(), len(LENGTH_BUCKETS))
+        with self.lock:
+            counter.calls += 1
+            counter.ns += ns
+            counter.length_sum += length
+            counter.lengths[bucket] += 1
+
+    def snapshot(self) -> Snapshot:
+        with self.lock:
+            return {
+                key: PhaseStats(c.calls, c.ns / 1e9, c.length_sum, tuple(c.lengths))
+                for key, c in self.counters.items()
+                if c.calls
+            }
+
+
+_session: _Session | None = None
+
+
+def _text_length(args: tuple[Any, ...]) -> int:
+    return len(args[-1])
+
+
+def _words_length(args: tuple[Any, ...]) -> int:
+    return sum(map(len, args[-1]))
+
+
+def _init_length(args: tuple[Any, ...]) -> int:
+    value = args[-1]
+    if isinstance(value, BaseCase):
+        return sum(map(len, value._words))
+    return len(value) if isinstance(value, str) else 0
+
+
+def _rendered_length(args: tuple[Any, ...]) -> int:
+    return sum(map(len, args[0]._words))
+
+
+@cache
+def _owner(cls: type, attribute: str) -> type:
+    """The class in ``cls``'s MRO that defines ``attribute``."""
+    return next(klass for klass in cls.__mro__ if attribute in vars(klass))
+
+
+def _timed(
+    session: _Session,
+    func: Callable[..., Any],
+    counter: _Counter,
+    length: Callable[[tuple[Any, ...]], int],
+) -> Callable[..., Any]:
+    record = session.record
+
+    @wraps(func)
+    def timed(*args: Any) -> Any:
+        start = perf_counter_ns()
+        try:
+            return func(*args)
+        finally:
+            record(counter, perf_counter_ns() - start, length(args))
+
+    return timed
+
+
+def _timed_method(
+    session: _Session,
+    func: Callable[..., Any],
+    cls: type,
+    attribute: str,
+    phase: str,
+    length: Callable[[tuple[Any, ...]], int],
+) -> Callable[..., Any]:
+    """Time a method that subclasses extend through ``super()``, once per call.
+
+    Only the wrapper of the most derived definition records, under the name
+    of the instance's class.
+    """
+    record = session.record
+    counter = session.counter
+
+    @wraps(func)
+    def timed(self: Any, *args: Any) -> Any:
+        if _owner(type(self), attribute) is not cls:
+            return func(self, *args)
+        start = perf_counter_ns()
+        try:
+            return func(self, *args)
+        finally:
+            record(
+                counter(type(self).__name__, phase),
+                perf_counter_ns() - start,
+                length((self, *args)),
+            )
+
+    return timed
+
+
+def _case_classes() -> Iterator[type[BaseCase]]:
+    stack: list[type[BaseCase]] = [BaseCase]
+    seen = set()
+    while stack:
+        cls = stack.pop()
+        if cls not in seen:
+            seen.add(cls)
+            yield cls
+            stack.extend(cls.__subclasses__())
+
+
+def _patch(session: _Session, owner: Any, attribute: Any, value: Any) -> None:
+    if isinstance(owner, dict):
+        session.patched.append((owner, attribute, owner[attribute]))
+        owner[attribute] = value
+    else:
+        session.patched.append((owner, attribute, vars(owner)[attribute]))
+        setattr(owner, attribute, value)
+
+
+def _install(session: _Session) -> None:
+    for cls in _case_classes():
+        for attribute, phase, length in (
+            ("__init__", "init", _init_length),
+            ("_render", "render", _rendered_length),
+        ):
+            if attribute in vars(cls):
+                func = vars(cls)[attribute]
+                timed = _timed_method(session, func, cls, attribute, phase, length)
+                _patch(session, cls, attribute, timed)
+        if cls is BaseCase:
+            continue
+        for attribute, phase, length in (
+            ("_split_into_words", "split", _text_length),
+            ("_join_words", "join", _words_length),
+        ):
+            if attribute not in vars(cls):
+                continue
+            value = vars(cls)[attribute]
+            func = value.__func__ if isinstance(value, staticmethod) else value
+            timed = _timed(session, func, session.counter(cls.__name__, phase), length)
+            _patch(
+                session,
+                cls,
+                attribute,
+                staticmethod(timed) if isinstance(value, staticmethod) else timed,
+            )
+
+    convert = sys.modules.get("magic_case.convert")
+    if convert is not None:
+        for (source, target), func in list(convert._FAST_PATHS.items()):
+            name = f"{source.__name__}->{target.__name__}"
+            counter = session.counter(name, "fast")
+            timed = _timed(session, func, counter, _text_length)
+            _patch(session, convert._FAST_PATHS, (source, target), timed)
+
+
+def _forget_compiled() -> None:
+    """Drop memoized pipelines so they pick up the current functions.
+
+    The user's split/render cache is left alone: its entries are keyed by
+    the function, so the timed wrappers never hit entries of the originals
+    and the originals find theirs again once profiling stops.
+    """
+    convert = sys.modules.get("magic_case.convert")
+    if convert is not None:
+        convert._pipeline.cache_clear()
+        convert._rename_keys.cache_clear()
+    detect = sys.modules.get("magic_case.detect")
+    if detect is not None:
+        detect._splitter.cache_clear()
+        detect._joiner.cache_clear()
+
+
+def enable_profiling(sink: Sink | None = None) -> None:
+    """Start recording; ``sink`` receives the snapshot on :func:`disable_profiling`.
+
+    Raises ``RuntimeError`` if profiling is already enabled.
+    """
+    global _session
+    if _session is not None:
+        raise RuntimeError("profiling is already enabled")
+    session = _Session([sink] if sink is not None else [])
+    _install(session)
+    _forget_compiled()
+    _session = session
+
+
+def disable_profiling() -> Snapshot:
+    """Stop recording, restore the original functions and return the snapshot.
+
+    The snapshot is also passed to the sinks. Returns an empty snapshot if
+    profiling was not enabled.
+    """
+    global _session
+    session = _session
+    if session is None:
+        return {}
+    _session = None
+    for owner, attribute, original in reversed(session.patched):
+        if isinstance(owner, dict):
+            owner[attribute] = original
+        else:
+            setattr(owner, attribute, original)
+    _forget_compiled()
+    snapshot = session.snapshot()
+    for sink in session.sinks:
+        sink(snapshot)
+    return snapshot
+
+
+def profiling_snapshot() -> Snapshot:
+    """The counters recorded so far, or an empty snapshot when disabled."""
+    session = _session
+    return session.snapshot() if session is not None else {}
+
+
+@contextmanager
+def profile(sink: Sink | None = None) -> Iterator[MemorySink]:
+    """Profile the ``with`` block; the yielded sink holds the snapshot afterwards.
+
+    Example:
+        >>> with profile() as result:
+        ...     convert_many(names, CamelCase, SnakeCase)
+        >>> result.last[("CamelCase", "split")].calls
+        1000
+    """
+    memory = MemorySink()
+    enable_profiling(sink)
+    assert _session is not None
+    _session.sinks.append(memory)
+    try:
+        yield memory
+    finally:
+        disable_profiling()
+
+
+class MemorySink:
+    """Keeps every snapshot it receives; ``last`` is the latest one."""
+
+    def __init__(self) -> None:
+        self.snapshots: list[Snapshot] = []
+
+    def __call__(self, snapshot: Snapshot) -> None:
+        self.snapshots.append(snapshot)
+
+    @property
+    def last(self) -> Snapshot:
+        return self.snapshots[-1] if self.snapshots else {}
+
+
+class LoggingSink:
+    """Logs one line per (class, phase), slowest first."""
+
+    def __init__(
+        self, logger: logging.Logger | None = None, level: int = logging.INFO
+    ) -> None:
+        self.logger = logger or logging.getLogger("magic_case.profiling")
+        self.level = level
+
+    def __call__(self, snapshot: Snapshot) -> None:
+        ranked = sorted(snapshot.items(), key=lambda item: -item[1].seconds)
+        for (name, phase), stats in ranked:
+            self.logger.log(
+                self.level,
+                "%s %s: %d calls, %.3f ms, %.0f ns/call, mean length %.1f",
+                name,
+                phase,
+                stats.calls,
+                stats.seconds * 1e3,
+                stats.seconds / stats.calls * 1e9,
+                stats.length_sum / stats.calls,
+            )
+
+
+def format_prometheus(snapshot: Snapshot, prefix: str = "magic_case") -> str:
+    """Render ``snapshot`` in the Prometheus text exposition format."""
+    ordered = sorted(snapshot.items())
+    lines = [
+        f"# HELP {prefix}_calls_total Calls per case class and phase.",
+        f"# TYPE {prefix}_calls_total counter",
+    ]
+    lines += [
+        f'{prefix}_calls_total{{case="{name}",phase="{phase}"}} {stats.calls}'
+        for (name, phase), stats in ordered
+    ]
+    lines += [
+        f"# HELP {prefix}_seconds_total Time spent per case class and phase.",
+        f"# TYPE {prefix}_seconds_total counter",
+    ]
+    lines += [
+        f'{prefix}_seconds_total{{case="{name}",phase="{phase}"}} {stats.seconds:.9f}'
+        for (name, phase), stats in ordered
+    ]
+    lines += [
+        f"# HELP {prefix}_input_length Input length per case class and phase.",
+        f"# TYPE {prefix}_input_length histogram",
+    ]
+    for (name, phase), stats in ordered:
+        labels = f'case="{name}",phase="{phase}"'
+        total = 0
+        for bound, count in zip((*LENGTH_BUCKETS, "+Inf"), stats.lengths):
+            total += count
+            lines.append(
+                f'{prefix}_input_length_bucket{{{labels},le="{bound}"}} {total}'
+            )
+        lines.append(f"{prefix}_input_length_sum{{{labels}}} {stats.length_sum}")
+        lines.append(f"{prefix}_input_length_count{{{labels}}} {stats.calls}")
+    return "\n".join(lines) + "\n"
+
+
+class PrometheusSink:
+    """Passes each snapshot, as Prometheus text, to ``write`` (e.g. ``file.write``)."""
+
+    def __init__(self, write: Callable[[str], Any], prefix: str = "magic_case") -> None:
+        self.write = write
+        self.prefix = prefix
+
+    def __call__(self, snapshot: Snapshot) -> None:
+        self.write(format_prometheus(snapshot, self.prefix))
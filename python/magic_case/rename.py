@@ -0,0 +1,628 @@
+"""Rename identifiers of one case to another across a source tree.
+
+Files are memory-mapped and scanned as bytes with a small lexer that skips
+comments and (by default) string literals, but not the code in f-string and
+template literal fields; every ASCII identifier that is written in the
+source case and defined somewhere in the tree is rewritten in the target
+case. Names the tree only imports or uses (``lru_cache``, ``sort_keys=`` of
+``json.dumps``, attributes of foreign objects) belong to code outside the
+tree and are left alone. Only files with at least one renamed identifier
+are written back. Large trees are spread over a process pool, and each
+process memoizes identifier renames for all the files it handles.
+"""
+
+from __future__ import annotations
+
+import ast
+import mmap
+import os
+import re
+import time
+import warnings
+from collections import namedtuple
+from collections.abc import Callable, Iterable, Iterator, Set
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+
+from . import vocab as _vocab
+from .base import BaseCase
+from .parallel import _init_worker, _worker_state
+
+FileResult = namedtuple("FileResult", ["path", "size", "renamed", "seconds"])
+
+# Directories never descended into
+SKIP_DIRS = frozenset({"node_modules", "__pycache__", "site-packages"})
+
+# Files handed to a worker per task
+BATCH_SIZE = 64
+
+
+def _identifier(group: bytes) -> bytes:
+    """An ASCII identifier captured as ``group``.
+
+    Non-ASCII letters and "$" on either side mean the name is part of a
+    longer identifier and must be left alone.
+    """
+    return (
+        rb"(?<![\w$\x80-\xff])(?P<" + group + rb">[A-Za-z_][A-Za-z0-9_]*)"
+        rb"(?![\w$\x80-\xff])"
+    )
+
+
+_NAME = _identifier(b"name")
+_NAME_RE = re.compile(_NAME)
+
+_PY_COMMENT = rb"#[^\n]*"
+_PY_STRING = (
+    rb'"""(?:\\.|[^\\])*?"""'
+    rb"|'''(?:\\.|[^\\])*?'''"
+    rb'|"(?:\\.|[^"\\\n])*"'
+    rb"|'(?:\\.|[^'\\\n])*'"
+)
+_JS_COMMENT = rb"//[^\n]*|/\*.*?\*/"
+_JS_STRING = rb'"(?:\\.|[^"\\\n])*"' rb"|'(?:\\.|[^'\\\n])*'"
+# Template literals as plain strings, for lexers that do not look into them
+_JS_TEMPLATE = rb"`(?:\\.|[^`\\])*`"
+
+# Openings of strings with code inside (f-strings, template literals): their
+# text is skipped like other strings but the code in their fields is lexed
+_PY_INTERPOLATED = (
+    rb"(?<![\w$\x80-\xff])(?P<prefix>[rR]?[fF][rR]?)"
+    rb"(?P<quote>\"\"\"|'''|\"|')"
+)
+_JS_INTERPOLATED = rb"(?P<prefix>)(?P<quote>`)"
+# Brackets, and the colon starting a format spec, inside a field
+_PY_FIELD = rb"(?P<open>[(\[{])|(?P<close>[)\]}])|(?P<spec>:)"
+_JS_FIELD = rb"(?P<open>[(\[{])|(?P<close>[)\]}])"
+# Literal braces and the end of a format spec
+_SPEC = re.compile(rb"(?P<open>\{)|(?P<end>\})")
+
+
+def _lexer(comment: bytes, string: bytes | None, *tokens: bytes) -> re.Pattern[bytes]:
+    skip = comment if string is None else comment + b"|" + string
+    return re.compile(b"|".join([b"(?:" + skip + b")", *tokens, _NAME]), re.DOTALL)
+
+
+# Nodes with nothing bound below them (imports bind, but foreign names), and
+# the strings and Nones that share lists with nodes
+_UNBINDING = frozenset(
+    {
+        ast.Import,
+        ast.ImportFrom,
+        ast.Constant,
+        ast.Global,
+        ast.Nonlocal,
+        ast.Load,
+        str,
+        type(None),
+    }
+)
+
+
+def _python_definitions(data: bytes | mmap.mmap) -> Iterator[bytes]:
+    """Names a Python module binds other than by importing them.
+
+    That is the names of functions, classes and parameters, and the names
+    and attributes assigned to. A module that does not parse binds nothing.
+    """
+    try:
+        with warnings.catch_warnings():
+            # invalid escapes and the like are not ours to report
+            warnings.simplefilter("ignore")
+            tree = ast.parse(data[:])
+    except (SyntaxError, ValueError):
+        return
+    # ast.walk, minus the subtrees that cannot bind anything
+    nodes: list[object] = [tree]
+    pop, push, extend = nodes.pop, nodes.append, nodes.extend
+    while nodes:
+        node = pop()
+        kind = type(node)
+        if kind is ast.Name:
+            name = None if type(node.ctx) is ast.Load else node.id
+        elif kind is ast.Attribute:
+            push(node.value)
+            name = None if type(node.ctx) is ast.Load else node.attr
+        elif kind is ast.arg:
+            name = node.arg
+        elif kind in _UNBINDING:
+            continue
+        else:
+            # def, class, except ... as, match patterns ({**rest} has "rest")
+            name = getattr(node, "name", None) or getattr(node, "rest", None)
+            for field in node._fields:
+                value = getattr(node, field)
+                if type(value) is list:
+                    extend(value)
+                elif isinstance(value, ast.AST):
+                    push(value)
+        if type(name) is str and name.isascii():
+            yield name.encode("ascii")
+
+
+# What binds a name in JavaScript/TypeScript: declarations, destructuring,
+# parameters, and object, class and interface members (``name:``,
+# ``name =``, ``name(...) {``). Conditions are skipped so that
+# ``if (done) {`` does not read as a method's parameter list.
+_JS_DEFINITION = re.compile(
+    b"|".join(
+        [
+            b"(?:" + _JS_COMMENT + b"|" + _JS_STRING + b"|" + _JS_TEMPLATE + b")",
+            rb"\b(?:if|for|while|switch|with)\s*\(",
+            rb"\b(?:function|class|interface|type|enum|namespace|const|let|var)"
+            rb"[\s*]+" + _identifier(b"declared"),
+            rb"\b(?:const|let|var)\s*(?P<pattern>[{[][^=;]*)=",
+            rb"\((?P<params>[^()]*)\)\s*(?::[^=;{}()]*)?(?:=>|\{)",
+            _identifier(b"member")
+            + rb"(?=\s*(?:\??:(?!:)|=(?![=>])|=>|\([^()]*\)\s*(?::[^=;{}()]*)?\{))",
+        ]
+    ),
+    re.DOTALL,
+)
+# Names in binding position in a parameter list or destructuring pattern
+_JS_BOUND = re.compile(
+    rb"(?:^|[(,{[]|\.\.\.)\s*(?:(?:public|private|protected|readonly)\s+)*"
+    + _identifier(b"name")
+    + rb"(?=\s*(?:[,)}\]=:?]|$))"
+)
+
+
+def _js_definitions(data: bytes | mmap.mmap) -> Iterator[bytes]:
+    """Names a JavaScript/TypeScript module binds, found lexically."""
+    for match in _JS_DEFINITION.finditer(data):
+        kind = match.lastgroup
+        if kind == "declared" or kind == "member":
+            yield match[kind]
+        elif kind == "pattern" or kind == "params":
+            for bound in _JS_BOUND.finditer(match[kind]):
+                yield bound["name"]
+
+
+# suffix -> (lexer skipping comments and strings, lexer skipping comments)
+LEXERS: dict[str, tuple[re.Pattern[bytes], re.Pattern[bytes]]] = {}
+# lexer skipping strings -> lexer for the code in interpolated strings' fields
+_FIELD_LEXERS: dict[re.Pattern[bytes], re.Pattern[bytes]] = {}
+# suffix -> names a module of that language binds
+_DEFINITIONS: dict[str, Callable[[bytes | mmap.mmap], Iterator[bytes]]] = {}
+for _suffixes, _comment, _string, _literal, _interpolated, _field, _define in [
+    (
+        (".py", ".pyi"),
+        _PY_COMMENT,
+        _PY_STRING,
+        _PY_STRING,
+        _PY_INTERPOLATED,
+        _PY_FIELD,
+        _python_definitions,
+    ),
+    (
+        (".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs"),
+        _JS_COMMENT,
+        _JS_STRING,
+        _JS_STRING + b"|" + _JS_TEMPLATE,
+        _JS_INTERPOLATED,
+        _JS_FIELD,
+        _js_definitions,
+    ),
+]:
+    _lexers = (
+        _lexer(_comment, _string, _interpolated),
+        _lexer(_comment, None, b"(?P<string>" + _literal + b")"),
+    )
+    _FIELD_LEXERS[_lexers[0]] = _lexer(_comment, _string, _interpolated, _field)
+    for _suffix in _suffixes:
+        LEXERS[_suffix] = _lexers
+        _DEFINITIONS[_suffix] = _define
+
+
+@lru_cache(maxsize=16)
+def _body(quote: bytes, raw: bool) -> re.Pattern[bytes]:
+    """Tokens of an interpolated string's text: its end and its fields' starts."""
+    if quote == b"`":
+        return re.compile(rb"\\.|(?P<open>\$\{)|(?P<end>`)", re.DOTALL)
+    # "{{" is a literal brace; so is the one of a "\N{NAME}" escape
+    escape = rb"\\[^{]" if raw else rb"\\N\{[^}]*\}|\\[^{]"
+    # an unterminated single-quoted string ends at the end of its line
+    end = re.escape(quote) if len(quote) == 3 else re.escape(quote) + rb"|\n"
+    return re.compile(
+        escape + rb"|\{\{|\}\}|(?P<open>\{)|(?P<end>" + end + b")", re.DOTALL
+    )
+
+
+@lru_cache(maxsize=1 << 16)
+def _rename(
+    name: bytes, source: type[BaseCase], target: type[BaseCase], version: int = 0
+) -> bytes | None:
+    """``name`` in ``target`` case, or ``None`` if it is not a ``source`` name.
+
+    A name qualifies when, without leading and trailing underscores, it has
+    at least two words and ``source`` renders them back to exactly the same
+    text; the underscores are kept around the renamed core. ``version`` is
+    the vocabulary version (:func:`vocab._version`), which keeps renames made
+    with an older vocabulary from being reused.
+    """
+    text = name.decode("ascii")
+    core = text.strip("_")
+    try:
+        words = source._splitter()(core)
+        if len(words) < 2 or not all(words) or source._joiner()(words) != core:
+            return None
+        renamed = target._joiner()(words)
+    except ValueError:
+        return None
+    if renamed == core:
+        return None
+    lead = len(text) - len(text.lstrip("_"))
+    return (text[:lead] + renamed + text[lead + len(core) :]).encode("ascii")
+
+
+def _defined(
+    data: bytes | mmap.mmap,
+    suffix: str,
+    source: type[BaseCase],
+    target: type[BaseCase],
+) -> set[bytes]:
+    """The names bound in ``data`` that are renamed from ``source`` to ``target``."""
+    version = _vocab._version()
+    return {
+        name
+        for name in _DEFINITIONS[suffix](data)
+        if _rename(name, source, target, version) is not None
+    }
+
+
+class _Rewriter:
+    """Collects the renames of one file, descending into interpolated strings.
+
+    Code names are renamed only when they are in ``defined``; names inside
+    string literals (lexed with ``strings=True``) always are.
+    """
+
+    def __init__(
+        self,
+        data: bytes | mmap.mmap,
+        lexer: re.Pattern[bytes],
+        source: type[BaseCase],
+        target: type[BaseCase],
+        defined: Set[bytes],
+    ):
+        self.data = data
+        self.lexer = lexer
+        self.field_lexer = _FIELD_LEXERS.get(lexer)
+        self.source = source
+        self.target = target
+        self.defined = defined
+        self.version = _vocab._version()
+        # (start, end, renamed name) of every rename, in order
+        self.edits: list[tuple[int, int, bytes]] = []
+
+    def code(self) -> None:
+        data, finditer, pos = self.data, self.lexer.finditer, 0
+        source, target, version = self.source, self.target, self.version
+        defined, add = self.defined, self.edits.append
+        while True:
+            for match in finditer(data, pos):
+                kind = match.lastgroup
+                if kind == "name":
+                    # inlined self.name(): this loop sees every token of the file
+                    name = match["name"]
+                    if name in defined:
+                        renamed = _rename(name, source, target, version)
+                        if renamed is not None:
+                            add((match.start(), match.end(), renamed))
+                elif kind == "string":
+                    self.string(match)
+                elif kind == "quote":
+                    # resume lexing after the interpolated string
+                    pos = self.interpolated(match)
+                    break
+            else:
+                return
+
+    def name(self, match: re.Match[bytes]) -> None:
+        name = match["name"]
+        if name in self.defined:
+            renamed = _rename(name, self.source, self.target, self.version)
+            if renamed is not None:
+                self.edits.append((match.start(), match.end(), renamed))
+
+    def string(self, match: re.Match[bytes]) -> None:
+        """Rename every name inside the string literal ``match``."""
+        for token in _NAME_RE.finditer(self.data, match.start(), match.end()):
+            renamed = _rename(token["name"], self.source, self.target, self.version)
+            if renamed is not None:
+                self.edits.append((token.start(), token.end(), renamed))
+
+    def interpolated(self, match: re.Match[bytes]) -> int:
+        """Lex the fields of the string opened by ``match``; return its end."""
+        body = _body(match["quote"], b"r" in match["prefix"].lower())
+        data, pos = self.data, match.end()
+        while (token := body.search(data, pos)) is not None:
+            pos = token.end()
+            kind = token.lastgroup
+            if kind == "end":
+                return pos
+            if kind == "open":
+                pos = self.field(pos)
+        return len(data)
+
+    def field(self, pos: int) -> int:
+        """Lex the code of a field from ``pos``; return the end of the field."""
+        data, search, depth = self.data, self.field_lexer.search, 0
+        while (match := search(data, pos)) is not None:
+            pos = match.end()
+            kind = match.lastgroup
+            if kind == "name":
+                self.name(match)
+            elif kind == "quote":
+                pos = self.interpolated(match)
+            elif kind == "open":
+                depth += 1
+            elif kind == "close":
+                if not depth:
+                    return pos
+                depth -= 1
+            elif kind == "spec" and not depth:
+                return self.spec(pos)
+        return len(data)
+
+    def spec(self, pos: int) -> int:
+        """Skip a format spec, lexing its nested fields; return the field's end."""
+        data = self.data
+        while (token := _SPEC.search(data, pos)) is not None:
+            pos = token.end()
+            if token.lastgroup == "end":
+                return pos
+            pos = self.field(pos)
+        return len(data)
+
+
+def _rewrite(
+    data: bytes | mmap.mmap,
+    lexer: re.Pattern[bytes],
+    source: type[BaseCase],
+    target: type[BaseCase],
+    defined: Set[bytes],
+) -> tuple[bytes, int]:
+    """Return ``data`` with its ``defined`` identifiers renamed, and how many were.
+
+    With a lexer that skips strings, the code inside f-strings and template
+    literals (``f"{user_id}"``, `` `${user_id}` ``) is renamed too, so that
+    it keeps referring to the renamed names.
+    """
+    rewriter = _Rewriter(data, lexer, source, target, defined)
+    rewriter.code()
+    if not rewriter.edits:
+        return b"", 0
+    pieces = []
+    last = 0
+    for start, end, renamed in rewriter.edits:
+        pieces.append(data[last:start])
+        pieces.append(renamed)
+        last = end
+    pieces.append(data[last:])
+    return b"".join(pieces), len(rewriter.edits)
+
+
+def _suffix(path: str) -> str:
+    suffix = os.path.splitext(path)[1]
+    if suffix not in LEXERS:
+        raise ValueError(f"unsupported file type: {path}")
+    return suffix
+
+
+def _map(path: str) -> mmap.mmap | None:
+    """Map the file at ``path`` read-only; ``None`` if it is empty."""
+    with open(path, "rb") as stream:
+        if not os.fstat(stream.fileno()).st_size:  # empty files cannot be mapped
+            return None
+        return mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def rename_file(
+    path: str,
+    source: type[BaseCase],
+    target: type[BaseCase],
+    *,
+    strings: bool = False,
+    write: bool = True,
+    defined: Set[bytes] | None = None,
+) -> FileResult:
+    """Rename the ``source`` identifiers of one file; see :func:`rename_tree`.
+
+    ``defined`` holds the names (ASCII bytes) the code may rename, by default
+    the ones the file binds itself.
+    """
+    start = time.perf_counter()
+    suffix = _suffix(path)
+    lexer = LEXERS[suffix][1 if strings else 0]
+    data = _map(path)
+    if data is None:
+        return FileResult(path, 0, 0, time.perf_counter() - start)
+    with data:
+        size = len(data)
+        if defined is None:
+            defined = _defined(data, suffix, source, target)
+        output, renamed = _rewrite(data, lexer, source, target, defined)
+    if renamed and write:
+        with open(path, "wb") as stream:
+            stream.write(output)
+    return FileResult(path, size, renamed, time.perf_counter() - start)
+
+
+def _define_batch(
+    paths: list[str], source: type[BaseCase], target: type[BaseCase]
+) -> tuple[set[bytes], int, int]:
+    hits, misses, _, _ = _rename.cache_info()
+    defined: set[bytes] = set()
+    for path in paths:
+        data = _map(path)
+        if data is not None:
+            with data:
+                defined |= _defined(data, _suffix(path), source, target)
+    info = _rename.cache_info()
+    return defined, info.hits - hits, info.misses - misses
+
+
+def _rename_batch(
+    paths: list[str],
+    source: type[BaseCase],
+    target: type[BaseCase],
+    strings: bool,
+    write: bool,
+    defined: Set[bytes],
+) -> tuple[list[FileResult], int, int]:
+    hits, misses, _, _ = _rename.cache_info()
+    results = [
+        rename_file(path, source, target, strings=strings, write=write, defined=defined)
+        for path in paths
+    ]
+    info = _rename.cache_info()
+    return results, info.hits - hits, info.misses - misses
+
+
+def iter_sources(root: str, suffixes: Iterable[str] = LEXERS) -> Iterator[str]:
+    """Paths of the files under ``root`` with one of ``suffixes``, sorted.
+
+    Hidden directories and :data:`SKIP_DIRS` are not descended into. A file
+    ``root`` is yielded as is when it has one of the suffixes.
+    """
+    suffixes = tuple(suffixes)
+    if os.path.isfile(root):
+        if root.endswith(suffixes):
+            yield root
+        return
+    for directory, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if d[0] != "." and d not in SKIP_DIRS)
+        for name in sorted(files):
+            if name.endswith(suffixes):
+                yield os.path.join(directory, name)
+
+
+class RenameReport:
+    """Outcome and timings of a :func:`rename_tree` run."""
+
+    def __init__(
+        self,
+        files: list[FileResult],
+        seconds: float,
+        workers: int,
+        cache_hits: int,
+        cache_misses: int,
+    ):
+        self.files = files
+        self.seconds = seconds
+        self.workers = workers
+        self.cache_hits = cache_hits
+        self.cache_misses = cache_misses
+
+    @property
+    def changed(self) -> list[str]:
+        """Paths of the files with renamed identifiers."""
+        return [result.path for result in self.files if result.renamed]
+
+    @property
+    def renamed(self) -> int:
+        """Total number of identifiers renamed."""
+        return sum(result.renamed for result in self.files)
+
+    def format(self, slowest: int = 5) -> str:
+        """Human-readable summary, listing the ``slowest`` files."""
+        size = sum(result.size for result in self.files)
+        busy = sum(result.seconds for result in self.files)
+        seconds = self.seconds or 1e-9
+        lines = [
+            f"{len(self.files)} files ({size / 1e6:.1f} MB) in {self.seconds:.2f}s "
+            f"with {self.workers} worker(s): {len(self.changed)} changed, "
+            f"{self.renamed} identifiers renamed",
+            f"{len(self.files) / seconds:.0f} files/s, {size / 1e6 / seconds:.1f} MB/s, "
+            f"{busy:.2f}s spent in files",
+            f"identifier cache: {self.cache_hits} hits, {self.cache_misses} misses",
+        ]
+        ranked = sorted(self.files, key=lambda result: result.seconds, reverse=True)
+        for result in ranked[:slowest]:
+            lines.append(f"  {result.seconds * 1e3:8.1f} ms  {result.path}")
+        return "\n".join(lines)
+
+
+def _check_target(target: type[BaseCase]) -> None:
+    if not target._joiner()(["ab", "cd"]).isidentifier():
+        raise ValueError(f"{target.__name__} does not produce identifiers")
+
+
+def rename_tree(
+    root: str,
+    source: type[BaseCase],
+    target: type[BaseCase],
+    *,
+    suffixes: Iterable[str] = LEXERS,
+    strings: bool = False,
+    write: bool = True,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    exclude: Iterable[str] = (),
+) -> RenameReport:
+    """Rewrite ``source`` identifiers as ``target`` in the source files under ``root``.
+
+    Python (``.py``, ``.pyi``) and JavaScript/TypeScript files are supported.
+    Comments are never touched; string literals only with ``strings=True``,
+    and then every name in them is renamed. Names shorter than two words,
+    names that ``source`` would not render exactly like that (``fooBAR`` for
+    camel) and non-ASCII names are left alone. With ``write=False`` nothing
+    is written and the report lists the files that would change.
+
+    In code, only names that some file under ``root`` binds are renamed:
+    functions, classes, parameters, variables and attributes assigned to
+    (for JavaScript/TypeScript, found by their syntax rather than parsed).
+    Names that are only imported or used, such as ``lru_cache`` or the
+    ``sort_keys`` keyword of ``json.dumps``, belong to other code and keep
+    their spelling. ``exclude`` lists further names to keep, for names the
+    tree binds that are also used for code outside it.
+
+    Files are read twice, first for the names they bind and then to rewrite
+    them, in batches of :data:`BATCH_SIZE` handled by ``executor`` or by a
+    process pool of ``workers`` processes (default: CPU count); with a
+    single worker everything runs in this process. Each process memoizes
+    identifier renames for every file it handles, so names repeated across
+    the tree are converted once per process. Case classes must be importable
+    by the workers. A pool created here starts with this process's
+    vocabulary; see :mod:`magic_case.parallel` for ``executor``.
+    """
+    _check_target(target)
+    suffixes = tuple(suffixes)
+    for suffix in suffixes:
+        if suffix not in LEXERS:
+            raise ValueError(f"unsupported file type: {suffix}")
+    if not os.path.exists(root):
+        raise FileNotFoundError(f"no such file or directory: {root}")
+    start = time.perf_counter()
+    paths = list(iter_sources(root, suffixes))
+    batches = [paths[i : i + BATCH_SIZE] for i in range(0, len(paths), BATCH_SIZE)]
+    workers = workers or os.cpu_count() or 1
+    excluded = {name.encode() for name in exclude}
+
+    def run(map_: Callable[..., Iterator]) -> tuple[list, list]:
+        found = list(map_(_define_batch, batches, repeat(source), repeat(target)))
+        defined = frozenset().union(*(names for names, _, _ in found)) - excluded
+        args = (source, target, strings, write, defined)
+        return found, list(map_(_rename_batch, batches, *map(repeat, args)))
+
+    if executor is None and (workers == 1 or len(batches) <= 1):
+        workers = 1
+        found, done = run(map)
+    elif executor is None:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=_worker_state()
+        ) as pool:
+            found, done = run(pool.map)
+    else:
+        found, done = run(executor.map)
+
+    files = [result for results, _, _ in done for result in results]
+    return RenameReport(
+        files,
+        time.perf_counter() - start,
+        workers,
+        sum(hits for _, hits, _ in found + done),
+        sum(misses for _, _, misses in found + done),
+    )
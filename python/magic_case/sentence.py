@@ -1,10 +1,17 @@
+from collections.abc import Sequence
+
 from .base import BaseCase
+from .tokenizer import split_lower
 
 
 class SentenceCase(BaseCase):
-    def _split_into_words(self, text: str) -> list[str]:
-        return text.lower().split(" ")
+    __slots__ = ()
+
+    @staticmethod
+    def _split_into_words(text: str) -> list[str]:
+        return split_lower(text, " ")
 
-    def __str__(self) -> str:
-        sentence = " ".join(self.words)
+    @staticmethod
+    def _join_words(words: Sequence[str]) -> str:
+        sentence = " ".join(words)
         return sentence.capitalize()
@@ -1,8 +1,13 @@
+from collections.abc import Sequence
+
 from .base import BaseCase
 
 
 class SlashTitleCase(BaseCase):
-    def _split_into_words(self, text: str) -> list[str]:
+    __slots__ = ()
+
+    @staticmethod
+    def _split_into_words(text: str) -> list[str]:
         if not text:
             raise ValueError("Input cannot be empty")
 
@@ -21,6 +26,7 @@ class SlashTitleCase(BaseCase):
 
         return words
 
-    def __str__(self) -> str:
+    @staticmethod
+    def _join_words(words: Sequence[str]) -> str:
         # TitleCase each part and join with slash
-        return "/".join(word.capitalize() for word in self.words)
+        return "/".join(word.capitalize() for word in words)
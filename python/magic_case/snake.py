@@ -1,9 +1,16 @@
+from collections.abc import Sequence
+
 from .base import BaseCase
+from .tokenizer import split_lower
 
 
 class SnakeCase(BaseCase):
-    def _split_into_words(self, text: str) -> list[str]:
-        return text.lower().split("_")
+    __slots__ = ()
+
+    @staticmethod
+    def _split_into_words(text: str) -> list[str]:
+        return split_lower(text, "_")
 
-    def __str__(self) -> str:
-        return "_".join(self.words).lower()
+    @staticmethod
+    def _join_words(words: Sequence[str]) -> str:
+        return "_".join(words).lower()
@@ -1,8 +1,14 @@
+from collections.abc import Sequence
+
 from .base import BaseCase
+from .tokenizer import split_nonblank
 
 
 class SpaceCase(BaseCase):
-    def _split_into_words(self, text: str) -> list[str]:
+    __slots__ = ()
+
+    @staticmethod
+    def _split_into_words(text: str) -> list[str]:
         """
         Splits a space-separated string into its component words.
 
@@ -12,8 +18,8 @@ class SpaceCase(BaseCase):
         - "  leading and trailing spaces  " -> ["leading", "and", "trailing", "spaces"]
         """
         # Split by spaces and filter out empty strings
-        words = text.split(" ")
-        return [word.lower() for word in words if word.strip()]
+        return split_nonblank(text, " ")
 
-    def __str__(self) -> str:
-        return " ".join(self.words)
+    @staticmethod
+    def _join_words(words: Sequence[str]) -> str:
+        return " ".join(words)
@@ -0,0 +1,363 @@
+"""Span-based tokenizing and rendering without per-word strings.
+
+:func:`word_spans` tokenizes a string into flat ``(start, end)`` offsets into
+the original text, stored in an ``array('Q')`` instead of a list of freshly
+allocated lowercase words. :func:`render_spans` writes the target case
+straight from those offsets. For ASCII text this produces the same result as
+``target(source(text)).get()`` while allocating the output, at most one
+upper- and one lowercase copy of the input and short-lived slices; nothing per
+word is kept alive. Non-ASCII text goes through the regular pipeline, because
+Unicode case mapping can change lengths and depends on the surrounding letters.
+"""
+
+from __future__ import annotations
+
+import re
+from array import array
+from collections.abc import Iterable
+from io import StringIO
+from typing import Callable
+
+from .base import BaseCase
+from .camel import CamelCase
+from .camel_snake import CamelSnakeCase
+from .convert import _pipeline
+from .dot import DotCase
+from .flat import FlatCase
+from .http_header import HttpHeaderCase
+from .hungarian import HungarianCase, _detect_prefix
+from .kebab import KebabCase
+from .macro import MacroCase
+from .pascal import PascalCase
+from .pascal_snake import PascalSnakeCase
+from .path import PathCase
+from .sentence import SentenceCase
+from .slash_title import SlashTitleCase
+from .snake import SnakeCase
+from .space import SpaceCase
+from .title import TitleCase
+from .tokenizer import (
+    CAMEL_SNAKE_WORD,
+    HTTP_HEADER,
+    HUMP_BOUNDARY,
+    LOWER_UPPER,
+    PATH,
+    SEPARATORS,
+    ascii_shape,
+    fullmatch,
+)
+from .upper import UpperCase
+from .vocab import acronym_spans
+
+_BLANK = re.compile(r"\s*")
+_TOKEN = re.compile(r"\S+")
+
+# How a word is written: as found in the input, lowercased, uppercased or
+# capitalized
+KEEP, LOWER, UPPER, CAPITALIZE = range(4)
+
+
+def _scan_separator(text: str, sep: str, out: array) -> None:
+    """Every piece of ``text.split(sep)``, blank pieces included."""
+    start = 0
+    end = text.find(sep)
+    while end != -1:
+        out.append(start)
+        out.append(end)
+        start = end + 1
+        end = text.find(sep, start)
+    out.append(start)
+    out.append(len(text))
+
+
+def _scan_nonblank(text: str, sep: str, out: array) -> None:
+    """Pieces of ``text.split(sep)`` that are not blank."""
+    start = 0
+    while True:
+        end = text.find(sep, start)
+        stop = len(text) if end == -1 else end
+        if not _BLANK.fullmatch(text, start, stop):
+            out.append(start)
+            out.append(stop)
+        if end == -1:
+            return
+        start = end + 1
+
+
+def _scan_separators(text: str, out: array) -> None:
+    """Non-empty pieces between runs of :data:`~.tokenizer.SEPARATORS`."""
+    start = 0
+    for match in SEPARATORS.finditer(text):
+        if match.start() > start:
+            out.append(start)
+            out.append(match.start())
+        start = match.end()
+    if len(text) > start:
+        out.append(start)
+        out.append(len(text))
+
+
+def _scan_around_acronyms(
+    text: str,
+    start: int,
+    out: array,
+    scan_range: Callable[[str, int, int, array], None],
+) -> None:
+    """Scan ``text[start:]`` with ``scan_range``, keeping vocabulary acronyms whole.
+
+    Mirrors :func:`~magic_case.tokenizer._around_acronyms`. ``scan_range``
+    matches the ASCII shape of non-ASCII text, which has the same offsets.
+    """
+    spans = acronym_spans(text, start)
+    shape = text if text.isascii() else ascii_shape(text)
+    if not spans:
+        scan_range(shape, start, len(text), out)
+        return
+    for i in range(0, len(spans), 2):
+        if spans[i] > start:
+            scan_range(shape, start, spans[i], out)
+        out.append(spans[i])
+        out.append(spans[i + 1])
+        start = spans[i + 1]
+    if start < len(text):
+        scan_range(shape, start, len(text), out)
+
+
+def _scan_hump_range(text: str, start: int, end: int, out: array) -> None:
+    for match in HUMP_BOUNDARY.finditer(text, start, end):
+        # the lookbehind sees text before ``start``; a segment never splits there
+        if match.start() == start:
+            continue
+        out.append(start)
+        out.append(match.start())
+        start = match.start()
+    out.append(start)
+    out.append(end)
+
+
+def _scan_camel_snake_range(text: str, start: int, end: int, out: array) -> None:
+    # the pattern never matches "_" or " ", so matching the original text
+    # finds the same words as matching text.replace("_", " ")
+    for match in CAMEL_SNAKE_WORD.finditer(text, start, end):
+        out.append(match.start())
+        out.append(match.end())
+
+
+def _scan_lower_upper_range(text: str, start: int, end: int, out: array) -> None:
+    for token in _TOKEN.finditer(text, start, end):
+        start = token.start()
+        for match in LOWER_UPPER.finditer(text, start, token.end()):
+            out.append(start)
+            out.append(match.start(2))
+            start = match.start(2)
+        out.append(start)
+        out.append(token.end())
+
+
+def _scan_snake(text: str, out: array) -> None:
+    _scan_separator(text, "_", out)
+
+
+def _scan_kebab(text: str, out: array) -> None:
+    _scan_separator(text, "-", out)
+
+
+def _scan_dot(text: str, out: array) -> None:
+    _scan_separator(text, ".", out)
+
+
+def _scan_space(text: str, out: array) -> None:
+    _scan_separator(text, " ", out)
+
+
+def _scan_space_nonblank(text: str, out: array) -> None:
+    _scan_nonblank(text, " ", out)
+
+
+def _scan_camel(text: str, out: array) -> None:
+    if not text:
+        raise ValueError("Input cannot be empty")
+    if not text[0].islower():
+        raise ValueError(
+            f"Invalid CamelCase: must start with a lowercase letter → {text}"
+        )
+    _scan_around_acronyms(text, 0, out, _scan_hump_range)
+
+
+def _scan_pascal(text: str, out: array) -> None:
+    if not text:
+        raise ValueError("Input cannot be empty")
+    if not (text[0].isupper() or text[0].istitle()):
+        raise ValueError(
+            f"Invalid PascalCase: must start with an uppercase letter → {text}"
+        )
+    _scan_around_acronyms(text, 0, out, _scan_hump_range)
+
+
+def _scan_camel_snake(text: str, out: array) -> None:
+    _scan_around_acronyms(text, 0, out, _scan_camel_snake_range)
+
+
+def _scan_http_header(text: str, out: array) -> None:
+    if not text:
+        raise ValueError("Input cannot be empty")
+    if not fullmatch(HTTP_HEADER, text):
+        raise ValueError(f"Invalid HttpHeaderCase string: {text}")
+    _scan_separator(text, "-", out)
+
+
+def _scan_path(text: str, out: array) -> None:
+    if not fullmatch(PATH, text):
+        raise ValueError(f"Invalid PathCase string: {text}")
+    _scan_separator(text, "/", out)
+
+
+def _scan_slash_title(text: str, out: array) -> None:
+    if not text:
+        raise ValueError("Input cannot be empty")
+    if text.startswith("/") or text.endswith("/"):
+        raise ValueError(
+            f"Invalid SlashTitleCase: cannot start or end with slash → {text}"
+        )
+    first = len(out)
+    _scan_separator(text, "/", out)
+    for i in range(first, len(out), 2):
+        if _BLANK.fullmatch(text, out[i], out[i + 1]):
+            raise ValueError(
+                f"Invalid SlashTitleCase: consecutive slashes not allowed → {text}"
+            )
+
+
+def _scan_hungarian(text: str, out: array) -> None:
+    prefix = _detect_prefix(text)
+    start = len(prefix) if prefix else 0
+    _scan_around_acronyms(text, start, out, _scan_lower_upper_range)
+
+
+# source case -> (scanner appending offsets to an array, whether the source
+# lowercases its words)
+_SCANNERS: dict[type[BaseCase], tuple[Callable[[str, array], None], bool]] = {
+    SnakeCase: (_scan_snake, True),
+    UpperCase: (_scan_snake, True),
+    KebabCase: (_scan_kebab, True),
+    DotCase: (_scan_dot, True),
+    SentenceCase: (_scan_space, True),
+    TitleCase: (_scan_space, True),
+    SpaceCase: (_scan_space_nonblank, True),
+    FlatCase: (_scan_separators, True),
+    MacroCase: (_scan_separators, True),
+    PascalSnakeCase: (_scan_separators, True),
+    CamelCase: (_scan_camel, False),
+    PascalCase: (_scan_pascal, False),
+    CamelSnakeCase: (_scan_camel_snake, True),
+    HttpHeaderCase: (_scan_http_header, False),
+    PathCase: (_scan_path, False),
+    SlashTitleCase: (_scan_slash_title, False),
+    HungarianCase: (_scan_hungarian, True),
+}
+
+# target case -> (separator, style of the first word, style of the others),
+# mirroring each class's ``_join_words`` for ASCII words
+_RENDERERS: dict[type[BaseCase], tuple[str, int, int]] = {
+    SnakeCase: ("_", LOWER, LOWER),
+    KebabCase: ("-", LOWER, LOWER),
+    DotCase: (".", LOWER, LOWER),
+    UpperCase: ("_", UPPER, UPPER),
+    MacroCase: ("_", UPPER, UPPER),
+    SentenceCase: (" ", CAPITALIZE, LOWER),
+    TitleCase: (" ", CAPITALIZE, CAPITALIZE),
+    SpaceCase: (" ", KEEP, KEEP),
+    FlatCase: ("", KEEP, KEEP),
+    PathCase: ("/", KEEP, KEEP),
+    PascalSnakeCase: ("_", CAPITALIZE, CAPITALIZE),
+    CamelCase: ("", LOWER, CAPITALIZE),
+    PascalCase: ("", CAPITALIZE, CAPITALIZE),
+    CamelSnakeCase: ("_", LOWER, CAPITALIZE),
+    HttpHeaderCase: ("-", CAPITALIZE, CAPITALIZE),
+    SlashTitleCase: ("/", CAPITALIZE, CAPITALIZE),
+    HungarianCase: ("", KEEP, CAPITALIZE),
+}
+
+
+def _scanner(source: type[BaseCase]) -> tuple[Callable[[str, array], None], bool]:
+    try:
+        return _SCANNERS[source]
+    except KeyError:
+        raise TypeError(f"no span tokenizer for {source.__name__}") from None
+
+
+def word_spans(text: str, source: type[BaseCase], out: array | None = None) -> array:
+    """Tokenize ``text`` as ``source`` into flat ``(start, end)`` offsets.
+
+    Word ``i`` is ``text[spans[2 * i]:spans[2 * i + 1]]`` (lowercased when
+    ``source`` lowercases its words). Invalid input raises the same
+    ``ValueError`` as ``source(text)``. Pass ``out`` to reuse one offset
+    array across calls; it is cleared first. Only the built-in case classes
+    have span tokenizers; others raise ``TypeError``.
+    """
+    scan, _ = _scanner(source)
+    if out is None:
+        out = array("Q")
+    else:
+        del out[:]
+    scan(text, out)
+    return out
+
+
+def render_spans(
+    text: str, spans: array, source: type[BaseCase], target: type[BaseCase]
+) -> str:
+    """Render the words at ``spans`` of ``text`` (parsed as ``source``) in ``target``.
+
+    Returns exactly what ``target(source(text)).get()`` returns.
+    """
+    _, lowers = _scanner(source)
+    layout = _RENDERERS.get(target)
+    if not text.isascii():
+        return _pipeline(source, target)(text)
+    if layout is None or not spans:
+        words = [text[spans[i] : spans[i + 1]] for i in range(0, len(spans), 2)]
+        if lowers:
+            words = [word.lower() for word in words]
+        return target._joiner()(words)
+
+    sep, first, rest = layout
+    keep = LOWER if lowers else KEEP
+    first = keep if first == KEEP else first
+    rest = keep if rest == KEEP else rest
+    low = text.lower() if LOWER in (first, rest) or CAPITALIZE in (first, rest) else ""
+    up = text.upper() if UPPER in (first, rest) or CAPITALIZE in (first, rest) else ""
+    out = StringIO()
+    write = out.write
+    style = first
+    for i in range(0, len(spans), 2):
+        start, end = spans[i], spans[i + 1]
+        if i:
+            write(sep)
+            style = rest
+        if style == LOWER:
+            write(low[start:end])
+        elif style == CAPITALIZE:
+            if start < end:
+                write(up[start])
+                write(low[start + 1 : end])
+        elif style == UPPER:
+            write(up[start:end])
+        else:
+            write(text[start:end])
+    return out.getvalue()
+
+
+def convert_spans(
+    items: Iterable[str], source: type[BaseCase], target: type[BaseCase]
+) -> list[str]:
+    """Convert ``items`` like :func:`~magic_case.convert.convert_many` via spans.
+
+    One offset array is reused for the whole batch, so the only allocation
+    kept per item is its converted string.
+    """
+    spans = array("Q")
+    return [
+        render_spans(text, word_spans(text, source, spans), source, target)
+        for text in items
+    ]
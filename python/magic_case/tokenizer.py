@@ -0,0 +1,199 @@
+"""Shared, precompiled splitting and validation patterns.
+
+Every case class routes its ``_split_into_words`` through the helpers in this
+module so that each regular expression is compiled exactly once, at import
+time, instead of going through the ``re`` module cache on every call. The
+hump splitters also keep the acronyms of :mod:`magic_case.vocab` whole.
+
+The patterns are written for ASCII, which is the fast path. Other input is
+matched against its :func:`ascii_shape`, a same-length ASCII stand-in where
+every character is replaced by one with the same role (uppercase, lowercase,
+digit...) according to its Unicode category; the matches are then applied to
+the original text.
+
+Splitting and validating ``n`` characters takes O(n) time whatever they are,
+so untrusted input cannot trigger catastrophic backtracking: no pattern nests
+or overlaps quantifiers, lookarounds inspect at most two characters, and the
+only pattern that backtracks (``[A-Z]+(?![a-z])``) gives back at most one
+character. Vocabulary lookups walk a trie no deeper than its longest entry.
+``benchmarks/bench_adversarial.py`` checks the scaling on pathological input;
+:func:`~magic_case.set_max_length` bounds the absolute cost.
+"""
+
+import re
+from collections.abc import Callable
+
+from .vocab import ACRONYMS, acronym_spans
+
+# lowercase → uppercase boundary (testCase → test Case) and acronym before a
+# normal word (HTTPServer → HTTP Server); the leading lookahead rejects most
+# positions before any lookbehind runs
+HUMP_BOUNDARY = re.compile(r"(?=[A-Z])(?:(?<=[a-z])|(?<=[A-Z])(?=[A-Z][a-z]))")
+
+# Words inside camel_Snake identifiers once underscores became spaces
+CAMEL_SNAKE_WORD = re.compile(r"[A-Z]?[a-z0-9]+|[A-Z]+(?![a-z])")
+
+# lowercase/digit followed by an uppercase letter, used by HungarianCase
+LOWER_UPPER = re.compile(r"([a-z0-9])([A-Z])")
+
+# the LOWER_UPPER boundaries plus whitespace runs, to split in one pass
+LOWER_UPPER_SPLIT = re.compile(r"(?=[A-Z])(?<=[a-z0-9])|\s+")
+
+# Common separators: underscore, hyphen, dot, comma, slash, backslash, space
+SEPARATORS = re.compile(r"[_\-\.,\/\\\s]+")
+
+# Word-Word-Word, each word starts uppercase then lowercase/digits
+HTTP_HEADER = re.compile(r"(?:[A-Z][a-z0-9]*)(?:-[A-Z][a-z0-9]*)*")
+
+# lowercase words separated by `/`
+PATH = re.compile(r"(?:[a-z0-9]+)(?:/[a-z0-9]+)*")
+
+
+def split_lower(text: str, sep: str) -> list[str]:
+    """Lowercase ``text`` and split it on a single separator."""
+    return text.lower().split(sep)
+
+
+def split_nonblank(text: str, sep: str) -> list[str]:
+    """Split on a single separator, dropping blank pieces and lowercasing."""
+    return [word.lower() for word in text.split(sep) if word.strip()]
+
+
+class _Shapes(dict):
+    """Code point → ASCII stand-in, filled in on first use of each character.
+
+    Threads racing on a new character store the same value, so no lock.
+    """
+
+    def __missing__(self, code: int) -> str:
+        char = chr(code)
+        if code < 128:
+            shape = char
+        elif char.isupper() or char.istitle():  # Lu, Lt
+            shape = "A"
+        elif char.isdecimal():  # Nd
+            shape = "0"
+        elif char.isalpha():  # Ll, Lm, Lo: caseless letters continue a word
+            shape = "a"
+        elif char.isspace():
+            shape = " "
+        else:
+            import unicodedata
+
+            # combining marks take the role of the character they modify
+            shape = _MARK if unicodedata.category(char)[0] == "M" else "#"
+        self[code] = shape
+        return shape
+
+
+# placeholder for combining marks; never in a shape otherwise, since other
+# non-ASCII characters all map to ASCII
+_MARK = "\x80"
+_MARKS = re.compile(r"(.?)\x80+", re.DOTALL)
+_SHAPES = _Shapes()
+
+
+def ascii_shape(text: str) -> str:
+    """Map ``text`` to an ASCII string of the same length for the patterns above.
+
+    Uppercase and titlecase letters become ``A``, lowercase and caseless
+    letters ``a``, decimal digits ``0``, whitespace a space and anything else
+    ``#``; combining marks copy the character before them. ASCII characters
+    are kept as they are.
+    """
+    shape = text.translate(_SHAPES)
+    if _MARK in shape:
+        shape = _MARKS.sub(lambda m: (m[1] or "#") * len(m[0]), shape)
+    return shape
+
+
+def fullmatch(pattern: re.Pattern[str], text: str) -> bool:
+    """Whether ``text`` (or, for non-ASCII text, its shape) matches ``pattern``."""
+    return pattern.fullmatch(text if text.isascii() else ascii_shape(text)) is not None
+
+
+def _around_acronyms(
+    text: str, split: Callable[[str], list[str]], lower: bool
+) -> list[str]:
+    """Split ``text`` with ``split``, keeping vocabulary acronyms as whole words."""
+    spans = acronym_spans(text)
+    if not spans:
+        return split(text)
+    words: list[str] = []
+    start = 0
+    for i in range(0, len(spans), 2):
+        if spans[i] > start:
+            words.extend(split(text[start : spans[i]]))
+        acronym = text[spans[i] : spans[i + 1]]
+        words.append(acronym.lower() if lower else acronym)
+        start = spans[i + 1]
+    if start < len(text):
+        words.extend(split(text[start:]))
+    return words
+
+
+def _humps(text: str) -> list[str]:
+    if text.isascii():
+        if text.islower():
+            return [text]
+        return HUMP_BOUNDARY.split(text)
+    # the boundaries are zero-width, so the pieces of the shape add up to it
+    words = []
+    start = 0
+    for piece in HUMP_BOUNDARY.split(ascii_shape(text)):
+        words.append(text[start : start + len(piece)])
+        start += len(piece)
+    return words
+
+
+def split_humps(text: str) -> list[str]:
+    """Split camel/Pascal humps, keeping the original casing of each word."""
+    if ACRONYMS.root:
+        return _around_acronyms(text, _humps, False)
+    return _humps(text)
+
+
+def _camel_snake_words(text: str) -> list[str]:
+    # the pattern matches neither "_" nor " ", so there is no need to turn
+    # underscores into spaces first
+    if text.isascii():
+        return [word.lower() for word in CAMEL_SNAKE_WORD.findall(text)]
+    return [
+        text[match.start() : match.end()].lower()
+        for match in CAMEL_SNAKE_WORD.finditer(ascii_shape(text))
+    ]
+
+
+def split_camel_snake(text: str) -> list[str]:
+    """Split on underscores or camel humps into lowercase words."""
+    if ACRONYMS.root:
+        return _around_acronyms(text, _camel_snake_words, True)
+    return _camel_snake_words(text)
+
+
+def _lower_upper_words(text: str) -> list[str]:
+    if text.isascii():
+        return [word.lower() for word in LOWER_UPPER_SPLIT.split(text) if word]
+    # whitespace matches are not zero-width, so cut at the match offsets
+    words = []
+    start = 0
+    for match in LOWER_UPPER_SPLIT.finditer(ascii_shape(text)):
+        if match.start() > start:
+            words.append(text[start : match.start()].lower())
+        start = match.end()
+    if start < len(text):
+        words.append(text[start:].lower())
+    return words
+
+
+def split_lower_upper(text: str) -> list[str]:
+    """Split before each uppercase letter that follows a lowercase letter/digit."""
+    if ACRONYMS.root:
+        return _around_acronyms(text, _lower_upper_words, True)
+    return _lower_upper_words(text)
+
+
+def split_separators(text: str) -> list[str]:
+    """Split on any run of common separators into lowercase words."""
+    words = SEPARATORS.split(text)
+    return [word.lower() for word in words if word.strip()]
@@ -0,0 +1,231 @@
+"""Configurable vocabulary of acronyms and Hungarian prefixes.
+
+Both are stored in a :class:`Trie`, so a longest-match lookup costs time
+linear in the length of the match, however many entries there are.
+
+Acronyms (``OAuth``, ``IPv6``, ``gRPC``, ``iOS``...) are matched case
+sensitively by every hump-splitting class (camel, Pascal, camel_Snake and
+Hungarian) and kept as one word. The acronym vocabulary is empty by default,
+which keeps the regular hump rules. Prefixes are what ``HungarianCase``
+strips from the start of its input.
+
+Results memoized from splits are tagged with :func:`_version`, read before
+splitting, rather than cleared on changes: a split that read the old
+vocabulary and finishes after a change is stored under the old version,
+where no later lookup finds it.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections.abc import Iterable, Iterator
+
+# marks the node at the end of a stored word; never a single character
+_END = ""
+
+DEFAULT_PREFIXES = ("str", "lst", "arr", "psz", "i", "b", "d", "f", "ch", "n", "p")
+
+
+class Trie:
+    """Prefix tree over strings with longest-match lookup.
+
+    ``root`` is empty exactly when the trie is, which callers on hot paths
+    test directly to skip lookups. Changes are serialized by a lock and only
+    ever add or remove one end marker or one branch at a time, so lookups
+    running in other threads need no lock: they see each word either
+    entirely or not at all.
+    """
+
+    __slots__ = ("root", "version", "_size", "_lock")
+
+    def __init__(self, words: Iterable[str] = ()):
+        self.root: dict[str, dict] = {}
+        # bumped on every change, so derived data can tell it is stale
+        self.version = 0
+        self._size = 0
+        self._lock = threading.Lock()
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str) or not word:
+            return False
+        node = self.root
+        for char in word:
+            node = node.get(char)
+            if node is None:
+                return False
+        return _END in node
+
+    def __iter__(self) -> Iterator[str]:
+        stack = [("", self.root)]
+        while stack:
+            prefix, node = stack.pop()
+            # a snapshot, as other threads may change the trie meanwhile
+            for char, child in list(node.items()):
+                if char == _END:
+                    yield prefix
+                else:
+                    stack.append((prefix + char, child))
+
+    def add(self, word: str) -> None:
+        """Add ``word``; adding a word twice is a no-op."""
+        if not isinstance(word, str) or not word:
+            raise ValueError(f"vocabulary entries must be non-empty strings: {word!r}")
+        with self._lock:
+            node = self.root
+            for char in word:
+                node = node.setdefault(char, {})
+            if _END not in node:
+                node[_END] = {}
+                self._size += 1
+                self.version += 1
+
+    def discard(self, word: str) -> None:
+        """Remove ``word`` if present, pruning branches left empty."""
+        with self._lock:
+            path = [self.root]
+            for char in word:
+                node = path[-1].get(char)
+                if node is None:
+                    return
+                path.append(node)
+            if _END not in path[-1]:
+                return
+            del path[-1][_END]
+            self._size -= 1
+            self.version += 1
+            for char in reversed(word):
+                node = path.pop()
+                if node:
+                    break
+                del path[-1][char]
+
+    def longest_match(self, text: str, start: int = 0) -> int:
+        """Length of the longest stored word at ``text[start:]``, 0 if none."""
+        node = self.root
+        best = 0
+        for i in range(start, len(text)):
+            node = node.get(text[i])
+            if node is None:
+                break
+            if _END in node:
+                best = i + 1 - start
+        return best
+
+
+ACRONYMS = Trie()
+PREFIXES = Trie(DEFAULT_PREFIXES)
+
+
+def _version() -> int:
+    """Grows on every change to either vocabulary, as both versions only grow."""
+    return ACRONYMS.version + PREFIXES.version
+
+
+def add_acronyms(words: Iterable[str]) -> None:
+    """Keep each of ``words`` (matched case sensitively) as a single word."""
+    for word in words:
+        ACRONYMS.add(word)
+
+
+def remove_acronyms(words: Iterable[str]) -> None:
+    """Forget acronyms added with :func:`add_acronyms`; unknown ones are ignored."""
+    for word in words:
+        ACRONYMS.discard(word)
+
+
+def add_prefixes(prefixes: Iterable[str]) -> None:
+    """Recognize extra Hungarian prefixes (the longest match is stripped)."""
+    for prefix in prefixes:
+        PREFIXES.add(prefix)
+
+
+def remove_prefixes(prefixes: Iterable[str]) -> None:
+    """Stop recognizing Hungarian prefixes; unknown ones are ignored."""
+    for prefix in prefixes:
+        PREFIXES.discard(prefix)
+
+
+# [(ACRONYMS.version, pattern)] for _candidates(), swapped as one tuple so
+# threads never pair a version with another version's pattern
+_candidate_cache: list[tuple[int, re.Pattern[str] | None]] = [(-1, None)]
+
+
+def _candidates() -> re.Pattern[str]:
+    """Pattern finding every position an acronym may start at.
+
+    Acronyms starting with an uppercase letter may start anywhere; others only
+    after a non-alphanumeric character.
+    """
+    version, pattern = _candidate_cache[0]
+    if version != ACRONYMS.version or pattern is None:
+        # read the version first: a change made while compiling leaves the
+        # stored version behind, so the next call compiles again
+        version = ACRONYMS.version
+        firsts = tuple(ACRONYMS.root)
+        upper = "".join(re.escape(char) for char in firsts if char.isupper())
+        other = "".join(re.escape(char) for char in firsts if not char.isupper())
+        parts = []
+        if upper:
+            parts.append(f"[{upper}]")
+        if other:
+            parts.append(rf"(?<![^\W_])[{other}]")
+        pattern = re.compile("|".join(parts) or "(?!)")
+        _candidate_cache[0] = (version, pattern)
+    return pattern
+
+
+def _ends_hump(text: str, end: int) -> bool:
+    if end == len(text):
+        return True
+    after = text[end]
+    if not after.isalnum():
+        return True
+    if not after.isupper():
+        return False
+    return not text[end - 1].isupper() or text[end + 1 : end + 2].islower()
+
+
+def _match_at(text: str, start: int) -> int:
+    """End of the longest acronym at ``start`` that ends a hump, 0 if none."""
+    node = ACRONYMS.root
+    end = 0
+    for i in range(start, len(text)):
+        node = node.get(text[i])
+        if node is None:
+            break
+        if _END in node and _ends_hump(text, i + 1):
+            end = i + 1
+    return end
+
+
+def acronym_spans(text: str, start: int = 0) -> list[int]:
+    """Flat ``(start, end)`` offsets of the acronyms found in ``text[start:]``.
+
+    A match must be a whole hump: it starts at ``start``, after a
+    non-alphanumeric character or on an uppercase letter, and it ends at the
+    end of the text, before a non-alphanumeric character, before an uppercase
+    letter that follows a non-uppercase one (``OAuth|Token``) or before an
+    uppercase letter starting a capitalized word (``HTTP|Server``). Where
+    several acronyms start at one position the longest whole-hump one wins.
+    """
+    spans: list[int] = []
+    if not ACRONYMS.root:
+        return spans
+    finder = _candidates()
+    i = start
+    end = _match_at(text, i) if text[i : i + 1] in ACRONYMS.root else 0
+    while True:
+        if end:
+            spans.append(i)
+            spans.append(end)
+        found = finder.search(text, end or i + 1)
+        if found is None:
+            return spans
+        i = found.start()
+        end = _match_at(text, i)
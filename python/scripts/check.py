@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Run all checks for the magic-case project."""
 
+import argparse
 import os
 import subprocess
 import sys
@@ -21,8 +22,39 @@ def run_command(cmd: list[str], description: str) -> bool:
         return False
 
 
+def perf_check(baseline: Path, threshold: float) -> tuple[list[str], str]:
+    """Build the benchmark command; without a baseline, record one instead."""
+    cmd = ["uv", "run", "python", "benchmarks/suite.py"]
+    if baseline.exists():
+        results = baseline.with_name("results.json")
+        cmd += ["--output", str(results), "--compare", str(baseline)]
+        cmd += ["--threshold", str(threshold)]
+        return cmd, f"Performance (max {threshold:.0%} slower than {baseline})"
+    return cmd + ["--output", str(baseline)], f"Performance baseline ({baseline})"
+
+
 def main() -> int:
     """Run all checks."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--perf",
+        action="store_true",
+        help="also run the benchmark suite and fail on regressions",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=Path("benchmarks/baseline.json"),
+        help="benchmark results to compare against (recorded if missing)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="allowed slowdown of a benchmark group as a fraction (default: 0.2)",
+    )
+    args = parser.parse_args()
+
     project_root = Path(__file__).parent.parent
     os.chdir(project_root)
 
@@ -31,6 +63,8 @@ def main() -> int:
         (["uv", "run", "ruff", "format", "--check", "."], "Formatting"),
         (["uv", "run", "pytest", "-q"], "Tests"),
     ]
+    if args.perf:
+        checks.append(perf_check(args.baseline, args.threshold))
 
     all_passed = True
     for cmd, description in checks:
@@ -0,0 +1,150 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from magic_case import (
+    CamelCase,
+    SnakeCase,
+    aconvert_keys,
+    aconvert_many,
+    convert_keys,
+    convert_many,
+)
+
+ITEMS = [f"field_name_{i}" for i in range(1_000)]
+PAYLOAD = {
+    "page_info": {"next_page": None},
+    "records": [{"user_id": i, "tag_list": [{"tag_name": "x"}]} for i in range(200)],
+}
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def test_aconvert_many_matches_convert_many():
+    expected = convert_many(ITEMS, SnakeCase, CamelCase)
+    assert asyncio.run(aconvert_many(ITEMS, SnakeCase, CamelCase)) == expected
+    assert (
+        asyncio.run(aconvert_many(iter(ITEMS), SnakeCase, CamelCase, chunksize=7))
+        == expected
+    )
+    assert (
+        asyncio.run(aconvert_many(ITEMS, SnakeCase, CamelCase, offload_threshold=1))
+        == expected
+    )
+
+
+def test_aconvert_keys_matches_convert_keys():
+    expected = convert_keys(PAYLOAD, SnakeCase, CamelCase)
+    assert asyncio.run(aconvert_keys(PAYLOAD, SnakeCase, CamelCase)) == expected
+    assert (
+        asyncio.run(aconvert_keys(PAYLOAD, SnakeCase, CamelCase, chunksize=3))
+        == expected
+    )
+    assert (
+        asyncio.run(aconvert_keys(PAYLOAD, SnakeCase, CamelCase, offload_threshold=1))
+        == expected
+    )
+
+    payload = {"user_id": 1, "tag_list": [{"tag_name": "x"}]}
+    result = asyncio.run(
+        aconvert_keys(payload, SnakeCase, CamelCase, inplace=True, chunksize=1)
+    )
+    assert result is payload
+    assert payload == {"userId": 1, "tagList": [{"tagName": "x"}]}
+
+
+def test_yields_to_the_loop_between_chunks():
+    async def main():
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        before = len(ticks)
+        await aconvert_many(ITEMS, SnakeCase, CamelCase, chunksize=100)
+        during_many = len(ticks) - before
+        await aconvert_keys(PAYLOAD, SnakeCase, CamelCase, chunksize=100)
+        during_keys = len(ticks) - before - during_many
+        task.cancel()
+        return during_many, during_keys
+
+    during_many, during_keys = asyncio.run(main())
+    assert during_many >= 9
+    assert during_keys >= 5
+
+
+def test_identical_inflight_conversions_are_coalesced():
+    async def main(coalesce):
+        executor = CountingExecutor()
+        with executor:
+            many = await asyncio.gather(
+                *(
+                    aconvert_many(
+                        ITEMS,
+                        SnakeCase,
+                        CamelCase,
+                        offload_threshold=1,
+                        executor=executor,
+                        coalesce=coalesce,
+                    )
+                    for _ in range(5)
+                )
+            )
+            keys = await asyncio.gather(
+                *(
+                    aconvert_keys(
+                        PAYLOAD,
+                        SnakeCase,
+                        CamelCase,
+                        offload_threshold=1,
+                        executor=executor,
+                        coalesce=coalesce,
+                    )
+                    for _ in range(5)
+                )
+            )
+        return executor.submitted, many, keys
+
+    submitted, many, keys = asyncio.run(main(coalesce=True))
+    assert submitted == 2
+    assert all(result == many[0] for result in many)
+    assert len({id(result) for result in many}) == len(many)
+    assert all(result is keys[0] for result in keys)
+
+    submitted, _, _ = asyncio.run(main(coalesce=False))
+    assert submitted == 10
+
+
+def test_cancelled_caller_does_not_cancel_shared_conversion():
+    async def main():
+        first = asyncio.create_task(
+            aconvert_many(ITEMS, SnakeCase, CamelCase, chunksize=10)
+        )
+        second = asyncio.create_task(
+            aconvert_many(ITEMS, SnakeCase, CamelCase, chunksize=10)
+        )
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == convert_many(ITEMS, SnakeCase, CamelCase)
+
+
+def test_errors_propagate():
+    with pytest.raises(ValueError):
+        asyncio.run(aconvert_many(["fine", "NotCamel"], CamelCase, SnakeCase))
+    with pytest.raises(ValueError):
+        asyncio.run(aconvert_many(ITEMS, SnakeCase, CamelCase, chunksize=0))
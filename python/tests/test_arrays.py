@@ -0,0 +1,99 @@
+import pytest
+
+from magic_case import (
+    CamelCase,
+    KebabCase,
+    MacroCase,
+    PathCase,
+    SentenceCase,
+    SnakeCase,
+    TitleCase,
+    convert_array,
+    convert_many,
+)
+
+ITEMS = ["user_id", "http_status_code", "straße_größe", "i̇stanbul_ǅungla", "", "x"]
+PAIRS = [
+    (SnakeCase, KebabCase),
+    (SnakeCase, MacroCase),
+    (SnakeCase, SentenceCase),
+    (SnakeCase, PathCase),
+    (SnakeCase, CamelCase),
+    (TitleCase, SnakeCase),
+]
+
+
+@pytest.mark.parametrize("source,target", PAIRS)
+def test_numpy_string_dtype(source, target):
+    np = pytest.importorskip("numpy")
+    from numpy.dtypes import StringDType
+
+    items = convert_many(ITEMS, SnakeCase, source)
+    values = np.array(items, dtype=StringDType())
+    result = convert_array(values, source, target)
+    assert isinstance(result.dtype, StringDType)
+    assert result.tolist() == convert_many(items, source, target)
+
+
+@pytest.mark.parametrize("source,target", PAIRS)
+def test_numpy_fixed_width_and_object(source, target):
+    np = pytest.importorskip("numpy")
+
+    items = convert_many(ITEMS, SnakeCase, source)
+    expected = convert_many(items, source, target)
+    fixed = convert_array(np.array(items), source, target)
+    assert fixed.dtype.kind == "U"
+    assert fixed.tolist() == expected
+    objects = convert_array(np.array(items, dtype=object), source, target)
+    assert objects.dtype == object
+    assert objects.tolist() == expected
+
+
+def test_numpy_keeps_shape():
+    np = pytest.importorskip("numpy")
+
+    values = np.array([["a_b", "c_d"], ["e_f", "g_h"]])
+    assert convert_array(values, SnakeCase, KebabCase).tolist() == [
+        ["a-b", "c-d"],
+        ["e-f", "g-h"],
+    ]
+    assert convert_array(values, SnakeCase, CamelCase).shape == (2, 2)
+
+
+@pytest.mark.parametrize("target", [KebabCase, CamelCase])
+def test_numpy_empty(target):
+    np = pytest.importorskip("numpy")
+
+    result = convert_array(np.array([], dtype="U5"), SnakeCase, target)
+    assert result.dtype.kind == "U"
+    assert result.shape == (0,)
+    result = convert_array(np.empty((0, 3), dtype="U5"), SnakeCase, target)
+    assert result.dtype.kind == "U"
+    assert result.shape == (0, 3)
+
+
+@pytest.mark.parametrize("source,target", PAIRS)
+def test_arrow(source, target):
+    pa = pytest.importorskip("pyarrow")
+
+    items = convert_many(ITEMS, SnakeCase, source)
+    expected = convert_many(items, source, target)
+    result = convert_array(pa.array([*items, None]), source, target)
+    assert result.to_pylist() == [*expected, None]
+
+    large = pa.array(items, type=pa.large_string())
+    assert convert_array(large, source, target).type == pa.large_string()
+
+    chunked = pa.chunked_array([items[:2], items[2:]])
+    result = convert_array(chunked, source, target)
+    assert isinstance(result, pa.ChunkedArray)
+    assert result.to_pylist() == expected
+
+
+def test_invalid_input():
+    np = pytest.importorskip("numpy")
+
+    with pytest.raises(ValueError):
+        convert_array(np.array(["NotCamel"]), CamelCase, SnakeCase)
+    with pytest.raises(TypeError):
+        convert_array(["user_id"], SnakeCase, KebabCase)
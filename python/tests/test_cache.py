@@ -0,0 +1,166 @@
+import threading
+
+import pytest
+
+from magic_case import (
+    CamelCase,
+    HungarianCase,
+    SnakeCase,
+    cache_clear,
+    cache_info,
+    convert_keys,
+    convert_many,
+    disable_cache,
+    disable_interning,
+    enable_cache,
+    enable_interning,
+    intern_clear,
+    intern_info,
+)
+from magic_case.cache import InternPool, LRUCache
+
+
+@pytest.fixture
+def cache():
+    enable_cache(maxsize=8)
+    yield
+    disable_cache()
+
+
+def test_cache_disabled_by_default():
+    assert cache_info() is None
+
+
+def test_split_and_render_hits(cache):
+    assert CamelCase(SnakeCase("hello_world")).get() == "helloWorld"
+    first = cache_info()
+    assert first.hits == 0
+    assert first.misses == 2  # one split, one render
+
+    assert CamelCase(SnakeCase("hello_world")).get() == "helloWorld"
+    assert cache_info().hits == 2
+
+
+def test_cached_words_are_not_shared(cache):
+    SnakeCase("hello_world").words.append("mutated")
+    assert SnakeCase("hello_world").words == ["hello", "world"]
+
+
+def test_convert_many_uses_cache(cache):
+    assert convert_many(["a_b", "a_b", "c_d"], SnakeCase, CamelCase) == [
+        "aB",
+        "aB",
+        "cD",
+    ]
+    assert cache_info().hits == 2
+
+
+def test_hungarian_prefix_survives_cache(cache):
+    assert HungarianCase("strHelloWorld").get() == "strHelloWorld"
+    assert HungarianCase("strHelloWorld").get() == "strHelloWorld"
+    assert SnakeCase(HungarianCase("strHelloWorld")).get() == "hello_world"
+
+
+def test_eviction_and_clear(cache):
+    for i in range(20):
+        SnakeCase(f"word_{i}")
+    info = cache_info()
+    assert info.currsize == 8
+    assert info.evictions == 12
+
+    cache_clear()
+    assert cache_info() == (0, 0, 0, 8, 0)
+
+
+def test_failed_splits_are_not_evictions(cache):
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            CamelCase("Bad_Input")
+    info = cache_info()
+    assert (info.misses, info.evictions, info.currsize) == (3, 0, 0)
+
+
+def test_lru_order():
+    lru = LRUCache(maxsize=2)
+    split = SnakeCase._split_into_words
+    lru.split(split, "a_b")
+    lru.split(split, "c_d")
+    lru.split(split, "a_b")
+    lru.split(split, "e_f")  # evicts c_d, the least recently used
+    assert lru.info().hits == 1
+
+    lru.split(split, "a_b")
+    assert lru.info().hits == 2
+    lru.split(split, "c_d")
+    assert lru.info().misses == 4
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+
+def test_thread_safety():
+    lru = LRUCache(maxsize=64)
+    split = SnakeCase._split_into_words
+
+    def worker(offset):
+        for i in range(2000):
+            text = f"key_{(offset + i) % 100}"
+            assert lru.split(split, text) == ["key", str((offset + i) % 100)]
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    info = lru.info()
+    assert info.hits + info.misses == 16000
+    assert info.currsize <= 64
+
+
+@pytest.fixture
+def interning():
+    enable_interning(maxsize=8)
+    yield
+    disable_interning()
+
+
+def test_interning_disabled_by_default():
+    assert intern_info() is None
+    first, second = convert_many(["user_id", "user_id"], SnakeCase, CamelCase)
+    assert first == second
+    assert first is not second
+
+
+def test_interned_results_are_shared(interning):
+    first = CamelCase(SnakeCase("user_id")).get()
+    many = convert_many(["user_id", "user_id"], SnakeCase, CamelCase)
+    keys = convert_keys([{"user_id": 1}, {"user_id": 2, "x": 3}], SnakeCase, CamelCase)
+    renamed = [next(iter(record)) for record in keys]
+    assert all(text is first for text in many + renamed)
+    info = intern_info()
+    assert info.misses == 2  # userId, x
+    assert info.currsize == 2
+
+
+def test_interning_pool_is_bounded(interning):
+    convert_many([f"key_{i}" for i in range(20)], SnakeCase, CamelCase)
+    info = intern_info()
+    assert (info.misses, info.evictions, info.currsize) == (20, 12, 8)
+    intern_clear()
+    assert intern_info() == (0, 0, 0, 8, 0)
+
+
+def test_intern_pool_evicts_oldest():
+    pool = InternPool(maxsize=2)
+    a, b = "".join(["a", "b"]), "".join(["c", "d"])
+    assert pool.intern(a) is a
+    assert pool.intern(b) is b
+    assert pool.intern("".join(["a", "b"])) is a
+    pool.intern("ef")
+    assert pool.intern("".join(["a", "b"])) is not a
+    assert pool.info().evictions == 2
+    with pytest.raises(ValueError):
+        InternPool(maxsize=0)
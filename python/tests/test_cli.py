@@ -0,0 +1,141 @@
+import csv
+import io
+
+import pytest
+
+from magic_case.cli import main
+
+
+def run(monkeypatch, capsys, argv, stdin=""):
+    monkeypatch.setattr(
+        "sys.stdin", io.TextIOWrapper(io.BytesIO(stdin.encode()), encoding="utf-8")
+    )
+    code = main(argv)
+    out, err = capsys.readouterr()
+    return code, out, err
+
+
+def test_lines_from_stdin(monkeypatch, capsys):
+    code, out, _ = run(
+        monkeypatch,
+        capsys,
+        ["--from", "snake", "--to", "camel"],
+        "hello_world\nuser_id\nlast",
+    )
+    assert code == 0
+    assert out == "helloWorld\nuserId\nlast"
+
+
+def test_lines_from_file(monkeypatch, capsys, tmp_path):
+    path = tmp_path / "keys.txt"
+    path.write_text("Content-Type\r\nX-Request-Id\r\n")
+    code, out, _ = run(
+        monkeypatch, capsys, [str(path), "--from", "http-header", "--to", "snake"]
+    )
+    assert code == 0
+    assert out == "content_type\nx_request_id\n"
+
+
+def test_empty_lines_pass_through(monkeypatch, capsys):
+    code, out, _ = run(
+        monkeypatch,
+        capsys,
+        ["--from", "camel", "--to", "snake"],
+        "userId\n\nfooBar\n",
+    )
+    assert code == 0
+    assert out == "user_id\n\nfoo_bar\n"
+
+
+def test_missing_file(monkeypatch, capsys, tmp_path):
+    code, out, err = run(
+        monkeypatch,
+        capsys,
+        [str(tmp_path / "missing.txt"), "--from", "snake", "--to", "camel"],
+    )
+    assert code == 1
+    assert out == ""
+    assert err.startswith("magic-case: ")
+
+
+def test_invalid_input_fails(monkeypatch, capsys):
+    code, _, err = run(
+        monkeypatch, capsys, ["--from", "camel", "--to", "snake"], "NotCamel\n"
+    )
+    assert code == 1
+    assert "Invalid CamelCase" in err
+
+
+def test_keep_invalid(monkeypatch, capsys):
+    code, out, _ = run(
+        monkeypatch,
+        capsys,
+        ["--from", "camel", "--to", "snake", "--keep-invalid"],
+        "NotCamel\nfooBar\n",
+    )
+    assert code == 0
+    assert out == "NotCamel\nfoo_bar\n"
+
+
+def test_csv_column(monkeypatch, capsys):
+    code, out, _ = run(
+        monkeypatch,
+        capsys,
+        ["--from", "snake", "--to", "pascal", "--column", "2", "--skip-header"],
+        'id,name,note\n1,user_id,"a, b"\n2,created_at,x\n',
+    )
+    assert code == 0
+    assert out == 'id,name,note\n1,UserId,"a, b"\n2,CreatedAt,x\n'
+
+
+def test_csv_column_from_stdin_keeps_quoted_crlf(monkeypatch, capsys):
+    code, out, _ = run(
+        monkeypatch,
+        capsys,
+        ["--from", "snake", "--to", "camel", "--column", "1"],
+        'user_id,"line one\r\nline two"\r\n,empty\r\n',
+    )
+    assert code == 0
+    assert out == 'userId,"line one\r\nline two"\n,empty\n'
+
+
+def test_tsv_column(monkeypatch, capsys):
+    code, out, _ = run(
+        monkeypatch,
+        capsys,
+        ["--from", "kebab", "--to", "macro", "--column", "1", "--tsv"],
+        "max-retries\t3\nshort\n",
+    )
+    assert code == 0
+    assert out == "MAX_RETRIES\t3\nSHORT\n"
+
+
+def test_unknown_case_rejected(monkeypatch, capsys):
+    with pytest.raises(SystemExit):
+        run(monkeypatch, capsys, ["--from", "nope", "--to", "snake"])
+
+
+def test_multi_character_delimiter_rejected(monkeypatch, capsys):
+    with pytest.raises(SystemExit) as info:
+        run(
+            monkeypatch,
+            capsys,
+            ["--from", "kebab", "--to", "snake", "--column", "1", "--delimiter", ";;"],
+        )
+    assert info.value.code == 2
+    assert "single character" in capsys.readouterr().err
+
+
+def test_malformed_csv_fails(monkeypatch, capsys):
+    limit = csv.field_size_limit(8)
+    try:
+        code, _, err = run(
+            monkeypatch,
+            capsys,
+            ["--from", "kebab", "--to", "snake", "--column", "1"],
+            "a-field-longer-than-eight,1\n",
+        )
+    finally:
+        csv.field_size_limit(limit)
+    assert code == 2
+    assert "malformed CSV input" in err
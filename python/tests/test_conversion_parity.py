@@ -0,0 +1,69 @@
+"""Every registered fast path must match the generic word pipeline exactly."""
+
+import pytest
+
+from magic_case import DotCase, KebabCase, SnakeCase, SpaceCase, convert_many
+from magic_case.convert import _FAST_PATHS, register_conversion
+
+SAMPLES = [
+    "",
+    "hello",
+    "hello_world",
+    "hello_world_again",
+    "one_two_three_four",
+    "HELLO_WORLD",
+    "hello-world",
+    "hello-world-again",
+    "one-two-three-four",
+    "hello.world",
+    "hello.world.again",
+    "hello world",
+    "hello world again",
+    "one two three four",
+    "   hello   world   again  ",
+    "hello, world",
+    "foo_barBaz.qux",
+    "foo123_bar456",
+    "a__b--c..d  e",
+    "_leading_and_trailing_",
+    "MiXeD_CaSe-Input.With Spaces",
+    "tab\tseparated words",
+    "straße_größe",
+    "İstanbul_ǅemal",
+    "ﬁle-name",
+    "ΣΊΣΥΦΟΣ ΟΔΌΣ",
+]
+
+
+@pytest.mark.parametrize(
+    "source, target",
+    sorted(_FAST_PATHS, key=lambda pair: (pair[0].__name__, pair[1].__name__)),
+    ids=lambda cls: cls.__name__,
+)
+def test_fast_path_parity(source, target):
+    fast = _FAST_PATHS[source, target]
+    for text in SAMPLES:
+        assert fast(text) == target(source(text)).get(), text
+
+
+def test_convert_many_uses_fast_path():
+    assert convert_many(["hello_world", "a__b"], SnakeCase, KebabCase) == [
+        "hello-world",
+        "a--b",
+    ]
+
+
+def test_register_conversion_overrides_pipeline():
+    original = _FAST_PATHS[KebabCase, DotCase]
+    try:
+
+        @register_conversion(KebabCase, DotCase)
+        def kebab_to_dot(text):
+            return "custom"
+
+        assert convert_many(["a-b"], KebabCase, DotCase) == ["custom"]
+    finally:
+        register_conversion(KebabCase, DotCase)(original)
+
+    assert convert_many(["a-b"], KebabCase, DotCase) == ["a.b"]
+    assert (SpaceCase, SnakeCase) not in _FAST_PATHS
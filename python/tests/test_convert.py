@@ -0,0 +1,266 @@
+import pickle
+
+import pytest
+
+from magic_case import (
+    CamelCase,
+    CamelSnakeCase,
+    DotCase,
+    FlatCase,
+    HttpHeaderCase,
+    HungarianCase,
+    KebabCase,
+    MacroCase,
+    PascalCase,
+    PascalSnakeCase,
+    SnakeCase,
+    SpaceCase,
+    TitleCase,
+    UpperCase,
+    compile,
+    convert_keys,
+    convert_many,
+    set_max_length,
+)
+
+
+@pytest.mark.parametrize(
+    "source, items",
+    [
+        (SnakeCase, ["hello_world", "one_two_three", "x"]),
+        (KebabCase, ["hello-world", "one-two-three"]),
+        (CamelCase, ["helloWorld", "myHTTPServer"]),
+        (PascalCase, ["HelloWorld", "MyHTTPServer"]),
+        (HttpHeaderCase, ["Content-Type", "X-Request-Id"]),
+        (HungarianCase, ["strHelloWorld", "iCount", "bIsAdmin"]),
+        (CamelSnakeCase, ["hello_World_Again"]),
+        (SpaceCase, ["  hello   world  "]),
+        (FlatCase, ["FOO-BAR", "foo.bar"]),
+    ],
+)
+@pytest.mark.parametrize(
+    "target",
+    [
+        SnakeCase,
+        CamelCase,
+        PascalCase,
+        KebabCase,
+        UpperCase,
+        TitleCase,
+        DotCase,
+        MacroCase,
+        PascalSnakeCase,
+        HungarianCase,
+    ],
+)
+def test_convert_many_matches_per_object(source, items, target):
+    expected = [target(source(item)).get() for item in items]
+    assert convert_many(items, source, target) == expected
+
+
+def test_convert_many_lazy():
+    result = convert_many(
+        iter(["hello_world", "foo_bar"]), SnakeCase, CamelCase, lazy=True
+    )
+    assert not isinstance(result, list)
+    assert list(result) == ["helloWorld", "fooBar"]
+
+
+def test_convert_many_propagates_validation_errors():
+    with pytest.raises(ValueError):
+        convert_many(["HelloWorld"], CamelCase, SnakeCase)
+
+
+def test_convert_many_custom_subclass():
+    class ShoutCase(SnakeCase):
+        def _split_into_words(self, text):
+            return text.lower().split("!")
+
+        def __str__(self):
+            return "!".join(self.words).upper()
+
+    assert convert_many(["a!b"], ShoutCase, ShoutCase) == ["A!B"]
+    assert convert_many(["a_b"], SnakeCase, ShoutCase) == ["A!B"]
+
+
+PAYLOAD = {
+    "user_id": 1,
+    "profile_info": {"first_name": "Ada", "last_name": "Lovelace"},
+    "recent_orders": [
+        {"order_id": 7, "line_items": [{"sku_code": "x"}]},
+        {"order_id": 8, "line_items": []},
+    ],
+    42: "non-string key",
+    "plain": ["keep_me", {"nested_key": None}],
+}
+
+EXPECTED = {
+    "userId": 1,
+    "profileInfo": {"firstName": "Ada", "lastName": "Lovelace"},
+    "recentOrders": [
+        {"orderId": 7, "lineItems": [{"skuCode": "x"}]},
+        {"orderId": 8, "lineItems": []},
+    ],
+    42: "non-string key",
+    "plain": ["keep_me", {"nestedKey": None}],
+}
+
+
+def test_convert_keys_copies():
+    result = convert_keys(PAYLOAD, SnakeCase, CamelCase)
+    assert result == EXPECTED
+    assert list(result) == list(EXPECTED)
+    assert "user_id" in PAYLOAD
+    assert PAYLOAD["profile_info"] is not result["profileInfo"]
+
+
+def test_convert_keys_inplace():
+    import copy
+
+    payload = copy.deepcopy(PAYLOAD)
+    inner = payload["recent_orders"][0]
+    result = convert_keys(payload, SnakeCase, CamelCase, inplace=True)
+    assert result is payload
+    assert payload == EXPECTED
+    assert payload["recentOrders"][0] is inner
+
+
+def test_convert_keys_inplace_shared_containers():
+    shared = {"user_id": 1}
+    payload = [shared, shared, {"nested_list": [shared]}]
+    payload.append(payload)
+    result = convert_keys(payload, SnakeCase, CamelCase, inplace=True)
+    assert result[:2] == [{"userId": 1}, {"userId": 1}]
+    assert result[2] == {"nestedList": [{"userId": 1}]}
+
+
+def test_convert_keys_copy_detects_cycles():
+    looped = {"user_id": 1, "items": []}
+    looped["items"].append({"parent_ref": looped})
+    with pytest.raises(ValueError, match="Circular reference detected"):
+        convert_keys(looped, SnakeCase, CamelCase)
+    chain = [[]]
+    chain[0].append(chain)
+    with pytest.raises(ValueError, match="Circular reference detected"):
+        convert_keys(chain, SnakeCase, CamelCase)
+    # a container reached twice without looping is copied twice
+    shared = {"user_id": 1}
+    result = convert_keys([shared, {"inner_list": [shared]}], SnakeCase, CamelCase)
+    assert result == [{"userId": 1}, {"innerList": [{"userId": 1}]}]
+
+
+def test_convert_keys_keeps_key_types():
+    assert convert_keys({1: 2}, SnakeCase, CamelCase) == {1: 2}
+    result = convert_keys({True: 3}, SnakeCase, CamelCase)
+    assert type(next(iter(result))) is bool
+    wide = {f"key_{i}": i for i in range(100)}
+    assert convert_keys(wide, SnakeCase, CamelCase) == {
+        f"key{i}": i for i in range(100)
+    }
+
+
+def test_convert_keys_scalars_and_lists():
+    assert convert_keys("user_id", SnakeCase, CamelCase) == "user_id"
+    assert convert_keys([{"a_b": 1}], SnakeCase, KebabCase) == [{"a-b": 1}]
+
+
+def test_convert_keys_deep_nesting():
+    depth = 5000
+    payload = leaf = {}
+    for _ in range(depth):
+        child = {}
+        leaf["child_node"] = child
+        leaf = child
+
+    result = convert_keys(payload, SnakeCase, CamelCase)
+    for _ in range(depth):
+        result = result["childNode"]
+    assert result == {}
+
+
+@pytest.mark.parametrize("use_cache", [True, False])
+@pytest.mark.parametrize(
+    "source, target, text",
+    [
+        (SnakeCase, HttpHeaderCase, "content_type_value"),
+        (SnakeCase, KebabCase, "user_id"),
+        (CamelCase, SnakeCase, "parseHTTPResponse"),
+        (HungarianCase, TitleCase, "strUserName"),
+        (SpaceCase, TitleCase, "  some  words "),
+    ],
+)
+def test_compile_matches_case_objects(source, target, text, use_cache):
+    convert = compile(source, target, use_cache=use_cache)
+    assert convert(text) == target(source(text)).get()
+    assert convert.many([text, text]) == [convert(text)] * 2
+    assert list(convert.many(iter([text]), lazy=True)) == [convert(text)]
+
+
+def test_compile_errors_option():
+    with pytest.raises(ValueError):
+        compile(CamelCase, SnakeCase)("NotCamel")
+    keep = compile(CamelCase, SnakeCase, errors="keep")
+    assert keep("NotCamel") == "NotCamel"
+    assert keep("userId") == "user_id"
+    with pytest.raises(ValueError):
+        compile(CamelCase, SnakeCase, errors="ignore")
+
+
+def test_compile_pickles():
+    convert = compile(CamelCase, HttpHeaderCase, errors="keep")
+    restored = pickle.loads(pickle.dumps(convert))
+    assert restored("userId") == "User-Id"
+    assert restored("NotCamel") == "NotCamel"
+    assert (restored.source, restored.target) == (CamelCase, HttpHeaderCase)
+    assert repr(restored) == "<Converter CamelCase -> HttpHeaderCase>"
+
+
+def test_compile_as_class_attribute():
+    class Model:
+        to_camel = compile(SnakeCase, CamelCase)
+
+    assert Model().to_camel("user_id") == "userId"
+    assert Model.to_camel("user_id") == "userId"
+
+
+@pytest.fixture
+def max_length():
+    set_max_length(8)
+    yield
+    set_max_length(None)
+
+
+def test_max_length_rejects_long_input(max_length):
+    assert CamelCase(SnakeCase("user_id")).get() == "userId"
+    with pytest.raises(ValueError, match="exceeds the limit of 8"):
+        SnakeCase("user_name_value")
+    # fast paths and the generic pipeline alike
+    for target in (KebabCase, CamelCase):
+        with pytest.raises(ValueError):
+            convert_many(["user_id", "user_name_value"], SnakeCase, target)
+    with pytest.raises(ValueError):
+        convert_keys({"user_name_value": 1}, SnakeCase, CamelCase)
+    assert convert_keys({"user_id": 1, 2: 3}, SnakeCase, CamelCase) == {
+        "userId": 1,
+        2: 3,
+    }
+
+
+def test_max_length_lifted():
+    set_max_length(8)
+    set_max_length(None)
+    assert convert_many(["user_name_value"], SnakeCase, CamelCase) == ["userNameValue"]
+    with pytest.raises(ValueError):
+        set_max_length(-1)
+
+
+def test_compile_max_length(max_length):
+    keep = compile(SnakeCase, CamelCase, errors="keep")
+    assert keep.max_length == 8
+    assert keep("user_name_value") == "user_name_value"
+    assert keep("user_id") == "userId"
+    wider = compile(SnakeCase, KebabCase, max_length=20)
+    restored = pickle.loads(pickle.dumps(wider))
+    assert restored("user_name_value") == "user-name-value"
+    with pytest.raises(ValueError):
+        restored("user_name_value_too_long")
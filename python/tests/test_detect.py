@@ -0,0 +1,103 @@
+import pytest
+
+from magic_case import (
+    AnyCase,
+    CamelCase,
+    CamelSnakeCase,
+    DotCase,
+    FlatCase,
+    HttpHeaderCase,
+    KebabCase,
+    MacroCase,
+    PascalCase,
+    PascalSnakeCase,
+    PathCase,
+    SentenceCase,
+    SlashTitleCase,
+    SnakeCase,
+    SpaceCase,
+    TitleCase,
+    detect_case,
+)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("hello_world", SnakeCase),
+        ("hello123_world456", SnakeCase),
+        ("HELLO_WORLD", MacroCase),
+        ("HTTP", MacroCase),
+        ("hello_World_Again", CamelSnakeCase),
+        ("Hello_World", PascalSnakeCase),
+        ("hello-world", KebabCase),
+        ("Content-Type", HttpHeaderCase),
+        ("X-Content-Security-Policy-Mode", HttpHeaderCase),
+        ("Content-type", KebabCase),
+        ("hello.world", DotCase),
+        ("hello/world", PathCase),
+        ("Hello/World", SlashTitleCase),
+        ("hello world", SpaceCase),
+        ("Hello World Again", TitleCase),
+        ("Hello world again", SentenceCase),
+        ("helloWorld", CamelCase),
+        ("myHTTPServer", CamelCase),
+        ("HelloWorld", PascalCase),
+        ("helloworld", FlatCase),
+        ("hello", FlatCase),
+    ],
+)
+def test_detect_case(text, expected):
+    assert detect_case(text) is expected
+    parsed = AnyCase(text)
+    assert parsed.case is expected
+    assert parsed.words == expected(text).words
+    assert parsed.get() == expected(text).get()
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("X-API-Key", KebabCase),
+        ("2faEnabled", None),
+        ("2FA", MacroCase),
+        ("a/", None),
+        ("aA/", None),
+        ("/Home", None),
+        ("usr//bin", None),
+        ("straße//größe", None),
+    ],
+)
+def test_detect_only_accepting_cases(text, expected):
+    assert detect_case(text) is expected
+
+
+@pytest.mark.parametrize("text", ["", "foo_bar-baz", "a.b/c"])
+def test_undetectable(text):
+    assert detect_case(text) is None
+    with pytest.raises(ValueError):
+        AnyCase(text)
+
+
+def test_detected_case_accepts_text():
+    # every short string over letters, digits and separators
+    alphabet = "aZ1ßǅ_-./ \t"
+    texts = [""]
+    for _ in range(4):
+        texts = [text + char for text in texts for char in alphabet]
+        for text in texts:
+            case = detect_case(text)
+            if case is not None:
+                case(text)
+
+
+def test_any_case_conversion():
+    assert CamelCase(AnyCase("user_id")).get() == "userId"
+    assert SnakeCase(AnyCase("Content-Type")).get() == "content_type"
+    assert AnyCase(SnakeCase("user_id")).get() == "user_id"
+    assert AnyCase(AnyCase("userId")).case is CamelCase
+
+
+def test_any_case_invalid_type():
+    with pytest.raises(TypeError):
+        AnyCase(123)  # type: ignore[arg-type]
@@ -0,0 +1,79 @@
+"""Guard the cold-start cost of ``import magic_case``."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import magic_case
+
+PROJECT_ROOT = Path(__file__).parent.parent
+# Generous budget for ``import magic_case`` itself, in microseconds
+IMPORT_BUDGET_US = 20_000
+
+
+def import_times(code: str) -> dict[str, int]:
+    """Run ``code`` under ``-X importtime`` and return cumulative us per module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_package_import_is_lazy():
+    times = import_times("import magic_case")
+    loaded = {name for name in times if name.startswith("magic_case.")}
+    assert loaded == set()
+    assert times["magic_case"] < IMPORT_BUDGET_US
+
+
+def test_single_class_loads_only_its_modules():
+    times = import_times("from magic_case import SnakeCase")
+    loaded = {name for name in times if name.startswith("magic_case.")}
+    assert loaded == {
+        "magic_case.snake",
+        "magic_case.base",
+        "magic_case.cache",
+        "magic_case.tokenizer",
+        "magic_case.vocab",
+    }
+
+
+def test_lazy_attributes():
+    assert set(magic_case.__all__) <= set(dir(magic_case))
+    for name in magic_case.__all__:
+        assert getattr(magic_case, name) is not None
+
+    from magic_case import SnakeCase
+    from magic_case.snake import SnakeCase as Direct
+
+    assert SnakeCase is Direct
+
+
+def test_star_import_keeps_builtin_compile():
+    namespace: dict[str, object] = {}
+    exec("from magic_case import *", namespace)
+    assert "compile" not in namespace
+    assert "compile" in dir(magic_case)
+    from magic_case import compile
+    from magic_case.convert import compile as direct
+
+    assert compile is direct
+
+
+def test_unknown_attribute():
+    try:
+        magic_case.NoSuchCase  # noqa: B018
+    except AttributeError as exc:
+        assert "NoSuchCase" in str(exc)
+    else:
+        raise AssertionError("expected AttributeError")
@@ -0,0 +1,91 @@
+import pickle
+
+import pytest
+
+from magic_case import (
+    CamelCase,
+    CaseIndex,
+    FlatCase,
+    HttpHeaderCase,
+    PascalCase,
+    SentenceCase,
+    SnakeCase,
+    SpaceCase,
+)
+
+
+def test_forward_and_reverse():
+    index = CaseIndex([CamelCase, HttpHeaderCase], ["user_id", "created_at"])
+    assert (
+        len(index) == 2
+        and "user_id" in index
+        and list(index)
+        == [
+            "user_id",
+            "created_at",
+        ]
+    )
+    assert index.render("user_id", CamelCase) == "userId"
+    assert index.lookup("userId", CamelCase) == "user_id"
+    assert index.lookup("Created-At", HttpHeaderCase) == "created_at"
+    with pytest.raises(KeyError):
+        index.lookup("missing", CamelCase)
+    with pytest.raises(KeyError):
+        index.lookup("userId", SnakeCase)
+
+
+def test_lossy_targets_and_collisions():
+    index = CaseIndex([FlatCase, SentenceCase], ["user_id", "userid", "user_name"])
+    assert index.collisions(FlatCase) == {"userid": ["user_id", "userid"]}
+    assert index.collisions() == {FlatCase: {"userid": ["user_id", "userid"]}}
+    assert index.collisions(SentenceCase) == {}
+    assert index.lookup("username", FlatCase) == "user_name"
+    assert index.lookup("User id", SentenceCase) == "user_id"
+    assert index.lookup_all("userid", FlatCase) == ["user_id", "userid"]
+    with pytest.raises(ValueError, match="ambiguous"):
+        index.lookup("userid", FlatCase)
+
+
+def test_incremental_add_and_discard():
+    index = CaseIndex([FlatCase, CamelCase])
+    index.add("user_id")
+    index.add("user_id")
+    index.update(["userid"])
+    assert index.collisions(FlatCase) == {"userid": ["user_id", "userid"]}
+
+    index.discard("user_id")
+    index.discard("missing")
+    assert index.collisions() == {}
+    assert index.lookup("userid", FlatCase) == "userid"
+    assert "user_id" not in index
+    with pytest.raises(KeyError):
+        index.lookup("userId", CamelCase)
+
+    index.discard("userid")
+    assert len(index) == 0 and index.lookup_all("userid", FlatCase) == []
+
+
+def test_other_source_and_errors():
+    index = CaseIndex([SnakeCase], ["UserId"], source=PascalCase)
+    assert index.lookup("user_id", SnakeCase) == "UserId"
+    with pytest.raises(ValueError):
+        index.add("notPascal")
+    assert len(index) == 1
+    with pytest.raises(ValueError):
+        CaseIndex([])
+
+
+def test_failed_add_leaves_index_unchanged():
+    index = CaseIndex([SpaceCase, CamelCase], ["user id"], source=SpaceCase)
+    with pytest.raises(ValueError):
+        index.add("   ")
+    assert "   " not in index
+    assert index.lookup_all("", SpaceCase) == []
+    index.discard("   ")
+    assert list(index) == ["user id"]
+
+
+def test_pickle():
+    index = CaseIndex([CamelCase], ["user_id"])
+    clone = pickle.loads(pickle.dumps(index))
+    assert clone.lookup("userId", CamelCase) == "user_id"
@@ -0,0 +1,80 @@
+import io
+import json
+
+import pytest
+
+from magic_case import (
+    CamelCase,
+    SnakeCase,
+    convert_json_stream,
+    convert_keys,
+    iter_convert_json,
+)
+from magic_case.jsonstream import KeyRewriter
+
+DOCUMENT = (
+    b'{"user_id": 1, "created_at":"2024-01-01",\n'
+    b' "tag_list": ["first_tag", {"nested_key": 1.50e3}],\n'
+    b' "note_text": "a \\"quoted_key\\": value \\\\", "uni_code": "\\u00e9t\\u00e9",\n'
+    b' "empty_map": {}, "empty_list": [], "null_value": null}\n'
+)
+
+
+def chunked(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def test_keys_renamed_values_untouched():
+    out = b"".join(iter_convert_json([DOCUMENT], SnakeCase, CamelCase))
+    assert json.loads(out) == convert_keys(json.loads(DOCUMENT), SnakeCase, CamelCase)
+    # every byte outside the keys is kept, including number and escape spelling
+    assert b"1.50e3" in out and b'"\\u00e9t\\u00e9"' in out
+    assert out.replace(b"userId", b"user_id").startswith(b'{"user_id": 1, "createdAt"')
+    assert b'"a \\"quoted_key\\": value \\\\"' in out
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64])
+def test_any_chunk_boundaries(size):
+    expected = b"".join(iter_convert_json([DOCUMENT], SnakeCase, CamelCase))
+    assert b"".join(
+        iter_convert_json(chunked(DOCUMENT, size), SnakeCase, CamelCase)
+    ) == (expected)
+
+
+def test_json_lines_stream():
+    lines = [{"user_id": i, "event_list": [{"event_type": "x_y"}]} for i in range(100)]
+    data = b"".join(json.dumps(line).encode() + b"\n" for line in lines)
+    out = io.BytesIO()
+    keys = convert_json_stream(
+        io.BytesIO(data), out, SnakeCase, CamelCase, chunk_size=5
+    )
+    assert keys == 300
+    assert out.getvalue().splitlines() == [
+        json.dumps(convert_keys(line, SnakeCase, CamelCase)).encode() for line in lines
+    ]
+
+
+def test_long_values_are_streamed():
+    value = "x\\\\" * 100_000
+    data = f'{{"long_value": "{value}", "after_key": 1}}'.encode()
+    rewriter = KeyRewriter(SnakeCase, CamelCase)
+    pieces = [rewriter.feed(chunk) for chunk in chunked(data, 1000)]
+    rewriter.close()
+    # output keeps pace with input instead of waiting for the string to end
+    assert all(len(piece) >= 999 for piece in pieces[1:-1])
+    assert b"".join(pieces) == data.replace(b"long_value", b"longValue").replace(
+        b"after_key", b"afterKey"
+    )
+
+
+def test_escaped_keys_and_errors():
+    out = b"".join(iter_convert_json([b'{"user\\u005fid": 1}'], SnakeCase, CamelCase))
+    assert out == b'{"userId": 1}'
+    with pytest.raises(ValueError):
+        list(iter_convert_json([b'{"NotCamel": 1}'], CamelCase, SnakeCase))
+    kept = iter_convert_json([b'{"NotCamel": 1}'], CamelCase, SnakeCase, errors="keep")
+    assert b"".join(kept) == b'{"NotCamel": 1}'
+    with pytest.raises(ValueError, match="inside a string"):
+        list(iter_convert_json([b'{"user_id": "abc'], SnakeCase, CamelCase))
+    with pytest.raises(ValueError, match="unclosed"):
+        list(iter_convert_json([b'{"user_id": [1'], SnakeCase, CamelCase))
@@ -1,6 +1,7 @@
 import pytest
 
 from magic_case import (
+    BaseCase,
     CamelCase,
     KebabCase,
     PascalCase,
@@ -54,6 +55,15 @@ def test_title_case_basic():
     assert t.get() == "Hello World"
 
 
+def test_words_is_a_copy():
+    s = SnakeCase("hello_world")
+    s.words.append("again")
+    assert s.words == ["hello", "world"]
+    assert str(s) == "hello_world"
+    s.words = [*s.words, "again"]
+    assert str(s) == "hello_world_again"
+
+
 def test_cross_conversion_from_snake():
     snake = SnakeCase("hello_world")
     assert CamelCase(snake).get() == "helloWorld"
@@ -68,3 +78,23 @@ def test_invalid_input_type_raises():
     with pytest.raises(TypeError):
         # @ts-ignore - intentionally wrong type
         SnakeCase(123)  # type: ignore[arg-type]
+
+
+def test_subclass_without_rendering_is_rejected():
+    with pytest.raises(TypeError, match="_join_words or __str__"):
+
+        class Mute(BaseCase):
+            def _split_into_words(self, text):
+                return text.split()
+
+    class Partial(BaseCase):
+        pass
+
+    class Loud(Partial):
+        def _split_into_words(self, text):
+            return text.split()
+
+        def __str__(self):
+            return " ".join(self.words).upper()
+
+    assert str(Loud("a b")) == "A B"
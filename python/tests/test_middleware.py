@@ -0,0 +1,232 @@
+import asyncio
+import io
+import json
+
+import pytest
+
+from magic_case import (
+    ASGIMiddleware,
+    CamelCase,
+    SnakeCase,
+    WSGIMiddleware,
+    add_acronyms,
+    remove_acronyms,
+    set_max_length,
+)
+
+# converted bodies are serialized compactly
+REQUEST = b'{"userId":1,"recentOrders":[{"orderId":7,"noteText":"keepThis"}]}'
+CONVERTED = b'{"user_id":1,"recent_orders":[{"order_id":7,"note_text":"keepThis"}]}'
+
+# request bodies (and, for ASGI, content lengths) the stand-in apps received
+seen: list = []
+
+
+def wsgi_echo(environ, start_response):
+    """Echo the request body back with the request's content type."""
+    body = environ["wsgi.input"].read(int(environ.get("CONTENT_LENGTH") or 0))
+    seen.append(body)
+    headers = [
+        ("Content-Type", environ.get("CONTENT_TYPE", "text/plain")),
+        ("Content-Length", str(len(body))),
+    ]
+    start_response("200 OK", headers)
+    return [body[:10], body[10:]]
+
+
+def call_wsgi(app, body, content_type="application/json"):
+    seen.clear()
+    environ = {
+        "REQUEST_METHOD": "POST",
+        "CONTENT_TYPE": content_type,
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+    }
+    started = []
+    chunks = app(
+        environ, lambda status, headers, exc_info=None: started.append(headers)
+    )
+    body = b"".join(chunks)
+    getattr(chunks, "close", lambda: None)()
+    return dict(started[0]), body
+
+
+def test_wsgi_converts_both_directions():
+    headers, body = call_wsgi(WSGIMiddleware(wsgi_echo), REQUEST)
+    assert seen == [CONVERTED]
+    assert body == REQUEST
+    assert headers["Content-Length"] == str(len(REQUEST))
+
+
+def test_wsgi_generator_app_and_vendor_json():
+    def app(environ, start_response):
+        start_response("200 OK", [("Content-Type", "application/vnd.api+json")])
+        yield b'{"page_'
+        yield b'size": 3}'
+
+    headers, body = call_wsgi(WSGIMiddleware(app), b"")
+    assert json.loads(body) == {"pageSize": 3}
+    assert headers["Content-Length"] == str(len(body))
+
+
+@pytest.mark.parametrize(
+    "content_type, body",
+    [
+        ("text/plain", REQUEST),  # not JSON
+        ("application/json", b'{"userId": [1, '),  # truncated
+        ("application/json", REQUEST + b" " * 100),  # over max_body_size
+    ],
+)
+def test_wsgi_passes_through_untouched(content_type, body):
+    app = WSGIMiddleware(wsgi_echo, max_body_size=len(REQUEST) + 10)
+    headers, echoed = call_wsgi(app, body, content_type)
+    assert seen == [body]
+    assert echoed == body
+    assert headers["Content-Length"] == str(len(body))
+
+
+def asgi_echo(scope, receive, send):
+    async def app():
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        seen.append((body, dict(scope["headers"]).get(b"content-length")))
+        headers = [(b"content-type", dict(scope["headers"])[b"content-type"])]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        for start in range(0, len(body), 16):
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": body[start : start + 16],
+                    "more_body": start + 16 < len(body),
+                }
+            )
+
+    return app()
+
+
+def call_asgi(app, body, content_type=b"application/json", chunk=8):
+    seen.clear()
+    messages = [
+        {
+            "type": "http.request",
+            "body": body[i : i + chunk],
+            "more_body": i + chunk < len(body),
+        }
+        for i in range(0, len(body), chunk)
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "headers": [(b"content-type", content_type)]}
+    asyncio.run(app(scope, receive, send))
+    headers = dict(sent[0]["headers"])
+    return headers, b"".join(message.get("body", b"") for message in sent[1:])
+
+
+def test_asgi_converts_both_directions():
+    headers, body = call_asgi(ASGIMiddleware(asgi_echo), REQUEST)
+    assert seen == [(CONVERTED, str(len(CONVERTED)).encode())]
+    assert body == REQUEST
+    assert headers[b"content-length"] == str(len(REQUEST)).encode()
+
+
+def test_wsgi_keeps_every_byte_but_keys():
+    _, body = call_wsgi(
+        WSGIMiddleware(wsgi_echo), b'{ "a_b" : [1.5, "\\u00e9", null] }'
+    )
+    assert seen == [b'{ "a_b" : [1.5, "\\u00e9", null] }']
+    assert body == b'{ "aB" : [1.5, "\\u00e9", null] }'
+
+
+def test_numbers_keep_their_text():
+    body = b'{"big_float": 1.2345678901234567890123, "huge": 1e400, "n": 1%s}' % (
+        b"0" * 400
+    )
+    _, echoed = call_wsgi(WSGIMiddleware(wsgi_echo), body)
+    assert echoed == body.replace(b"big_float", b"bigFloat")
+
+
+@pytest.mark.parametrize("constant", [b"NaN", b"Infinity", b"-Infinity"])
+def test_non_json_constants_pass_through(constant):
+    body = b'{"user_id": %s}' % constant
+    _, echoed = call_wsgi(WSGIMiddleware(wsgi_echo), body)
+    assert echoed == body
+
+
+def test_asgi_custom_cases():
+    app = ASGIMiddleware(asgi_echo, client=SnakeCase, server=CamelCase)
+    _, body = call_asgi(app, CONVERTED)
+    assert seen[0][0] == REQUEST
+    assert body == CONVERTED
+
+
+@pytest.mark.parametrize(
+    "content_type, body",
+    [
+        (b"text/plain", REQUEST),
+        (b"application/json", b'{"userId": [1, '),
+        (b"application/json", REQUEST + b" " * 100),
+    ],
+)
+def test_asgi_passes_through_untouched(content_type, body):
+    app = ASGIMiddleware(asgi_echo, max_body_size=len(REQUEST) + 10)
+    headers, echoed = call_asgi(app, body, content_type)
+    assert seen == [(body, None)]
+    assert echoed == body
+    assert b"content-length" not in headers
+
+
+def test_asgi_other_scopes_untouched():
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(scope["type"])
+
+    asyncio.run(ASGIMiddleware(app)({"type": "lifespan"}, None, None))
+    assert calls == ["lifespan"]
+
+
+def test_errors_raise_propagates_invalid_keys():
+    body = b'{"userId": 1, "NotCamel": 2}'
+    with pytest.raises(ValueError, match="NotCamel"):
+        call_wsgi(WSGIMiddleware(wsgi_echo, errors="raise"), body)
+    with pytest.raises(ValueError, match="NotCamel"):
+        call_asgi(ASGIMiddleware(asgi_echo, errors="raise"), body)
+    # malformed JSON still passes through
+    _, echoed = call_wsgi(WSGIMiddleware(wsgi_echo, errors="raise"), b'{"userId": ')
+    assert echoed == b'{"userId": '
+
+
+def test_follows_max_length_and_vocabulary():
+    app = WSGIMiddleware(wsgi_echo)
+    call_wsgi(app, b'{"parseOAuthToken": 1, "recentOrders": 2}')
+    assert seen == [b'{"parse_o_auth_token": 1, "recent_orders": 2}']
+
+    set_max_length(12)
+    add_acronyms(["OAuth"])
+    try:
+        call_wsgi(app, b'{"parseOAuthToken": 1, "recentOrders": 2}')
+        # the long key is kept as invalid, the short one converted
+        assert seen == [b'{"parseOAuthToken": 1, "recent_orders": 2}']
+        set_max_length(None)
+        call_wsgi(app, b'{"parseOAuthToken": 1}')
+        assert seen == [b'{"parse_oauth_token": 1}']
+    finally:
+        set_max_length(None)
+        remove_acronyms(["OAuth"])
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        WSGIMiddleware(wsgi_echo, errors="ignore")
+    with pytest.raises(ValueError):
+        ASGIMiddleware(asgi_echo, max_body_size=-1)
@@ -0,0 +1,90 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from magic_case import (
+    CamelCase,
+    KebabCase,
+    SnakeCase,
+    add_acronyms,
+    convert_many,
+    convert_parallel,
+    convert_threaded,
+    remove_acronyms,
+    set_max_length,
+)
+from magic_case.parallel import _init_worker, _worker_state
+
+ITEMS = [f"field_name_{i}" for i in range(2_500)]
+
+
+def test_convert_parallel_matches_convert_many():
+    result = convert_parallel(ITEMS, SnakeCase, CamelCase, workers=2, chunksize=300)
+    assert result == convert_many(ITEMS, SnakeCase, CamelCase)
+
+
+def test_convert_parallel_lazy_with_executor():
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        result = convert_parallel(
+            iter(ITEMS), SnakeCase, KebabCase, executor=pool, chunksize=7, lazy=True
+        )
+        assert list(result) == [item.replace("_", "-") for item in ITEMS]
+
+
+def test_spawned_workers_get_runtime_settings():
+    add_acronyms(["OAuth"])
+    set_max_length(20)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=_worker_state(),
+        ) as pool:
+            result = convert_parallel(
+                ["parseOAuthToken"], CamelCase, SnakeCase, executor=pool
+            )
+            assert result == ["parse_oauth_token"]
+            with pytest.raises(ValueError, match="exceeds the limit of 20"):
+                convert_parallel(["a" * 21], CamelCase, SnakeCase, executor=pool)
+    finally:
+        remove_acronyms(["OAuth"])
+        set_max_length(None)
+
+
+def test_convert_parallel_errors_propagate():
+    with pytest.raises(ValueError):
+        convert_parallel(["fine", "NotCamel"], CamelCase, SnakeCase, workers=1)
+
+
+def test_convert_parallel_rejects_bad_chunksize():
+    with pytest.raises(ValueError):
+        convert_parallel(ITEMS, SnakeCase, CamelCase, chunksize=0)
+
+
+def test_convert_parallel_empty():
+    assert convert_parallel([], SnakeCase, CamelCase, workers=1) == []
+
+
+def test_convert_threaded_matches_convert_many():
+    result = convert_threaded(ITEMS, SnakeCase, CamelCase, workers=3, chunksize=100)
+    assert result == convert_many(ITEMS, SnakeCase, CamelCase)
+
+
+def test_convert_threaded_lazy_with_executor():
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        result = convert_threaded(
+            iter(ITEMS), SnakeCase, KebabCase, executor=pool, chunksize=7, lazy=True
+        )
+        assert list(result) == [item.replace("_", "-") for item in ITEMS]
+
+
+def test_convert_threaded_defaults_and_errors():
+    assert convert_threaded(ITEMS, SnakeCase, KebabCase)[:1] == ["field-name-0"]
+    with pytest.raises(ValueError):
+        convert_threaded(["fine", "NotCamel"], CamelCase, SnakeCase, workers=2)
+    with pytest.raises(ValueError):
+        convert_threaded(ITEMS, SnakeCase, CamelCase, workers=0)
+    with pytest.raises(ValueError):
+        convert_threaded(ITEMS, SnakeCase, CamelCase, chunksize=0)
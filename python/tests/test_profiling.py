@@ -0,0 +1,115 @@
+import logging
+
+import pytest
+
+from magic_case import (
+    AnyCase,
+    CamelCase,
+    HungarianCase,
+    KebabCase,
+    SnakeCase,
+    cache_info,
+    compile,
+    convert_many,
+    disable_cache,
+    disable_profiling,
+    enable_cache,
+    enable_profiling,
+    profile,
+)
+from magic_case.profiling import (
+    LENGTH_BUCKETS,
+    LoggingSink,
+    MemorySink,
+    PrometheusSink,
+    format_prometheus,
+    profiling_snapshot,
+)
+
+
+def test_profile_counts_phases():
+    with profile() as result:
+        convert_many(["fooBar", "userAccountId"], CamelCase, SnakeCase)
+        convert_many(["foo_bar"] * 3, SnakeCase, KebabCase)
+        SnakeCase(CamelCase("fooBar")).get()
+        str(HungarianCase("strUserName"))
+        str(AnyCase("foo_bar"))
+    stats = result.last
+    assert stats["CamelCase", "split"].calls == 3
+    # two conversions, SnakeCase(...).get() and AnyCase rendering as snake_case
+    assert stats["SnakeCase", "join"].calls == 4
+    assert stats["CamelCase", "init"].calls == 1
+    assert stats["SnakeCase", "render"].calls == 1
+    assert stats["SnakeCase->KebabCase", "fast"].calls == 3
+    # HungarianCase.__init__ extends BaseCase.__init__: recorded once
+    assert stats["HungarianCase", "init"].calls == 1
+    assert stats["AnyCase", "init"].calls == 1
+    split = stats["CamelCase", "split"]
+    assert split.length_sum == 6 + 13 + 6
+    assert sum(split.lengths) == 3 and len(split.lengths) == len(LENGTH_BUCKETS) + 1
+    assert split.lengths[3] == 2 and split.lengths[4] == 1
+    assert all(entry.seconds >= 0 for entry in stats.values())
+
+
+def test_disabled_profiling_restores_originals():
+    split = vars(SnakeCase)["_split_into_words"]
+    init = vars(HungarianCase)["__init__"]
+    convert = compile(CamelCase, SnakeCase)
+    with profile() as result:
+        assert vars(SnakeCase)["_split_into_words"] is not split
+        # converters compiled earlier keep their functions
+        convert("fooBar")
+    assert ("CamelCase", "split") not in result.last
+    assert vars(SnakeCase)["_split_into_words"] is split
+    assert vars(HungarianCase)["__init__"] is init
+    assert profiling_snapshot() == {}
+    assert disable_profiling() == {}
+    assert convert_many(["fooBar"], CamelCase, SnakeCase) == ["foo_bar"]
+
+
+def test_profiling_keeps_the_cache():
+    enable_cache()
+    try:
+        CamelCase("fooBar")
+        with profile() as result:
+            CamelCase("fooBar")
+        # the timed split is a separate cache key, so the call is recorded
+        assert result.last["CamelCase", "split"].calls == 1
+        hits = cache_info().hits
+        CamelCase("fooBar")
+        assert cache_info().hits == hits + 1
+    finally:
+        disable_cache()
+
+
+def test_enable_twice_and_errors_still_recorded():
+    sink = MemorySink()
+    enable_profiling(sink)
+    try:
+        with pytest.raises(RuntimeError):
+            enable_profiling()
+        with pytest.raises(ValueError):
+            CamelCase("NotCamel")
+        assert profiling_snapshot()["CamelCase", "split"].calls == 1
+    finally:
+        snapshot = disable_profiling()
+    assert sink.last == snapshot
+
+
+def test_sinks(caplog):
+    written = []
+    with caplog.at_level(logging.INFO, logger="magic_case.profiling"):
+        with profile(LoggingSink()):
+            SnakeCase(CamelCase("fooBar")).get()
+        with profile(PrometheusSink(written.append)):
+            CamelCase("fooBar")
+    assert "CamelCase split: 1 calls" in caplog.text
+
+    [text] = written
+    assert 'magic_case_calls_total{case="CamelCase",phase="split"} 1' in text
+    assert (
+        'magic_case_input_length_bucket{case="CamelCase",phase="split",le="7"} 1'
+        in text
+    )
+    assert 'le="3"} 0' in text and 'le="+Inf"} 1' in text
+    assert format_prometheus({}).startswith("# HELP magic_case_calls_total")
@@ -0,0 +1,209 @@
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from magic_case import CamelCase, KebabCase, SnakeCase, rename_tree
+from magic_case.cli import main
+from magic_case.rename import _rename, iter_sources, rename_file
+
+PYTHON = '''\
+def get_user_name(user_id, _private_field=None):
+    # user_name in a comment stays
+    label = "user_name"
+    doc = """first_name
+    last_name"""
+    return user_id.first_name + __init__ + HTTP_STATUS + café_bar
+'''
+
+TYPESCRIPT = """\
+const user_id = obj.first_name; // first_name
+const s = 'user_name' + `last_name`; /* block_name */
+let $user_name = user_name$;
+"""
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "models.py").write_text(PYTHON)
+    (tmp_path / "web").mkdir()
+    (tmp_path / "web" / "client.ts").write_text(TYPESCRIPT)
+    (tmp_path / "web" / "plain.ts").write_text("const total = 1;\n")
+    (tmp_path / "web" / "empty.js").write_text("")
+    (tmp_path / "notes.txt").write_text("user_name\n")
+    for skipped in ("node_modules", ".venv"):
+        (tmp_path / skipped).mkdir()
+        (tmp_path / skipped / "dep.js").write_text("var user_name;\n")
+    return tmp_path
+
+
+def test_rename_tree(tree):
+    report = rename_tree(str(tree), SnakeCase, CamelCase, workers=1)
+    assert sorted(report.changed) == [
+        str(tree / "pkg" / "models.py"),
+        str(tree / "web" / "client.ts"),
+    ]
+    assert len(report.files) == 4
+    assert report.renamed == 5
+    # first_name is an attribute nothing in the tree assigns
+    assert (tree / "pkg" / "models.py").read_text() == PYTHON.replace(
+        "get_user_name(user_id, _private_field", "getUserName(userId, _privateField"
+    ).replace("user_id.first_name", "userId.first_name")
+    assert (tree / "web" / "client.ts").read_text() == TYPESCRIPT.replace(
+        "user_id = obj.first_name", "userId = obj.first_name"
+    )
+    assert (tree / "node_modules" / "dep.js").read_text() == "var user_name;\n"
+    assert "5 identifiers renamed" in report.format()
+
+
+def test_unchanged_files_are_not_written(tree):
+    plain = tree / "web" / "plain.ts"
+    before = plain.stat().st_mtime_ns
+    rename_tree(str(tree), SnakeCase, CamelCase, workers=1)
+    assert plain.stat().st_mtime_ns == before
+
+
+def test_strings_and_dry_run(tree):
+    path = str(tree / "web" / "client.ts")
+    result = rename_file(path, SnakeCase, CamelCase, strings=True, write=False)
+    # user_id in code, user_name and last_name in strings
+    assert result.renamed == 3
+    assert (tree / "web" / "client.ts").read_text() == TYPESCRIPT
+
+
+def test_executor_and_suffixes(tree):
+    with ThreadPoolExecutor(2) as pool:
+        report = rename_tree(
+            str(tree), SnakeCase, CamelCase, suffixes=[".ts"], executor=pool
+        )
+    assert report.changed == [str(tree / "web" / "client.ts")]
+    assert list(iter_sources(str(tree), [".py"])) == [str(tree / "pkg" / "models.py")]
+
+
+def test_interpolated_code_is_renamed(tmp_path):
+    python = tmp_path / "fmt.py"
+    python.write_text(
+        'user_id = pad_width = 1; print(f"{user_id} user_id {{user_id}} '
+        '{user_id:>{pad_width}}")\n'
+        'msg = rf\'{d["key_name"]}\' + f"""\n{user_id!r}""" + \'user_id\'\n'
+    )
+    typescript = tmp_path / "fmt.ts"
+    typescript.write_text(
+        "const user_id = 1; console.log(`${user_id} user_id ${`${last_name}`}`);\n"
+        "const s = `\\${not_code}` + 'user_id'; let last_name;\n"
+    )
+    rename_tree(str(tmp_path), SnakeCase, CamelCase, workers=1)
+    assert python.read_text() == (
+        'userId = padWidth = 1; print(f"{userId} user_id {{user_id}} '
+        '{userId:>{padWidth}}")\n'
+        'msg = rf\'{d["key_name"]}\' + f"""\n{userId!r}""" + \'user_id\'\n'
+    )
+    assert typescript.read_text() == (
+        "const userId = 1; console.log(`${userId} user_id ${`${lastName}`}`);\n"
+        "const s = `\\${not_code}` + 'user_id'; let lastName;\n"
+    )
+
+
+APP = """\
+import json
+import sys
+from functools import lru_cache
+
+from helpers import format_user
+
+
+class UserRecord:
+    def __init__(self, user_id, display_name):
+        self.user_id = user_id
+        self.display_name = display_name
+
+
+@lru_cache(maxsize=None)
+def load_user(user_id):
+    return UserRecord(user_id, display_name=f"user {user_id}")
+
+
+record = load_user(7)
+print(json.dumps(format_user(record), sort_keys=True), sys.float_info.max_exp)
+"""
+
+HELPERS = """\
+def format_user(user_record, *, upper_case=False):
+    return {"user_id": user_record.user_id, "display_name": user_record.display_name}
+"""
+
+
+def test_renamed_python_still_runs(tmp_path):
+    (tmp_path / "app.py").write_text(APP)
+    (tmp_path / "helpers.py").write_text(HELPERS)
+
+    def run_app():
+        done = subprocess.run(
+            [sys.executable, "app.py"], cwd=tmp_path, capture_output=True, text=True
+        )
+        assert done.returncode == 0, done.stderr
+        return done.stdout
+
+    before = run_app()
+    rename_tree(str(tmp_path), SnakeCase, CamelCase, workers=1)
+    assert run_app() == before
+    app = (tmp_path / "app.py").read_text()
+    assert "from functools import lru_cache" in app
+    assert "sort_keys=True" in app and "sys.float_info.max_exp" in app
+    assert "from helpers import formatUser" in app
+    assert "self.userId = userId" in app and "displayName=" in app
+    # the dict keys are strings, left alone without strings=True
+    assert '{"user_id": userRecord.userId' in (tmp_path / "helpers.py").read_text()
+
+
+def test_exclude_and_javascript_bindings(tmp_path):
+    source = tmp_path / "api.ts"
+    source.write_text(
+        'import { read_file } from "fs-extra";\n'
+        "export function fetch_user(user_id: number, { page_size = 10 }) {\n"
+        "  const { total_count } = read_file(user_id);\n"
+        "  return { user_id, page_size, total_count, extra_field: res.status_code };\n"
+        "}\n"
+    )
+    rename_tree(str(tmp_path), SnakeCase, CamelCase, workers=1, exclude=["page_size"])
+    assert source.read_text() == (
+        'import { read_file } from "fs-extra";\n'
+        "export function fetchUser(userId: number, { page_size = 10 }) {\n"
+        "  const { totalCount } = read_file(userId);\n"
+        "  return { userId, page_size, totalCount, extraField: res.status_code };\n"
+        "}\n"
+    )
+
+
+def test_only_exact_source_names():
+    assert _rename(b"fooBar", CamelCase, SnakeCase) == b"foo_bar"
+    assert _rename(b"fooBAR", CamelCase, SnakeCase) is None
+    assert _rename(b"foo", CamelCase, SnakeCase) is None
+    assert _rename(b"_fooBar_", CamelCase, SnakeCase) == b"_foo_bar_"
+
+
+def test_invalid_arguments(tree):
+    with pytest.raises(ValueError, match="does not produce identifiers"):
+        rename_tree(str(tree), SnakeCase, KebabCase)
+    with pytest.raises(ValueError, match="unsupported"):
+        rename_tree(str(tree), SnakeCase, CamelCase, suffixes=[".txt"])
+    with pytest.raises(FileNotFoundError):
+        rename_tree(str(tree / "missing"), SnakeCase, CamelCase)
+
+
+def test_cli_rename(tree, capsys):
+    argv = ["rename", str(tree), "--from", "snake", "--to", "camel", "--workers", "1"]
+    assert main([*argv, "--dry-run", "--ext", ".py"]) == 0
+    out, err = capsys.readouterr()
+    assert out == f"{tree / 'pkg' / 'models.py'}\n"
+    assert "1 changed" in err
+    assert "def get_user_name" in (tree / "pkg" / "models.py").read_text()
+
+    assert main([*argv, "--exclude", "user_id"]) == 0
+    models = (tree / "pkg" / "models.py").read_text()
+    assert "def getUserName(user_id, _privateField" in models
+
+    assert main(["rename", str(tree), "--from", "snake", "--to", "kebab"]) == 1
+    assert "KebabCase" in capsys.readouterr().err
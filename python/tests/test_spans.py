@@ -0,0 +1,89 @@
+from array import array
+
+import pytest
+
+from magic_case import (
+    AnyCase,
+    CamelCase,
+    HungarianCase,
+    SnakeCase,
+    convert_spans,
+    render_spans,
+    word_spans,
+)
+from magic_case.spans import _RENDERERS, _SCANNERS
+
+SAMPLES = [
+    "",
+    "x",
+    "user_id",
+    "__double__under",
+    "userID",
+    "HTTPServerError",
+    "parseHTTPResponse2Json",
+    "strUserName",
+    "a1B2C",
+    "Content-Type",
+    "X-Request-Id",
+    "foo/bar/baz",
+    "Foo/Bar",
+    "Foo//Bar",
+    "some words  here",
+    " padded\tspace ",
+    "mixed.sep-a_b c/d\\e,f",
+    "camel_Snake_Case",
+    "Pascal_Snake",
+    "MACRO_CASE",
+    "straße_größe",
+    "İstanbul_ΑΣ.Β",
+]
+
+
+def expected(text, source, target):
+    try:
+        return target(source(text)).get()
+    except ValueError:
+        return ValueError
+
+
+@pytest.mark.parametrize("source", list(_SCANNERS), ids=lambda cls: cls.__name__)
+def test_matches_case_objects(source):
+    for text in SAMPLES:
+        try:
+            source(text)
+        except ValueError:
+            with pytest.raises(ValueError):
+                word_spans(text, source)
+            continue
+        spans = word_spans(text, source)
+        for target in _RENDERERS:
+            try:
+                result = render_spans(text, spans, source, target)
+            except ValueError:
+                result = ValueError
+            assert result == expected(text, source, target), (text, target)
+
+
+def test_spans_are_offsets_into_the_original_text():
+    spans = word_spans("parseHTTPResponse", CamelCase)
+    assert isinstance(spans, array)
+    assert spans.tolist() == [0, 5, 5, 9, 9, 17]
+    assert word_spans("strUserName", HungarianCase).tolist() == [3, 7, 7, 11]
+
+
+def test_out_array_is_reused():
+    out = array("Q", [1, 2, 3])
+    assert word_spans("a_b", SnakeCase, out) is out
+    assert out.tolist() == [0, 1, 2, 3]
+
+
+def test_convert_spans():
+    items = ["user_id", "created_at", "x"]
+    assert convert_spans(items, SnakeCase, CamelCase) == ["userId", "createdAt", "x"]
+    with pytest.raises(ValueError):
+        convert_spans(["NotCamel"], CamelCase, SnakeCase)
+
+
+def test_unsupported_source():
+    with pytest.raises(TypeError):
+        word_spans("user_id", AnyCase)
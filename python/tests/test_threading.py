@@ -0,0 +1,124 @@
+"""Conversions hammered from many threads must match serial results."""
+
+import random
+import sys
+import threading
+
+import pytest
+
+from magic_case import (
+    BaseCase,
+    CamelCase,
+    SnakeCase,
+    add_acronyms,
+    convert_many,
+    convert_threaded,
+    disable_cache,
+    disable_interning,
+    enable_cache,
+    enable_interning,
+    remove_acronyms,
+)
+from magic_case.cli import CASES
+
+WORDS = [["user", "id"], ["http", "server", "error"], ["page", "2", "title"], ["x"]]
+EXTRA = ["strUserName", "iCount", "straße_größe", "XMLHttpRequest", ""]
+
+
+def _inputs(cls):
+    texts = [cls(SnakeCase("_".join(words))).get() for words in WORDS]
+    return texts + EXTRA
+
+
+def _convert_all(pairs):
+    results = {}
+    for source, target in pairs:
+        for text in _inputs(source):
+            try:
+                results[source, target, text] = target(source(text)).get()
+            except ValueError:
+                results[source, target, text] = ValueError
+            try:
+                many = convert_many([text, text], source, target)
+            except ValueError:
+                many = [ValueError, ValueError]
+            assert many == [results[source, target, text]] * 2, (source, target, text)
+    return results
+
+
+@pytest.fixture
+def busy_switching():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_all_classes_from_many_threads(busy_switching):
+    assert len(CASES) == 17
+    pairs = [(source, target) for source in CASES.values() for target in CASES.values()]
+    expected = _convert_all(pairs)
+
+    enable_cache(maxsize=64)
+    enable_interning(maxsize=64)
+    stop = threading.Event()
+    errors = []
+
+    def churn_vocabulary():
+        # acronyms that never occur in the inputs: results must not change
+        while not stop.is_set():
+            add_acronyms(["Qzx", "qvv"])
+            remove_acronyms(["Qzx", "qvv"])
+
+    def hammer(seed):
+        order = pairs[:]
+        random.Random(seed).shuffle(order)
+        try:
+            assert _convert_all(order) == expected
+        except BaseException as error:  # reported from the main thread
+            errors.append(error)
+
+    churner = threading.Thread(target=churn_vocabulary)
+    workers = [threading.Thread(target=hammer, args=(seed,)) for seed in range(8)]
+    churner.start()
+    try:
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    finally:
+        stop.set()
+        churner.join()
+        disable_interning()
+        disable_cache()
+    assert not errors, errors[0]
+
+
+def test_shared_instance_renders_once_per_value(busy_switching):
+    instances = [CamelCase(SnakeCase(f"user_name_{i}")) for i in range(200)]
+    results = []
+
+    def render():
+        results.append([instance.get() for instance in instances])
+
+    threads = [threading.Thread(target=render) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [[f"userName{i}" for i in range(200)]] * 8
+
+
+def test_convert_threaded_custom_class():
+    class ShoutCase(BaseCase):
+        @staticmethod
+        def _split_into_words(text):
+            return text.lower().split("!")
+
+        @staticmethod
+        def _join_words(words):
+            return "!".join(word.upper() for word in words)
+
+    items = [f"user_id_{i}" for i in range(1000)]
+    result = convert_threaded(items, SnakeCase, ShoutCase, workers=4, chunksize=64)
+    assert result == [f"USER!ID!{i}" for i in range(1000)]
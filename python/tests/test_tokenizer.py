@@ -0,0 +1,71 @@
+import pytest
+
+from magic_case import (
+    CamelCase,
+    CamelSnakeCase,
+    HttpHeaderCase,
+    HungarianCase,
+    KebabCase,
+    PascalCase,
+    PathCase,
+    SnakeCase,
+    add_acronyms,
+    remove_acronyms,
+)
+from magic_case.tokenizer import ascii_shape
+
+
+def test_ascii_shape():
+    assert ascii_shape("ascii_Only-1") == "ascii_Only-1"
+    assert ascii_shape("ÉcoleΣσ١ǅ €") == "AcoleAa0A #"
+    # combining marks copy the character they follow
+    assert ascii_shape("Écólé̂") == "Acooleee"
+    assert ascii_shape("́x") == "#x"
+    assert len(ascii_shape("a\U0001f600B")) == 3
+
+
+@pytest.mark.parametrize(
+    "cls, text, words",
+    [
+        (CamelCase, "straßeGröße", ["straße", "Größe"]),
+        (CamelCase, "привітСвіт", ["привіт", "Світ"]),
+        (CamelCase, "caféBar", ["café", "Bar"]),
+        (PascalCase, "ÉcoleNormaleSUPÉRIEURE", ["École", "Normale", "SUPÉRIEURE"]),
+        (PascalCase, "ΑΒΓΔέλτα", ["ΑΒΓ", "Δέλτα"]),
+        (PascalCase, "ǅunglaǅungla", ["ǅungla", "ǅungla"]),
+        (CamelSnakeCase, "naïve_Ωmega", ["naïve", "ωmega"]),
+        (HungarianCase, "strNaïveΣίσυφος", ["naïve", "σίσυφος"]),
+        (HttpHeaderCase, "Straße-Größe", ["Straße", "Größe"]),
+        (PathCase, "straße/größe/١٢", ["straße", "größe", "١٢"]),
+    ],
+)
+def test_unicode_words(cls, text, words):
+    assert list(cls(text).words) == words
+
+
+def test_unicode_validation():
+    for text in ["Straße-größe", "Straße--Größe", "Straße-€"]:
+        with pytest.raises(ValueError):
+            HttpHeaderCase(text)
+    for text in ["Straße/größe", "straße//größe", "€/a"]:
+        with pytest.raises(ValueError):
+            PathCase(text)
+
+
+def test_unicode_conversion():
+    assert SnakeCase(CamelCase("größeÄnderung")).get() == "größe_änderung"
+    assert KebabCase(PascalCase("ΜεγάλοΌνομα")).get() == "μεγάλο-όνομα"
+    assert CamelCase(SnakeCase("größe_änderung")).get() == "größeÄnderung"
+
+
+def test_unicode_with_acronyms():
+    add_acronyms(["ÜML"])
+    try:
+        assert CamelCase("parseÜMLDiagramÄnderung").words == [
+            "parse",
+            "ÜML",
+            "Diagram",
+            "Änderung",
+        ]
+    finally:
+        remove_acronyms(["ÜML"])
@@ -0,0 +1,141 @@
+import pytest
+
+from magic_case import (
+    CamelCase,
+    CamelSnakeCase,
+    HungarianCase,
+    PascalCase,
+    SnakeCase,
+    add_acronyms,
+    add_prefixes,
+    cache_clear,
+    convert_keys,
+    convert_many,
+    disable_cache,
+    enable_cache,
+    remove_acronyms,
+    remove_prefixes,
+)
+from magic_case.cache import LRUCache
+from magic_case.vocab import ACRONYMS, PREFIXES, Trie
+
+DOMAIN = ["OAuth", "IPv6", "gRPC", "iOS", "HTTP", "ID"]
+
+
+@pytest.fixture
+def acronyms():
+    add_acronyms(DOMAIN)
+    yield
+    remove_acronyms(DOMAIN)
+
+
+def test_trie_operations():
+    trie = Trie(["ab", "abc", "b"])
+    trie.add("ab")
+    assert len(trie) == 3
+    assert "abc" in trie and "a" not in trie and "" not in trie
+    assert sorted(trie) == ["ab", "abc", "b"]
+    assert trie.longest_match("abcd") == 3
+    assert trie.longest_match("xabd", 1) == 2
+    assert trie.longest_match("c") == 0
+
+    trie.discard("abc")
+    trie.discard("missing")
+    assert sorted(trie) == ["ab", "b"]
+    assert trie.root["a"]["b"] == {"": {}}
+    trie.discard("ab")
+    trie.discard("b")
+    assert len(trie) == 0 and trie.root == {}
+
+    with pytest.raises(ValueError):
+        trie.add("")
+
+
+def test_acronyms_are_kept_whole(acronyms):
+    assert CamelCase("parseOAuthToken").words == ["parse", "OAuth", "Token"]
+    assert CamelCase("getIPv6Address").words == ["get", "IPv6", "Address"]
+    assert CamelCase("gRPCService").words == ["gRPC", "Service"]
+    assert CamelCase("iOSVersion").words == ["iOS", "Version"]
+    assert PascalCase("HTTPServerID").words == ["HTTP", "Server", "ID"]
+    assert CamelSnakeCase("parse_OAuthToken").words == ["parse", "oauth", "token"]
+    assert HungarianCase("strOAuthToken").words == ["oauth", "token"]
+    assert SnakeCase(CamelCase("getIPv6Address")).get() == "get_ipv6_address"
+
+
+def test_acronyms_only_match_whole_humps(acronyms):
+    # "OAuth" is a prefix of the hump "OAuthorization", "HTTP" of "HTTPS"
+    assert PascalCase("OAuthorization").words == ["O", "Authorization"]
+    assert PascalCase("HTTPSConnection").words == ["HTTPS", "Connection"]
+    # "iOS" would start in the middle of a lowercase word
+    assert CamelCase("useriOSApp").words == ["useri", "OS", "App"]
+
+
+def test_default_vocabulary_keeps_regular_rules():
+    assert not ACRONYMS.root
+    assert CamelCase("parseOAuthToken").words == ["parse", "O", "Auth", "Token"]
+
+
+def test_prefixes():
+    assert HungarianCase("objUserName").prefix is None
+    add_prefixes(["obj"])
+    try:
+        assert HungarianCase("objUserName").prefix == "obj"
+        assert HungarianCase("objUserName").words == ["user", "name"]
+    finally:
+        remove_prefixes(["obj"])
+    assert "obj" not in PREFIXES
+    assert HungarianCase("strName").prefix == "str"
+
+
+def test_changes_invalidate_caches():
+    enable_cache()
+    try:
+        payload = {"parseOAuthToken": 1}
+        assert convert_many(["parseOAuthToken"], CamelCase, SnakeCase) == [
+            "parse_o_auth_token"
+        ]
+        assert convert_keys(payload, CamelCase, SnakeCase) == {"parse_o_auth_token": 1}
+        add_acronyms(["OAuth"])
+        try:
+            assert convert_many(["parseOAuthToken"], CamelCase, SnakeCase) == [
+                "parse_oauth_token"
+            ]
+            assert convert_keys(payload, CamelCase, SnakeCase) == {
+                "parse_oauth_token": 1
+            }
+        finally:
+            remove_acronyms(["OAuth"])
+    finally:
+        cache_clear()
+        disable_cache()
+
+
+def test_split_racing_a_change_is_not_reused():
+    lru = LRUCache(maxsize=8)
+    calls = []
+
+    def split(text):
+        words = CamelCase._split_into_words(text)
+        calls.append(text)
+        if len(calls) == 1:
+            add_acronyms(["OAuth"])  # lands before the first split is stored
+        return words
+
+    try:
+        assert lru.split(split, "parseOAuthToken") == ["parse", "O", "Auth", "Token"]
+        assert lru.split(split, "parseOAuthToken") == ["parse", "OAuth", "Token"]
+        assert lru.split(split, "parseOAuthToken") == ["parse", "OAuth", "Token"]
+        assert len(calls) == 2
+    finally:
+        remove_acronyms(["OAuth"])
+
+
+def test_large_vocabulary():
+    words = [f"Xy{i}Z" for i in range(10_000)]
+    add_acronyms(words)
+    try:
+        assert len(ACRONYMS) == 10_000
+        assert CamelCase("getXy9999ZValue").words == ["get", "Xy9999Z", "Value"]
+    finally:
+        remove_acronyms(words)
+    assert not ACRONYMS.root